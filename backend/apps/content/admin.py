@@ -1,13 +1,23 @@
 ﻿from django.contrib import admin
+from django.utils import timezone
 from django.utils.html import format_html
 from . import models
 
 
+def rendition_status(obj, field_name):
+    """Whether the background worker has produced renditions for the current upload yet."""
+    field_file = getattr(obj, field_name, None)
+    if not obj.pk or not field_file:
+        return "-"
+    renditions = getattr(obj, f"{field_name}_renditions") or {}
+    return "Ready" if renditions.get("source") == field_file.name else "Processing"
+
+
 class NewsImageInline(admin.TabularInline):
     model = models.NewsImage
     extra = 1
-    fields = ("image", "caption", "caption_si", "position", "preview")
-    readonly_fields = ("preview",)
+    fields = ("image", "caption", "caption_si", "position", "preview", "renditions")
+    readonly_fields = ("preview", "renditions")
 
     def preview(self, obj):
         try:
@@ -15,6 +25,9 @@ class NewsImageInline(admin.TabularInline):
         except Exception:
             return ""
 
+    def renditions(self, obj):
+        return rendition_status(obj, "image")
+
 
 @admin.register(models.News)
 class NewsAdmin(admin.ModelAdmin):
@@ -116,8 +129,8 @@ class VideoAdmin(admin.ModelAdmin):
 class GalleryImageInline(admin.TabularInline):
     model = models.GalleryImage
     extra = 3
-    fields = ("image", "caption", "caption_si", "position", "preview")
-    readonly_fields = ("preview",)
+    fields = ("image", "caption", "caption_si", "position", "preview", "renditions")
+    readonly_fields = ("preview", "renditions")
 
     def preview(self, obj):
         try:
@@ -125,6 +138,9 @@ class GalleryImageInline(admin.TabularInline):
         except Exception:
             return ""
 
+    def renditions(self, obj):
+        return rendition_status(obj, "image")
+
 
 @admin.register(models.Album)
 class AlbumAdmin(admin.ModelAdmin):
@@ -323,5 +339,23 @@ class SiteTextSnippetAdmin(admin.ModelAdmin):
     )
 
 
+@admin.register(models.Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ("kind", "status", "attempts", "max_attempts", "run_after", "finished_at", "key")
+    list_filter = ("status", "kind")
+    search_fields = ("key",)
+    readonly_fields = (
+        "kind", "key", "payload", "status", "attempts", "run_after", "locked_at", "locked_by",
+        "finished_at", "last_error", "created_at", "updated_at",
+    )
+    actions = ["retry_jobs"]
 
+    def has_add_permission(self, request):
+        return False
 
+    @admin.action(description="Retry selected jobs")
+    def retry_jobs(self, request, queryset):
+        count = queryset.exclude(status=models.Job.RUNNING).update(
+            status=models.Job.PENDING, attempts=0, run_after=timezone.now(), last_error="", finished_at=None,
+        )
+        self.message_user(request, f"{count} job(s) queued again.")
@@ -0,0 +1,141 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+
+GENERATION_PREFIX = "content:gen:"
+# Entries are ``(data, validators)``; change the prefix whenever that shape changes.
+RESPONSE_PREFIX = "content:resp2:"
+
+
+def get_cache():
+    return caches[getattr(settings, "CONTENT_CACHE_ALIAS", "default")]
+
+
+def cache_enabled():
+    return getattr(settings, "CONTENT_CACHE_ENABLED", True)
+
+
+def _generation_key(model):
+    return f"{GENERATION_PREFIX}{model._meta.label_lower}"
+
+
+def bump_generation(model):
+    """Invalidate every cached response that depends on ``model``.
+
+    Keys embed a per-model generation token, so replacing the token orphans the old
+    entries (they age out via the timeout) without needing pattern deletes.
+    """
+    get_cache().set(_generation_key(model), time.time_ns(), None)
+
+
+def generations(dependencies):
+    keys = [_generation_key(model) for model in dependencies]
+    found = get_cache().get_many(keys)
+    return [str(found.get(key, 0)) for key in keys]
+
+
+def normalized_query(request):
+    items = sorted(
+        (key, value)
+        for key, values in request.query_params.lists()
+        for value in values
+    )
+    return "&".join(f"{key}={value}" for key, value in items)
+
+
+def response_cache_key(namespace, request, dependencies):
+    # Host is part of the key because paginated payloads contain absolute next/previous URLs.
+    parts = [
+        request.get_host(),
+        request.path,
+        normalized_query(request),
+        *generations(dependencies),
+    ]
+    digest = hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+    return f"{RESPONSE_PREFIX}{namespace}:{digest}"
+
+
+def cached_section(namespace, request, dependencies, build, timeout=None):
+    """Return ``(data, digest)`` for one section of an aggregated payload.
+
+    The digest is a content hash of the section so callers can derive a composite ETag
+    without re-serializing cached sections. ``timeout`` may be a callable, evaluated only
+    when the section is (re)built.
+    """
+    cache = get_cache()
+    key = response_cache_key(namespace, request, dependencies) if cache_enabled() else None
+    if key is not None:
+        entry = cache.get(key)
+        if entry is not None:
+            return entry
+
+    data = build()
+    encoded = json.dumps(data, cls=JSONEncoder, sort_keys=True).encode("utf-8")
+    entry = (data, hashlib.sha256(encoded).hexdigest())
+    if key is not None:
+        if callable(timeout):
+            timeout = timeout()
+        cache.set(key, entry, timeout if timeout is not None else getattr(settings, "CONTENT_CACHE_TIMEOUT", 60 * 60))
+    return entry
+
+
+class CachedResponseMixin:
+    """Cache serialized list/retrieve payloads of a viewset.
+
+    ``cache_dependencies`` lists the models whose saves/deletes invalidate the cached
+    responses (defaults to the serializer's model); nested serializers should add their
+    child models so edits to e.g. gallery images are reflected immediately.
+    """
+
+    cache_dependencies = None
+
+    def get_cache_dependencies(self):
+        if self.cache_dependencies is not None:
+            return self.cache_dependencies
+        return (self.get_serializer_class().Meta.model,)
+
+    def get_cache_timeout(self):
+        return getattr(settings, "CONTENT_CACHE_TIMEOUT", 60 * 60)
+
+    def cache_key(self, request):
+        # Read once per request, before the payload or its validators are computed, so an
+        # edit landing in between orphans the entry instead of hiding behind it.
+        if getattr(self, "_cache_key", None) is None:
+            self._cache_key = response_cache_key(self.basename, request, self.get_cache_dependencies())
+        return self._cache_key
+
+    def cached_entry(self, request):
+        """``(data, validators)`` cached for ``request``, or None on a miss or with the cache off.
+
+        ``validators`` are what ``ConditionalGetMixin`` computed when the entry was built
+        (None for actions without them).
+        """
+        if not cache_enabled():
+            return None
+        return get_cache().get(self.cache_key(request))
+
+    def cached_response(self, request, build):
+        if not cache_enabled():
+            return build()
+
+        entry = self.cached_entry(request)
+        if entry is not None:
+            return Response(entry[0])
+
+        response = build()
+        if response.status_code == 200:
+            entry = (response.data, getattr(self, "response_validators", None))
+            get_cache().set(self.cache_key(request), entry, self.get_cache_timeout())
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(request, lambda: super(CachedResponseMixin, self).list(request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(request, lambda: super(CachedResponseMixin, self).retrieve(request, *args, **kwargs))
@@ -0,0 +1,48 @@
+from django.conf import settings
+from django.core import checks
+
+from rest_framework.settings import api_settings
+
+from . import cache, throttling
+
+LOCMEM = "django.core.cache.backends.locmem.LocMemCache"
+
+
+def check_shared_cache(app_configs, **kwargs):
+    """Cached responses are invalidated by signals in the process that saved the row."""
+    alias = getattr(settings, "CONTENT_CACHE_ALIAS", "default")
+    if not cache.cache_enabled():
+        return []
+    if settings.CACHES.get(alias, {}).get("BACKEND") != LOCMEM:
+        return []
+    return [checks.Warning(
+        f"The content response cache ({alias!r}) is process-local (LocMemCache).",
+        hint=(
+            "Each worker would keep serving its own cached responses after an edit saved by "
+            "another. Set DJANGO_CACHE_BACKEND=file or redis."
+        ),
+        id="content.W001",
+    )]
+
+
+def check_throttle_proxies(app_configs, **kwargs):
+    """Per-IP budgets behind a proxy that Django doesn't know about charge every client to it."""
+    if not throttling.throttle_enabled() or api_settings.NUM_PROXIES:
+        return []
+    scopes = [scope for scope in ("read", "write") if throttling.parse_rate(throttling.rate_for(scope))]
+    if not scopes:
+        return []
+    return [checks.Warning(
+        f"Per-IP throttling ({', '.join(scopes)}) reads the client IP from REMOTE_ADDR.",
+        hint=(
+            "Behind nginx or another reverse proxy all clients would share one budget. Set "
+            "THROTTLE_NUM_PROXIES, or silence content.W002 if clients connect directly."
+        ),
+        id="content.W002",
+    )]
+
+
+def register():
+    # Deployment settings: reported by ``manage.py check --deploy``.
+    checks.register(check_shared_cache, checks.Tags.caches, deploy=True)
+    checks.register(check_throttle_proxies, checks.Tags.security, deploy=True)
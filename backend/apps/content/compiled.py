@@ -0,0 +1,283 @@
+"""Compiled list serialization: ``.values()`` rows straight into response dicts.
+
+A ``ModelSerializer`` renders a list page by building a model instance per row, wrapping
+every file column in a ``FieldFile`` and walking its fields one ``get_attribute`` /
+``to_representation`` at a time. For flat serializers that work is the same for every row.
+``plan_for`` turns one serializer into a ``Plan``: the columns to read with ``.values()``
+plus a generated function that builds each output dict in one expression, e.g.::
+
+    def project(row):
+        return {
+            'id': row['id'],
+            'image': None if not (v1 := row['image']) else absolute(url1(v1)),
+            'published_at': None if (v2 := row['published_at']) is None else convert2(v2),
+            ...
+        }
+
+The output is byte-for-byte what the serializer renders, including ``?lang=``,
+``?fields=``/``?omit=`` and absolute media URLs (``manage.py bench_serializers`` checks
+that). A serializer is compiled only when every rendered field is a plain column or
+annotation of a known field type. Nested serializers, ``SerializerMethodField`` and
+properties fall back to DRF, so does everything when ``COMPILED_SERIALIZERS`` is off.
+Plans are cached per serializer class, rendered field set and language.
+"""
+import copy
+import threading
+from collections import OrderedDict, namedtuple
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.utils import timezone
+from rest_framework import ISO_8601
+from rest_framework import fields as drf_fields
+from rest_framework import relations
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from . import documents, images, metrics
+from . import serializers as s
+from .pagination import KeysetPagination
+
+
+PLAN_CACHE_SIZE = 256
+
+# Fields whose to_representation() returns a column value unchanged.
+RAW_FIELDS = (
+    drf_fields.BooleanField,
+    drf_fields.CharField,
+    drf_fields.EmailField,
+    drf_fields.IntegerField,
+    drf_fields.ReadOnlyField,
+    drf_fields.SlugField,
+    drf_fields.URLField,
+)
+
+# Fields rendered by (a request-independent copy of) their own to_representation().
+CONVERTED_FIELDS = (
+    drf_fields.ChoiceField,
+    drf_fields.DateField,
+    drf_fields.DateTimeField,
+    drf_fields.DecimalField,
+    drf_fields.DurationField,
+    drf_fields.FloatField,
+    drf_fields.TimeField,
+    drf_fields.UUIDField,
+)
+
+STRUCTURE_FIELDS = {
+    s.PlaceholderField: images.placeholder_structure,
+    s.DocumentInfoField: documents.info_structure,
+}
+
+
+def compiled_enabled():
+    return getattr(settings, "COMPILED_SERIALIZERS", True)
+
+
+class Plan(namedtuple("Plan", "columns bind")):
+    """``columns`` to read with ``.values()``; ``bind(absolute)`` returns the row projection."""
+
+    __slots__ = ()
+
+    def values(self, queryset, *extra):
+        # Nested relations are never compiled, so their prefetches would only cost queries.
+        return queryset.prefetch_related(None).values(*dict.fromkeys(self.columns + extra))
+
+    def render(self, rows, request=None):
+        project = self.bind(request.build_absolute_uri if request is not None else _unchanged)
+        return [project(row) for row in rows]
+
+
+def _unchanged(url):
+    return url
+
+
+def _current_zone():
+    return timezone.get_current_timezone() if settings.USE_TZ else None
+
+
+def _iso_datetime(value, zone, convert):
+    """``DateTimeField.to_representation`` for ISO 8601 output, with the zone looked up once per page."""
+    if zone is not None and timezone.is_aware(value):
+        value = value.astimezone(zone).isoformat()
+        return value[:-6] + "Z" if value.endswith("+00:00") else value
+    return convert(value)
+
+
+def _column(model, source, annotations):
+    """``.values()`` name of ``source``: a concrete column or an annotation, else None."""
+    if source in annotations:
+        return source
+    try:
+        field = model._meta.get_field(source)
+    except FieldDoesNotExist:
+        return None
+    if not field.concrete or field.many_to_many:
+        return None
+    return field.name
+
+
+def _expression(field, model, column, index, namespace):
+    """Python expression rendering ``row[column]`` as ``field`` would, or None if unsupported."""
+    kind = type(field)
+    value = f"row[{column!r}]"
+    var = f"v{index}"
+
+    if kind in STRUCTURE_FIELDS:
+        namespace[f"structure{index}"] = STRUCTURE_FIELDS[kind]
+        return f"None if ({var} := {value}) is None else structure{index}({var})"
+    if kind is s.RenditionsField:
+        return f"None if ({var} := {value}) is None else srcset({var}, build_url)"
+    if isinstance(field, drf_fields.FileField) and kind in (drf_fields.FileField, drf_fields.ImageField):
+        if not getattr(field, "use_url", api_settings.UPLOADED_FILES_USE_URL):
+            return f"None if not ({var} := {value}) else {var}"
+        namespace[f"url{index}"] = model._meta.get_field(column).storage.url
+        return f"None if not ({var} := {value}) else absolute(url{index}({var}))"
+    if kind in RAW_FIELDS or (kind is drf_fields.JSONField and not field.binary):
+        return value
+    if kind is relations.PrimaryKeyRelatedField and field.pk_field is None:
+        return value
+    if kind is drf_fields.BigIntegerField and not getattr(field, "coerce_to_string", api_settings.COERCE_BIGINT_TO_STRING):
+        return value
+    if kind is drf_fields.DateTimeField and not hasattr(field, "timezone"):
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        if isinstance(output_format, str) and output_format.lower() == ISO_8601:
+            namespace[f"convert{index}"] = copy.deepcopy(field).to_representation
+            return f"None if ({var} := {value}) is None else iso_datetime({var}, zone, convert{index})"
+    if kind in CONVERTED_FIELDS:
+        # An unbound copy, so the cached plan keeps no request or serializer alive.
+        namespace[f"convert{index}"] = copy.deepcopy(field).to_representation
+        return f"None if ({var} := {value}) is None else convert{index}({var})"
+    return None
+
+
+def _compile_field(field, model, annotations, index, namespace):
+    """``(column, expression)`` for one serializer field; the expression is None if unsupported."""
+    column = _column(model, field.source, annotations) if "." not in field.source else None
+    if column is None:
+        return None, None
+    return column, _expression(field, model, column, index, namespace)
+
+
+def uncompiled_fields(serializer, annotations=()):
+    """Names of the rendered fields that keep ``serializer`` on the DRF path."""
+    model = serializer.Meta.model
+    return [
+        field.field_name
+        for index, field in enumerate(serializer._readable_fields)
+        if _compile_field(field, model, annotations, index, {})[1] is None
+    ]
+
+
+def compile_plan(serializer, annotations=()):
+    """Compile ``serializer``'s current field set into a Plan, or None if it can't be."""
+    model = serializer.Meta.model
+    fields = list(serializer._readable_fields)
+    language = getattr(serializer, "requested_language", lambda: None)()
+    translated = set(serializer._translated_fields) if language == "si" else set()
+
+    namespace = {
+        "srcset": images.srcset_structure,
+        "rendition_url": images.rendition_url,
+        "iso_datetime": _iso_datetime,
+        "current_zone": _current_zone,
+    }
+    columns = []
+    expressions = {}
+    for index, field in enumerate(fields):
+        column, expression = _compile_field(field, model, annotations, index, namespace)
+        if expression is None:
+            return None
+        columns.append(column)
+        expressions[field.field_name] = expression
+
+    items = []
+    for field in fields:
+        name = field.field_name
+        if name.endswith("_si") and name[:-3] in translated:
+            continue
+        if name in translated:
+            # LanguageProjectionMixin: the Sinhala value when it isn't blank, else English.
+            items.append(f"        {name!r}: ({expressions[name + '_si']}) or ({expressions[name]}),")
+        else:
+            items.append(f"        {name!r}: {expressions[name]},")
+
+    source = "\n".join([
+        "def bind(absolute):",
+        "    zone = current_zone()",
+        "    def build_url(name):",
+        "        return absolute(rendition_url(name))",
+        "    def project(row):",
+        "        return {",
+        *items,
+        "        }",
+        "    return project",
+    ])
+    exec(compile(source, f"<compiled {type(serializer).__name__}>", "exec"), namespace)
+    return Plan(tuple(columns), namespace["bind"])
+
+
+class _PlanCache:
+    """Plans by (serializer class, rendered fields, language, annotations), least recently used out."""
+
+    def __init__(self, size):
+        self.size = size
+        self.lock = threading.Lock()
+        self.plans = OrderedDict()
+
+    def get(self, serializer, annotations):
+        language = getattr(serializer, "requested_language", lambda: None)()
+        key = (
+            type(serializer),
+            tuple(field.field_name for field in serializer._readable_fields),
+            language,
+            frozenset(annotations),
+        )
+        with self.lock:
+            if key in self.plans:
+                self.plans.move_to_end(key)
+                return self.plans[key]
+        plan = compile_plan(serializer, annotations)
+        with self.lock:
+            self.plans[key] = plan
+            while len(self.plans) > self.size:
+                self.plans.popitem(last=False)
+        return plan
+
+
+_plans = _PlanCache(PLAN_CACHE_SIZE)
+
+
+def plan_for(serializer, queryset):
+    """The (cached) Plan rendering ``queryset`` with ``serializer``, or None."""
+    return _plans.get(serializer, queryset.query.annotations)
+
+
+class CompiledListMixin:
+    """Render ``list`` pages from ``.values()`` rows through the serializer's compiled Plan.
+
+    Goes after ``CachedResponseMixin`` so cached pages skip it entirely. Serializers that
+    can't be compiled (and ``COMPILED_SERIALIZERS = False``) use the regular list path.
+    """
+
+    def compiled_plan(self, queryset):
+        if not compiled_enabled():
+            return None
+        return plan_for(self.get_serializer(), queryset)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        plan = self.compiled_plan(queryset)
+        if plan is None:
+            return super().list(request, *args, **kwargs)
+
+        paginator = self.paginator
+        # Keyset cursors are built from the last row's ordering column and pk.
+        extra = (paginator.field, "pk") if isinstance(paginator, KeysetPagination) else ()
+        page = self.paginate_queryset(plan.values(queryset, *extra))
+        rows = page if page is not None else plan.values(queryset)
+        with metrics.timer(request, "serialize"):
+            data = plan.render(rows, request)
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
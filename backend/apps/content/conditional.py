@@ -0,0 +1,110 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+from .cache import normalized_query
+
+
+def queryset_validators(queryset, relations=()):
+    """Return ``(count, etag_source, last_modified)`` for a filtered queryset in one aggregate query.
+
+    Row count plus ``MAX(updated_at)`` of the queryset and of each related table in
+    ``relations`` changes whenever a row is added, edited or removed.
+    """
+    aggregates = {
+        "count": Count("pk", distinct=True),
+        "last": Max("updated_at"),
+    }
+    for relation in relations:
+        aggregates[f"{relation}_count"] = Count(f"{relation}__pk", distinct=True)
+        aggregates[f"{relation}_last"] = Max(f"{relation}__updated_at")
+    stats = queryset.order_by().aggregate(**aggregates)
+
+    stamps = [value for key, value in stats.items() if key.endswith("last") and value]
+    last_modified = max(stamps) if stamps else None
+    source = "|".join(
+        f"{key}={value.isoformat() if hasattr(value, 'isoformat') else value}"
+        for key, value in sorted(stats.items())
+    )
+    return stats["count"], source, last_modified
+
+
+class ConditionalGetMixin:
+    """ETag / Last-Modified validators for list and retrieve, checked before serializing.
+
+    ``conditional_relations`` names relations rendered by nested serializers (reverse
+    FKs such as ``gallery_images`` or forward FKs such as ``category``) whose rows
+    must also invalidate the validators.
+
+    Goes before ``CachedResponseMixin``: a cached payload carries the validators computed
+    when it was built, so a cache hit answers without any query. Only a miss runs the
+    aggregate. Last-Modified is sent only for a single object without nested relations,
+    since deleting a row (or a child row) doesn't move any ``MAX(updated_at)``; the ETag
+    also covers row counts, so it does change.
+    """
+
+    conditional_relations = ()
+
+    def conditional_enabled(self):
+        return True
+
+    def _conditional(self, request, queryset, build):
+        if not self.conditional_enabled():
+            return build()
+
+        cached_entry = getattr(self, "cached_entry", None)
+        entry = cached_entry(request) if cached_entry is not None else None
+        hit = entry is not None and entry[1] is not None
+        if hit:
+            source, last_modified = entry[1]
+        else:
+            count, source, last_modified = queryset_validators(queryset, self.conditional_relations)
+            if count == 0 and self.action == "retrieve":
+                # Let the normal lookup raise 404 (or resolve a fallback lookup).
+                return build()
+            # Stored with the payload by CachedResponseMixin.
+            self.response_validators = (source, last_modified)
+
+        fingerprint = "|".join([
+            request.path,
+            normalized_query(request),
+            request.accepted_renderer.format,
+            source,
+        ])
+        etag = quote_etag(hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:32])
+        timestamp = None
+        if last_modified and self.action == "retrieve" and not self.conditional_relations:
+            timestamp = int(last_modified.timestamp())
+
+        headers = {"ETag": etag}
+        if timestamp is not None:
+            headers["Last-Modified"] = http_date(timestamp)
+
+        conditional = get_conditional_response(request._request, etag=etag, last_modified=timestamp)
+        if conditional is not None:
+            # 304 Not Modified (or 412 for a failed If-Match) without touching the serializer.
+            if conditional.status_code == status.HTTP_304_NOT_MODIFIED:
+                for header, value in headers.items():
+                    conditional[header] = value
+            return conditional
+
+        response = Response(entry[0]) if hit else build()
+        if response.status_code == status.HTTP_200_OK:
+            for header, value in headers.items():
+                response[header] = value
+        return response
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        return self._conditional(request, queryset, lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        )
+        return self._conditional(request, queryset, lambda: super(ConditionalGetMixin, self).retrieve(request, *args, **kwargs))
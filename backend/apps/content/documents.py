@@ -0,0 +1,207 @@
+"""Offline metadata and previews for uploaded PDFs.
+
+Every file field in ``DOCUMENT_FIELDS`` gets a sibling JSON field ``<field>_info``, filled by
+the background worker after an upload so list pages never open the PDFs themselves::
+
+    {"source": "publications/report.pdf", "sha256": "...", "size": 2483111, "pages": 48,
+     "linearized": true, "preview": "publication_covers/previews/ab12....jpg"}
+
+``preview`` is a JPEG of the first page. It becomes the record's ``cover`` when none was
+uploaded (and is replaced along with the PDF while it is still the automatic cover), so it
+also gets the usual cover renditions.
+
+Optional tools, used when installed:
+
+* PyMuPDF -- page count and the first-page preview;
+* pypdf -- page count only, when PyMuPDF is missing;
+* pikepdf or the ``qpdf`` command -- rewrite the PDF linearized ("fast web view") so viewers
+  can show the first page before the download finishes. Only when ``PDF_LINEARIZE`` is on.
+"""
+import hashlib
+import io
+import os
+import shutil
+import subprocess
+import tempfile
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from PIL import Image
+
+from . import images, models
+from .storage import replace_contents
+
+PREVIEW_DIR = "publication_covers/previews"
+
+DOCUMENT_FIELDS = OrderedDict([
+    (models.Publication, ("file",)),
+    (models.LibraryPublicationEntry, ("pdf_file",)),
+])
+
+# model -> (document field, cover field that falls back to the document's preview)
+PREVIEW_COVERS = {
+    models.Publication: ("file", "cover"),
+    models.LibraryPublicationEntry: ("pdf_file", "cover"),
+}
+
+
+def info_attname(field_name):
+    return f"{field_name}_info"
+
+
+def linearize_enabled():
+    return getattr(settings, "PDF_LINEARIZE", False)
+
+
+def preview_width():
+    return getattr(settings, "PDF_PREVIEW_WIDTH", 1200)
+
+
+def is_pdf(data):
+    return data[:1024].lstrip().startswith(b"%PDF-")
+
+
+def is_linearized(data):
+    # The linearization dictionary must be the first object in the file.
+    return b"/Linearized" in data[:1024]
+
+
+def linearize(data):
+    """Return ``data`` rewritten in linearized form, or None when no tool is available."""
+    try:
+        import pikepdf
+    except ImportError:
+        pikepdf = None
+    if pikepdf is not None:
+        with pikepdf.open(io.BytesIO(data)) as pdf:
+            output = io.BytesIO()
+            pdf.save(output, linearize=True)
+            return output.getvalue()
+
+    qpdf = shutil.which("qpdf")
+    if qpdf is None:
+        return None
+    with tempfile.TemporaryDirectory() as workdir:
+        source, target = os.path.join(workdir, "in.pdf"), os.path.join(workdir, "out.pdf")
+        with open(source, "wb") as handle:
+            handle.write(data)
+        # Exit status 3 means "succeeded with warnings".
+        result = subprocess.run([qpdf, "--linearize", source, target], capture_output=True)
+        if result.returncode not in (0, 3):
+            raise OSError(f"qpdf failed: {result.stderr.decode(errors='replace').strip()}")
+        with open(target, "rb") as handle:
+            return handle.read()
+
+
+def inspect(data):
+    """``(page count, first-page RGB image)``; either is None when no tool can provide it."""
+    try:
+        import pymupdf
+    except ImportError:
+        pymupdf = None
+    if pymupdf is not None:
+        with pymupdf.open(stream=data, filetype="pdf") as document:
+            pages = document.page_count
+            if not pages:
+                return pages, None
+            page = document[0]
+            zoom = preview_width() / max(page.rect.width, 1)
+            pixmap = page.get_pixmap(matrix=pymupdf.Matrix(zoom, zoom), alpha=False)
+            return pages, Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
+
+    try:
+        import pypdf
+    except ImportError:
+        return None, None
+    return len(pypdf.PdfReader(io.BytesIO(data)).pages), None
+
+
+def _read(field_file):
+    with field_file.storage.open(field_file.name, "rb") as handle:
+        return handle.read()
+
+
+def _save_preview(digest, image):
+    name = f"{PREVIEW_DIR}/{digest}.jpg"
+    if not default_storage.exists(name):
+        buffer = io.BytesIO()
+        image.save(buffer, "JPEG", quality=85, optimize=True, progressive=True)
+        name = default_storage.save(name, ContentFile(buffer.getvalue()))
+    return name
+
+
+def build_info(instance, field_name):
+    """Inspect (and optionally linearize) one uploaded document; returns the JSON description."""
+    field_file = getattr(instance, field_name)
+    data = _read(field_file)
+    pdf = is_pdf(data)
+    if pdf and linearize_enabled() and not is_linearized(data):
+        linearized = linearize(data)
+        if linearized:
+            replace_contents(instance, field_name, ContentFile(linearized))
+            data = linearized
+
+    info = {
+        "source": field_file.name,
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "size": len(data),
+        "pages": None,
+        "linearized": pdf and is_linearized(data),
+        "preview": "",
+    }
+    if pdf:
+        info["pages"], preview = inspect(data)
+        if preview is not None:
+            info["preview"] = _save_preview(info["sha256"], preview)
+    return info
+
+
+def stale_fields(instance):
+    """Document fields whose ``<field>_info`` doesn't describe the current file."""
+    stale = []
+    for field_name in DOCUMENT_FIELDS.get(type(instance), ()):
+        name = getattr(instance, field_name).name or ""
+        if name != (getattr(instance, info_attname(field_name)) or {}).get("source", ""):
+            stale.append(field_name)
+    return stale
+
+
+def ingest_instance(instance, fields=None):
+    """Refresh ``<field>_info`` for ``fields`` (default: the stale ones) and the automatic cover.
+
+    Writes through ``QuerySet.update`` so saving the result doesn't re-trigger signals,
+    bumping ``updated_at`` so the ETag / Last-Modified validators change with it.
+    Returns the values written.
+    """
+    model = type(instance)
+    values = {}
+    for field_name in fields if fields is not None else stale_fields(instance):
+        previous = getattr(instance, info_attname(field_name)) or {}
+        info = build_info(instance, field_name) if getattr(instance, field_name) else {}
+        values[info_attname(field_name)] = info
+
+        document_field, cover_field = PREVIEW_COVERS.get(model, (None, None))
+        if document_field == field_name:
+            cover = getattr(instance, cover_field).name or ""
+            if not cover or cover == previous.get("preview"):
+                values[cover_field] = info.get("preview", "")
+
+    if values:
+        values["updated_at"] = timezone.now()
+        model._default_manager.filter(pk=instance.pk).update(**values)
+        for attname, value in values.items():
+            setattr(instance, attname, value)
+        covers = [name for name in values if name in images.RENDITION_FIELDS.get(model, ())]
+        if covers:
+            images.render_instance(instance, covers)
+    return values
+
+
+def info_structure(info):
+    """API shape for one document: what a list page needs without opening the file."""
+    if not info or "size" not in info:
+        return None
+    return OrderedDict((key, info.get(key)) for key in ("pages", "size", "linearized"))
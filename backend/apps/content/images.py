@@ -0,0 +1,384 @@
+"""Responsive renditions for uploaded images.
+
+Every image field listed in ``RENDITION_FIELDS`` gets a sibling JSON field
+``<field>_renditions``. When an upload changes, the original is decoded once with Pillow and
+re-encoded at each width in ``IMAGE_RENDITION_WIDTHS`` (never upscaled) as AVIF (when the
+installed Pillow can write it), WebP and JPEG. Files are stored next to the originals under
+``renditions/`` with names derived from the original's SHA-256, so re-uploading the same
+photo reuses the existing files. The JSON records what was produced::
+
+    {"source": "news/photo.jpg", "sha256": "...", "width": 4000, "height": 3000,
+     "formats": {"webp": [[320, "renditions/ab/ab12...-320w.webp"], ...], ...}}
+
+``RenditionsField`` turns that into a ``srcset``-ready structure for the API.
+
+Fields listed in ``PLACEHOLDER_FIELDS`` also get ``<field>_placeholder``: intrinsic size,
+dominant colour and a BlurHash, small enough to ship inline so clients can reserve layout
+and paint something before the image arrives::
+
+    {"source": "albums/images/p.jpg", "width": 4000, "height": 3000,
+     "color": "#3a5f7d", "blurhash": "LEHV6nWB2yk8pyo0adR*.7kCMdnj"}
+"""
+import hashlib
+import io
+import math
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from PIL import ExifTags, Image, ImageOps, features
+
+from . import models
+from .storage import replace_contents
+
+
+RENDITION_DIR = "renditions"
+
+RENDITION_FIELDS = OrderedDict([
+    (models.News, ("image",)),
+    (models.NewsImage, ("image",)),
+    (models.GalleryImage, ("image",)),
+    (models.HeroSlide, ("image",)),
+    (models.Album, ("cover",)),
+    (models.Publication, ("cover",)),
+    (models.Video, ("thumbnail",)),
+    (models.LibraryPublicationEntry, ("cover",)),
+])
+
+PLACEHOLDER_FIELDS = OrderedDict([
+    (models.NewsImage, ("image",)),
+    (models.NoticeImage, ("image",)),
+    (models.GalleryImage, ("image",)),
+    (models.HeroSlide, ("image",)),
+    (models.Album, ("cover",)),
+])
+
+
+def _merge(*mappings):
+    merged = OrderedDict()
+    for mapping in mappings:
+        for model, fields in mapping.items():
+            merged[model] = tuple(dict.fromkeys(merged.get(model, ()) + fields))
+    return merged
+
+
+# model -> image fields with any derived data (renditions and/or placeholder).
+IMAGE_FIELDS = _merge(RENDITION_FIELDS, PLACEHOLDER_FIELDS)
+
+# format -> (Pillow format name, file extension, MIME type, save options)
+FORMATS = OrderedDict([
+    ("avif", ("AVIF", "avif", "image/avif", {"quality": 55})),
+    ("webp", ("WEBP", "webp", "image/webp", {"quality": 78, "method": 4})),
+    ("jpeg", ("JPEG", "jpg", "image/jpeg", {"quality": 82, "optimize": True, "progressive": True})),
+])
+
+
+def rendition_widths():
+    return tuple(sorted(getattr(settings, "IMAGE_RENDITION_WIDTHS", (320, 640, 960, 1280, 1920))))
+
+
+def available_formats():
+    formats = list(FORMATS)
+    if not features.check("avif"):
+        formats.remove("avif")
+    return formats
+
+
+def renditions_attname(field_name):
+    return f"{field_name}_renditions"
+
+
+def placeholder_attname(field_name):
+    return f"{field_name}_placeholder"
+
+
+def _outputs(model, field_name):
+    """Attribute names derived from ``field_name`` on ``model``."""
+    outputs = []
+    if field_name in RENDITION_FIELDS.get(model, ()):
+        outputs.append(renditions_attname(field_name))
+    if field_name in PLACEHOLDER_FIELDS.get(model, ()):
+        outputs.append(placeholder_attname(field_name))
+    return outputs
+
+
+def _target_widths(width):
+    widths = [w for w in rendition_widths() if w < width]
+    # Always include the original width (capped at the largest step) so small uploads
+    # still get re-encoded copies.
+    widths.append(min(width, rendition_widths()[-1]))
+    return sorted(set(widths))
+
+
+def _prepare(image):
+    image = ImageOps.exif_transpose(image)
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        # JPEG has no alpha; flatten onto white once for every format.
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image.convert("RGBA"), mask=image.convert("RGBA").getchannel("A"))
+        return background
+    return image.convert("RGB")
+
+
+def _encode(image, fmt):
+    pil_format, _, _, options = FORMATS[fmt]
+    buffer = io.BytesIO()
+    image.save(buffer, pil_format, **options)
+    return buffer.getvalue()
+
+
+def load(field_file):
+    """Read and decode an upload once: ``(sha256 hex digest, upright RGB image)``."""
+    field_file.open("rb")
+    try:
+        data = field_file.read()
+    finally:
+        field_file.close()
+    with Image.open(io.BytesIO(data)) as original:
+        original.load()
+        image = _prepare(original)
+    return hashlib.sha256(data).hexdigest(), image
+
+
+def rendition_storage():
+    """Where renditions are written; their URLs must come from the same storage."""
+    # Derived files are already named by content, so they bypass the field's storage.
+    return default_storage
+
+
+def rendition_url(name):
+    return rendition_storage().url(name)
+
+
+def build_renditions(field_file, loaded=None):
+    """Generate (or reuse) every rendition of ``field_file`` and return the JSON description."""
+    storage = rendition_storage()
+    digest, image = loaded or load(field_file)
+    width, height = image.size
+
+    formats = {fmt: [] for fmt in available_formats()}
+    for target in _target_widths(width):
+        resized = image if target == width else image.resize(
+            (target, max(1, round(height * target / width))), Image.LANCZOS
+        )
+        for fmt in formats:
+            name = f"{RENDITION_DIR}/{digest[:2]}/{digest}-{target}w.{FORMATS[fmt][1]}"
+            if not storage.exists(name):
+                name = storage.save(name, ContentFile(_encode(resized, fmt)))
+            formats[fmt].append([target, name])
+
+    return {
+        "source": field_file.name,
+        "sha256": digest,
+        "width": width,
+        "height": height,
+        "formats": formats,
+    }
+
+
+BASE83 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+BLURHASH_SAMPLE = 32  # longest side of the image the hash is computed from
+
+
+def _base83(value, length):
+    return "".join(BASE83[(value // 83 ** (length - i - 1)) % 83] for i in range(length))
+
+
+def _to_linear(value):
+    value /= 255
+    return value / 12.92 if value <= 0.04045 else ((value + 0.055) / 1.055) ** 2.4
+
+
+_LINEAR = [_to_linear(value) for value in range(256)]
+
+
+def _to_srgb(value):
+    value = max(0.0, min(1.0, value))
+    if value <= 0.0031308:
+        return int(value * 12.92 * 255 + 0.5)
+    return int((1.055 * value ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def blurhash(image, x_components=4, y_components=3):
+    """Encode ``image`` as a BlurHash string (https://blurha.sh), decoded client-side."""
+    sample = image.copy()
+    sample.thumbnail((BLURHASH_SAMPLE, BLURHASH_SAMPLE))
+    width, height = sample.size
+    data = sample.tobytes()
+    pixels = [
+        (_LINEAR[data[k]], _LINEAR[data[k + 1]], _LINEAR[data[k + 2]])
+        for k in range(0, len(data), 3)
+    ]
+
+    factors = []
+    for j in range(y_components):
+        for i in range(x_components):
+            normalisation = 1 if i == 0 and j == 0 else 2
+            r = g = b = 0.0
+            for y in range(height):
+                basis_y = math.cos(math.pi * j * y / height)
+                row = y * width
+                for x in range(width):
+                    basis = normalisation * math.cos(math.pi * i * x / width) * basis_y
+                    pr, pg, pb = pixels[row + x]
+                    r += basis * pr
+                    g += basis * pg
+                    b += basis * pb
+            scale = 1 / (width * height)
+            factors.append((r * scale, g * scale, b * scale))
+
+    dc, ac = factors[0], factors[1:]
+    result = _base83((x_components - 1) + (y_components - 1) * 9, 1)
+    if ac:
+        actual_max = max(abs(value) for factor in ac for value in factor)
+        quantised_max = int(max(0, min(82, math.floor(actual_max * 166 - 0.5))))
+        maximum = (quantised_max + 1) / 166
+    else:
+        quantised_max, maximum = 0, 1
+    result += _base83(quantised_max, 1)
+    result += _base83((_to_srgb(dc[0]) << 16) + (_to_srgb(dc[1]) << 8) + _to_srgb(dc[2]), 4)
+
+    def quantise(value):
+        signed = math.copysign(abs(value / maximum) ** 0.5, value)
+        return int(max(0, min(18, math.floor(signed * 9 + 9.5))))
+
+    for r, g, b in ac:
+        result += _base83(quantise(r) * 19 * 19 + quantise(g) * 19 + quantise(b), 2)
+    return result
+
+
+def dominant_color(image):
+    """Most common colour of a 5-colour median-cut palette, as ``#rrggbb``."""
+    sample = image.copy()
+    sample.thumbnail((64, 64))
+    paletted = sample.quantize(colors=5, method=Image.Quantize.MEDIANCUT)
+    palette = paletted.getpalette()
+    _, index = max(paletted.getcolors())
+    return "#{:02x}{:02x}{:02x}".format(*palette[index * 3:index * 3 + 3])
+
+
+def build_placeholder(field_file, loaded=None):
+    _, image = loaded or load(field_file)
+    width, height = image.size
+    x_components, y_components = (4, 3) if width >= height else (3, 4)
+    return {
+        "source": field_file.name,
+        "width": width,
+        "height": height,
+        "color": dominant_color(image),
+        "blurhash": blurhash(image, x_components, y_components),
+    }
+
+
+STRIPPABLE_FORMATS = {"JPEG", "PNG", "WEBP"}
+
+
+def strip_metadata(instance, field_name):
+    """Rewrite an uploaded original without its EXIF block (GPS position, camera serials).
+
+    The EXIF orientation is applied to the pixels first so the photo keeps its rotation.
+    JPEGs are re-saved with their own quantization tables (``quality="keep"``) to avoid a
+    generation of quality loss; the ICC profile is kept. Returns True if the file changed.
+    """
+    field_file = getattr(instance, field_name)
+    if not field_file:
+        return False
+    with field_file.storage.open(field_file.name, "rb") as handle:
+        data = handle.read()
+    with Image.open(io.BytesIO(data)) as original:
+        exif = original.getexif()
+        if original.format not in STRIPPABLE_FORMATS or not exif:
+            return False
+        pil_format = original.format
+        options = {}
+        if original.info.get("icc_profile"):
+            options["icc_profile"] = original.info["icc_profile"]
+        if exif.get(ExifTags.Base.Orientation, 1) != 1:
+            # Rotating changes the pixels, so the source JPEG tables no longer apply.
+            image = ImageOps.exif_transpose(original)
+            if pil_format == "JPEG":
+                options["quality"] = 90
+        else:
+            image = original
+            if pil_format == "JPEG":
+                options.update(quality="keep", subsampling="keep")
+        buffer = io.BytesIO()
+        image.save(buffer, pil_format, **options)
+
+    replace_contents(instance, field_name, ContentFile(buffer.getvalue()))
+    return True
+
+
+def stale_fields(instance):
+    """Image fields of ``instance`` whose renditions or placeholder don't describe the current file."""
+    stale = []
+    model = type(instance)
+    for field_name in IMAGE_FIELDS.get(model, ()):
+        name = getattr(instance, field_name).name or ""
+        for attname in _outputs(model, field_name):
+            if name != (getattr(instance, attname) or {}).get("source", ""):
+                stale.append(field_name)
+                break
+    return stale
+
+
+def render_instance(instance, fields=None):
+    """Regenerate renditions and placeholders for ``fields`` (default: the stale ones).
+
+    Each upload is decoded once for both. Writes through ``QuerySet.update`` so saving the
+    result doesn't re-trigger signals, bumping ``updated_at`` so the ETag / Last-Modified
+    validators change with it. Returns the values written.
+    """
+    model = type(instance)
+    values = {}
+    for field_name in fields if fields is not None else stale_fields(instance):
+        field_file = getattr(instance, field_name)
+        loaded = load(field_file) if field_file else None
+        for attname in _outputs(model, field_name):
+            if not field_file:
+                values[attname] = {}
+            elif attname == renditions_attname(field_name):
+                values[attname] = build_renditions(field_file, loaded)
+            else:
+                values[attname] = build_placeholder(field_file, loaded)
+    if values:
+        values["updated_at"] = timezone.now()
+        type(instance)._default_manager.filter(pk=instance.pk).update(**values)
+        for attname, value in values.items():
+            setattr(instance, attname, value)
+    return values
+
+
+def srcset_structure(renditions, build_url):
+    """API shape for one image: intrinsic size, a JPEG ``src`` and one ``srcset`` per format."""
+    if not renditions or not renditions.get("formats"):
+        return None
+    sources = []
+    for fmt, entries in renditions["formats"].items():
+        if not entries:
+            continue
+        sources.append(OrderedDict([
+            ("type", FORMATS[fmt][2]),
+            ("srcset", ", ".join(f"{build_url(name)} {width}w" for width, name in entries)),
+        ]))
+    fallback = renditions["formats"].get("jpeg") or []
+    default_width = getattr(settings, "IMAGE_RENDITION_DEFAULT_WIDTH", 1280)
+    src = None
+    if fallback:
+        fitting = [name for width, name in fallback if width <= default_width]
+        src = build_url(fitting[-1] if fitting else fallback[0][1])
+    return OrderedDict([
+        ("width", renditions.get("width")),
+        ("height", renditions.get("height")),
+        ("src", src),
+        ("sources", sources),
+    ])
+
+
+def placeholder_structure(placeholder):
+    """API shape for one placeholder: the stored values without the source file name."""
+    if not placeholder or "blurhash" not in placeholder:
+        return None
+    return OrderedDict((key, placeholder[key]) for key in ("width", "height", "color", "blurhash"))
@@ -0,0 +1,189 @@
+"""Database-backed background jobs (no external broker).
+
+``enqueue`` stores a ``Job`` row under an idempotency key; ``manage.py run_workers`` claims
+pending rows with a conditional ``UPDATE`` (so several worker commands can share the table),
+runs them in a process pool and records the outcome. Failed jobs are retried with
+exponential backoff up to ``max_attempts``; jobs whose worker died are re-queued once their
+lock is older than ``JOB_LOCK_TIMEOUT``.
+
+Handlers take the job payload and must be idempotent: a job can run more than once.
+"""
+import hashlib
+import traceback
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from . import cache, documents, images, models
+
+
+RETRY_DELAY = 30  # seconds before the first retry; doubles on every attempt
+MAX_RETRY_DELAY = 60 * 60
+
+
+def jobs_eager():
+    """``JOBS_EAGER = True`` runs jobs inline at enqueue time (no worker needed, e.g. in development)."""
+    return getattr(settings, "JOBS_EAGER", False)
+
+
+def lock_timeout():
+    return timedelta(seconds=getattr(settings, "JOB_LOCK_TIMEOUT", 15 * 60))
+
+
+# --- handlers ---------------------------------------------------------------------------
+
+def process_image(payload):
+    """Strip metadata from an uploaded image, then (re)build its renditions."""
+    model = apps.get_model(payload["model"])
+    instance = model._default_manager.filter(pk=payload["pk"]).first()
+    if instance is None:
+        return
+    field_name = payload["field"]
+    if getattr(instance, field_name).name != payload["name"]:
+        # Superseded by a newer upload, which has its own job.
+        return
+    if getattr(settings, "IMAGE_STRIP_METADATA", True):
+        images.strip_metadata(instance, field_name)
+    if images.render_instance(instance, [field_name]):
+        cache.bump_generation(model)
+
+
+def process_document(payload):
+    """Read page count, size and first-page preview of an uploaded PDF (linearizing it if enabled)."""
+    model = apps.get_model(payload["model"])
+    instance = model._default_manager.filter(pk=payload["pk"]).first()
+    if instance is None or getattr(instance, payload["field"]).name != payload["name"]:
+        return
+    if documents.ingest_instance(instance, [payload["field"]]):
+        cache.bump_generation(model)
+
+
+HANDLERS = {
+    "image": process_image,
+    "document": process_document,
+}
+
+
+# --- producers --------------------------------------------------------------------------
+
+def _job_key(*parts):
+    key = ":".join(str(part) for part in parts)
+    if len(key) > 255:
+        key = f"{parts[0]}:{hashlib.sha256(key.encode('utf-8')).hexdigest()}"
+    return key
+
+
+def enqueue(kind, key, payload, max_attempts=None):
+    """Queue a job unless one with ``key`` already exists; a failed one is re-armed.
+
+    Returns the ``Job`` row.
+    """
+    defaults = {"kind": kind, "payload": payload}
+    if max_attempts is not None:
+        defaults["max_attempts"] = max_attempts
+    job, created = models.Job.objects.get_or_create(key=key, defaults=defaults)
+    if not created and job.status == models.Job.FAILED:
+        models.Job.objects.filter(pk=job.pk, status=models.Job.FAILED).update(
+            status=models.Job.PENDING, attempts=0, run_after=timezone.now(), last_error="",
+        )
+        job.refresh_from_db()
+    if jobs_eager() and job.status == models.Job.PENDING:
+        run_inline(job)
+    return job
+
+
+def enqueue_images(instance, fields=None):
+    """Queue one ``image`` job per stale (or given) image field of ``instance``."""
+    label = instance._meta.label_lower
+    queued = []
+    for field_name in fields if fields is not None else images.stale_fields(instance):
+        name = getattr(instance, field_name).name or ""
+        payload = {"model": label, "pk": instance.pk, "field": field_name, "name": name}
+        queued.append(enqueue("image", _job_key("image", label, instance.pk, field_name, name), payload))
+    return queued
+
+
+def enqueue_documents(instance, fields=None):
+    """Queue one ``document`` job per stale (or given) document field of ``instance``."""
+    label = instance._meta.label_lower
+    queued = []
+    for field_name in fields if fields is not None else documents.stale_fields(instance):
+        name = getattr(instance, field_name).name or ""
+        payload = {"model": label, "pk": instance.pk, "field": field_name, "name": name}
+        queued.append(enqueue("document", _job_key("document", label, instance.pk, field_name, name), payload))
+    return queued
+
+
+# --- consumers --------------------------------------------------------------------------
+
+def requeue_stale(now=None):
+    """Release jobs whose worker stopped reporting (crashed or killed). Returns the count."""
+    now = now or timezone.now()
+    return models.Job.objects.filter(
+        status=models.Job.RUNNING, locked_at__lt=now - lock_timeout(),
+    ).update(status=models.Job.PENDING, locked_at=None, locked_by="")
+
+
+def claim(worker, limit):
+    """Atomically mark up to ``limit`` due jobs as running for ``worker``; returns their ids."""
+    now = timezone.now()
+    candidates = models.Job.objects.filter(
+        status=models.Job.PENDING, run_after__lte=now,
+    ).order_by("run_after", "pk").values_list("pk", flat=True)[:limit]
+    claimed = []
+    for pk in list(candidates):
+        # Only one worker wins the conditional update for a given row.
+        won = models.Job.objects.filter(pk=pk, status=models.Job.PENDING).update(
+            status=models.Job.RUNNING, locked_at=now, locked_by=worker, attempts=F("attempts") + 1,
+        )
+        if won:
+            claimed.append(pk)
+    return claimed
+
+
+def execute(job_id):
+    """Run one claimed job's handler. Returns ``""`` on success or the formatted traceback.
+
+    Runs inside pool processes, so it only reads the job and leaves bookkeeping to the caller.
+    """
+    try:
+        job = models.Job.objects.get(pk=job_id)
+        HANDLERS[job.kind](job.payload)
+    except Exception:
+        return traceback.format_exc()
+    return ""
+
+
+def finish(job_id, error=""):
+    """Record the outcome of a claimed job: done, retry later, or failed for good."""
+    now = timezone.now()
+    if not error:
+        models.Job.objects.filter(pk=job_id).update(
+            status=models.Job.DONE, finished_at=now, locked_at=None, last_error="",
+        )
+        return models.Job.DONE
+
+    job = models.Job.objects.get(pk=job_id)
+    if job.attempts >= job.max_attempts:
+        status, run_after = models.Job.FAILED, job.run_after
+    else:
+        delay = min(RETRY_DELAY * 2 ** max(job.attempts - 1, 0), MAX_RETRY_DELAY)
+        status, run_after = models.Job.PENDING, now + timedelta(seconds=delay)
+    models.Job.objects.filter(pk=job_id).update(
+        status=status, run_after=run_after, locked_at=None, locked_by="",
+        finished_at=now if status == models.Job.FAILED else None, last_error=error[-10000:],
+    )
+    return status
+
+
+def run_inline(job):
+    if models.Job.objects.filter(pk=job.pk, status=models.Job.PENDING).update(
+        status=models.Job.RUNNING, locked_at=timezone.now(), locked_by="inline", attempts=F("attempts") + 1,
+    ):
+        finish(job.pk, execute(job.pk))
+    job.refresh_from_db()
+    return job
+
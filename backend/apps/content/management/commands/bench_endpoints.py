@@ -0,0 +1,147 @@
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connection, connections
+from django.test import Client
+from django.test.utils import override_settings
+from django.conf import settings
+from django.urls import Resolver404, resolve, reverse
+
+from apps.content.management.routes import get_routes, registered_viewsets
+
+
+EXTRA_ENDPOINTS = ("bundle-home", "site-config")
+
+
+def _database_label():
+    settings_dict = connection.settings_dict
+    pool = settings_dict.get("OPTIONS", {}).get("pool")
+    return (
+        f"{connection.vendor} ({settings_dict['NAME']}), CONN_MAX_AGE={settings_dict['CONN_MAX_AGE']}, "
+        f"health checks {'on' if settings_dict['CONN_HEALTH_CHECKS'] else 'off'}, pool {'on' if pool else 'off'}"
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure requests/second of the public read endpoints against the configured database, "
+        "opening and releasing connections per request as a WSGI server does. Run it once per "
+        "backend (DJANGO_DB_ENGINE=sqlite / postgres, same data loaded) to compare them. "
+        "--surface both compares /api/ with the read-only public API. Read-only."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint (default: 200).")
+        parser.add_argument("--concurrency", type=int, default=4, help="Client threads (default: 4).")
+        parser.add_argument(
+            "--endpoint",
+            action="append",
+            help="Only benchmark endpoints whose path starts with this, e.g. /api/news/ (repeatable).",
+        )
+        parser.add_argument(
+            "--surface",
+            choices=("api", "public", "both"),
+            default="api",
+            help="Benchmark /api/, the read-only public API, or both side by side (default: api).",
+        )
+        parser.add_argument(
+            "--cache",
+            action="store_true",
+            help="Keep the response cache on (default: off, so every request reaches the database).",
+        )
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1 or options["concurrency"] < 1:
+            raise CommandError("--requests and --concurrency must be positive.")
+
+        self.stdout.write(f"Database: {_database_label()}")
+        self.stdout.write(f"{options['requests']} requests per endpoint, {options['concurrency']} thread(s)")
+
+        totals = [0, 0.0]
+        with override_settings(
+            ALLOWED_HOSTS=["testserver"], DEBUG=False, CONTENT_CACHE_ENABLED=options["cache"], THROTTLE_ENABLED=False,
+        ):
+            for url in self.endpoints(options["endpoint"]):
+                medians = {}
+                for surface, target in self.targets(url, options["surface"]):
+                    status = Client().get(target).status_code
+                    if status != 200:
+                        self.stdout.write(f"SKIP {target}: {status}")
+                        continue
+                    elapsed, timings = self.run(target, options["requests"], options["concurrency"])
+                    totals[0] += len(timings)
+                    totals[1] += elapsed
+                    timings.sort()
+                    medians[surface] = statistics.median(timings)
+                    p95 = timings[max(int(len(timings) * 0.95) - 1, 0)]
+                    self.stdout.write(
+                        f"{target:<40} {len(timings) / elapsed:8.1f} req/s   "
+                        f"p50 {medians[surface]:6.2f}ms   p95 {p95:6.2f}ms"
+                    )
+                if len(medians) == 2:
+                    saved = medians["api"] - medians["public"]
+                    self.stdout.write(f"{'':<40} public saves {saved:.2f}ms per request ({saved / medians['api']:.0%})")
+        connections.close_all()
+
+        if totals[0]:
+            self.stdout.write(self.style.SUCCESS(f"Overall: {totals[0] / totals[1]:.1f} req/s over {totals[0]} requests"))
+
+    def endpoints(self, prefixes):
+        urls = []
+        for prefix, viewset, basename in registered_viewsets():
+            for route in get_routes(viewset, prefix, basename):
+                if not route.detail:
+                    urls.append(reverse(route.url_name))
+        urls.extend(reverse(name) for name in EXTRA_ENDPOINTS)
+        if prefixes:
+            urls = [url for url in urls if any(url.startswith(prefix) for prefix in prefixes)]
+        return urls
+
+    def targets(self, url, surface):
+        """``(surface, url)`` pairs to benchmark for an /api/ ``url``."""
+        targets = []
+        if surface in ("api", "both"):
+            targets.append(("api", url))
+        if surface in ("public", "both"):
+            public = settings.PUBLIC_API_PREFIX + url[len("/api/"):]
+            try:
+                resolve(public)
+            except Resolver404:
+                pass  # not on the public API (form endpoints)
+            else:
+                targets.append(("public", public))
+        return targets
+
+    def run(self, url, count, concurrency):
+        """``(wall seconds, per-request milliseconds)`` for ``count`` GETs over ``concurrency`` threads."""
+        remaining = [count]
+        lock = threading.Lock()
+
+        def worker():
+            client = Client()
+            timings = []
+            while True:
+                with lock:
+                    if remaining[0] <= 0:
+                        break
+                    remaining[0] -= 1
+                # The test client skips the request_started/finished connection handling, so do
+                # it here: that's where CONN_MAX_AGE, health checks and the pool come into play.
+                close_old_connections()
+                started = time.perf_counter()
+                response = client.get(url)
+                timings.append((time.perf_counter() - started) * 1000)
+                close_old_connections()
+                if response.status_code != 200:
+                    raise CommandError(f"GET {url} returned {response.status_code}")
+            connection.close()
+            return timings
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [executor.submit(worker) for _ in range(concurrency)]
+            timings = [timing for future in futures for timing in future.result()]
+        return time.perf_counter() - started, timings
@@ -0,0 +1,102 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from apps.content import models, search
+
+
+VOCABULARY_SIZE = 5000
+LATIN = "abcdefghiklmnoprstuvy"
+SINHALA_CONSONANTS = [chr(c) for c in range(0x0D9A, 0x0DC7) if c not in (0x0DB2, 0x0DBC, 0x0DBE, 0x0DBF)]
+SINHALA_SIGNS = ["", "\u0DCF", "\u0DD2", "\u0DD3", "\u0DD4", "\u0DD9", "\u0DCA"]
+
+
+def _vocabulary(rng, make_word):
+    words = set()
+    while len(words) < VOCABULARY_SIZE:
+        words.add(make_word(rng))
+    words = sorted(words)
+    rng.shuffle(words)
+    # Zipf-like term frequencies, as in natural text: a few very common words, a long tail of rare ones.
+    cumulative, total = [], 0.0
+    for rank in range(1, len(words) + 1):
+        total += 1.0 / rank
+        cumulative.append(total)
+    return words, cumulative
+
+
+def _latin_word(rng):
+    return "".join(rng.choice(LATIN) for _ in range(rng.randint(3, 9)))
+
+
+def _sinhala_word(rng):
+    return "".join(rng.choice(SINHALA_CONSONANTS) + rng.choice(SINHALA_SIGNS) for _ in range(rng.randint(2, 4)))
+
+
+class Command(BaseCommand):
+    help = (
+        "Load a synthetic bilingual (Zipf-distributed vocabulary) corpus into the search index inside a rolled-back "
+        "transaction and report query latency percentiles."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--docs", type=int, default=100_000, help="Corpus size (default: 100000).")
+        parser.add_argument("--queries", type=int, default=200, help="Queries to time (default: 200).")
+        parser.add_argument("--seed", type=int, default=1, help="Random seed for corpus and queries.")
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        self.english = _vocabulary(rng, _latin_word)
+        self.sinhala = _vocabulary(rng, _sinhala_word)
+        backend = search.get_backend()
+        self.stdout.write(f"Backend: {type(backend).__name__}")
+
+        with transaction.atomic():
+            started = time.perf_counter()
+            self.load_corpus(rng, options["docs"])
+            self.stdout.write(f"Loaded {options['docs']} documents in {time.perf_counter() - started:.1f}s")
+
+            timings = []
+            for _ in range(options["queries"]):
+                words, cumulative = self.english if rng.random() < 0.5 else self.sinhala
+                words = rng.choices(words, cum_weights=cumulative, k=rng.randint(1, 2))
+                started = time.perf_counter()
+                results = search.SearchResults(" ".join(words), backend=backend)
+                results.count()
+                list(results[0:10])
+                timings.append((time.perf_counter() - started) * 1000)
+            transaction.set_rollback(True)
+
+        timings.sort()
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        self.stdout.write(
+            f"count+first page over {len(timings)} queries: "
+            f"p50 {statistics.median(timings):.2f}ms, p95 {p95:.2f}ms, max {timings[-1]:.2f}ms"
+        )
+
+    def load_corpus(self, rng, count, batch_size=5000):
+        kinds = list(search.SEARCHABLE)
+        now = timezone.now()
+        batch = []
+        for n in range(count):
+            title = " ".join(rng.choices(self.english[0], cum_weights=self.english[1], k=6))
+            title_si = " ".join(rng.choices(self.sinhala[0], cum_weights=self.sinhala[1], k=6))
+            body = " ".join(rng.choices(self.english[0], cum_weights=self.english[1], k=80))
+            body_si = " ".join(rng.choices(self.sinhala[0], cum_weights=self.sinhala[1], k=80))
+            batch.append(models.SearchDocument(
+                kind=kinds[n % len(kinds)],
+                object_id=10_000_000 + n,
+                title=title, title_si=title_si,
+                body=body, body_si=body_si,
+                summary=body[:search.SUMMARY_LENGTH], summary_si=body_si[:search.SUMMARY_LENGTH],
+                published_at=now,
+            ))
+            if len(batch) >= batch_size:
+                models.SearchDocument.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            models.SearchDocument.objects.bulk_create(batch)
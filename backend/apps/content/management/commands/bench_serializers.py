@@ -0,0 +1,117 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test.utils import override_settings
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.content import compiled, renderers
+from apps.content.management.commands.check_query_budgets import _Seeder
+from apps.content.management.routes import model_for, registered_viewsets, staff_client
+
+
+# Query strings every list endpoint is compared under.
+VARIANTS = ("", "lang=en", "lang=si", "fields=id,title&lang=si", "omit=created_at", "pagination=cursor")
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed rows inside a rolled-back transaction and, for every list endpoint, check that the "
+        "compiled serializers plus FastJSONRenderer return byte-identical responses to the DRF "
+        "serializers plus JSONRenderer, then measure rows/second of both paths. Fails on any "
+        "difference."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=200, help="Rows seeded and serialized per endpoint (default: 200).")
+        parser.add_argument("--repeat", type=int, default=5, help="Timed runs per path; the best is kept (default: 5).")
+
+    def handle(self, *args, **options):
+        if options["rows"] < 1 or options["repeat"] < 1:
+            raise CommandError("--rows and --repeat must be positive.")
+        self.stdout.write(f"JSON encoder: {'orjson' if renderers.orjson is not None else 'json (orjson not installed)'}")
+
+        failures = []
+        with override_settings(ALLOWED_HOSTS=["testserver"], CONTENT_CACHE_ENABLED=False, THROTTLE_ENABLED=False):
+            client = staff_client()
+            for prefix, viewset, basename in registered_viewsets():
+                if not hasattr(viewset, "list"):
+                    continue
+                label = f"/api/{prefix}/"
+                with transaction.atomic():
+                    _Seeder().seed(model_for(viewset), options["rows"])
+                    url = reverse(f"{basename}-list")
+                    if not issubclass(viewset, compiled.CompiledListMixin):
+                        self.stdout.write(f"---- {label}: not compiled")
+                        transaction.set_rollback(True)
+                        continue
+                    mismatches = self.compare(client, url, options["rows"])
+                    failures.extend(f"{label}?{variant}: {detail}" for variant, detail in mismatches)
+                    self.report(label, viewset, url, options["rows"], options["repeat"], not mismatches)
+                    transaction.set_rollback(True)
+
+        if failures:
+            for failure in failures:
+                self.stderr.write(self.style.ERROR(f"FAIL {failure}"))
+            raise CommandError(f"{len(failures)} response(s) differ between compiled and DRF serializers.")
+
+    def compare(self, client, url, rows):
+        """``(variant, detail)`` for every variant whose compiled response differs."""
+        mismatches = []
+        for variant in VARIANTS:
+            query = f"page_size={rows}&{variant}"
+            with override_settings(COMPILED_SERIALIZERS=False):
+                reference = client.get(f"{url}?{query}")
+            response = client.get(f"{url}?{query}")
+            if reference.status_code != 200 or response.status_code != 200:
+                mismatches.append((variant, f"status {reference.status_code} / {response.status_code}"))
+                continue
+            expected = JSONRenderer().render(reference.data)
+            if response.content != expected:
+                offset = next(
+                    (i for i, (a, b) in enumerate(zip(response.content, expected)) if a != b),
+                    min(len(response.content), len(expected)),
+                )
+                mismatches.append((variant, f"first difference at byte {offset}: "
+                                            f"{response.content[offset - 40:offset + 40]!r} != {expected[offset - 40:offset + 40]!r}"))
+        return mismatches
+
+    def report(self, label, viewset, url, rows, repeat, identical):
+        request = Request(APIRequestFactory().get(url))
+        view = viewset(request=request, format_kwarg=None, action="list", args=(), kwargs={})
+        queryset = view.filter_queryset(view.get_queryset())
+        serializer = view.get_serializer()
+        plan = compiled.plan_for(serializer, queryset)
+        if plan is None:
+            self.stdout.write(f"---- {label}: not compiled ({', '.join(compiled.uncompiled_fields(serializer, queryset.query.annotations))})")
+            return
+
+        def drf():
+            data = view.get_serializer(list(queryset[:rows]), many=True).data
+            return len(data), JSONRenderer().render(data)
+
+        def fast():
+            data = plan.render(list(plan.values(queryset)[:rows]), request)
+            return len(data), renderers.FastJSONRenderer().render(data)
+
+        count, _ = drf()
+        if not count:
+            self.stdout.write(f"SKIP {label}: no rows to serialize")
+            return
+        before, after = self.best(drf, repeat), self.best(fast, repeat)
+        status = self.style.SUCCESS("OK  ") if identical else self.style.ERROR("DIFF")
+        self.stdout.write(
+            f"{status} {label:<22} {count:>4} rows   DRF {count / before:>9,.0f} rows/s   "
+            f"compiled {count / after:>9,.0f} rows/s   {before / after:4.1f}x"
+        )
+
+    def best(self, run, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - started)
+        return min(timings)
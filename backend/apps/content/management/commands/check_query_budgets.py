@@ -0,0 +1,165 @@
+from datetime import date
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connection, models as django_models, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.content.management.routes import detail_kwargs, get_routes, model_for, registered_viewsets, staff_client
+
+
+CHILDREN_PER_ROW = 3
+
+
+class _Seeder:
+    """Fill content models with throwaway rows so query counts can be measured."""
+
+    def __init__(self):
+        self.counter = 0
+        self.parents = {}
+
+    def _next(self):
+        self.counter += 1
+        return self.counter
+
+    def _value(self, field, n):
+        if isinstance(field, django_models.ForeignKey):
+            return self.parent_for(field.related_model)
+        if field.has_default():
+            return field.get_default()
+        if field.null:
+            return None
+        if isinstance(field, django_models.EmailField):
+            return f"budget{n}@example.com"
+        if isinstance(field, django_models.URLField):
+            return f"https://example.com/{n}"
+        if isinstance(field, django_models.SlugField):
+            return f"budget-{n}"
+        if isinstance(field, django_models.FileField):
+            return f"budget/{n}.jpg"
+        if isinstance(field, django_models.DateTimeField):
+            return timezone.now()
+        if isinstance(field, django_models.DateField):
+            return date.today()
+        if isinstance(field, django_models.DecimalField):
+            return Decimal("0")
+        if isinstance(field, (django_models.IntegerField, django_models.FloatField)):
+            return n
+        if isinstance(field, django_models.BooleanField):
+            return True
+        if isinstance(field, (django_models.CharField, django_models.TextField)):
+            return f"budget {n}"
+        raise CommandError(f"Cannot seed {field.model.__name__}.{field.name}")
+
+    def build(self, model, **overrides):
+        n = self._next()
+        values = {}
+        for field in model._meta.concrete_fields:
+            if field.primary_key or field.name in overrides:
+                continue
+            if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
+                continue
+            values[field.name] = self._value(field, n)
+        values.update(overrides)
+        return model(**values)
+
+    def parent_for(self, model):
+        if model not in self.parents:
+            parent = self.build(model)
+            parent.save()
+            self.parents[model] = parent
+        return self.parents[model]
+
+    def seed(self, model, count):
+        """Create ``count`` rows of ``model`` plus a few children per row for reverse FKs."""
+        rows = model.objects.bulk_create([self.build(model) for _ in range(count)])
+        app_label = model._meta.app_label
+        for relation in model._meta.related_objects:
+            child = relation.related_model
+            if not relation.one_to_many or child._meta.app_label != app_label:
+                continue
+            field_name = relation.field.name
+            child.objects.bulk_create([
+                self.build(child, **{field_name: row})
+                for row in rows
+                for _ in range(CHILDREN_PER_ROW)
+            ])
+        return rows
+
+
+def _budget_for(viewset, action):
+    budget = getattr(viewset, "query_budget", None)
+    if isinstance(budget, dict):
+        return budget.get(action)
+    return budget
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed growing amounts of data inside a rolled-back transaction and fail when any "
+        "endpoint in apps/content/urls.py runs more queries than its viewset's query_budget."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            default="2,20",
+            help="Comma-separated row counts to seed before each measurement (default: 2,20).",
+        )
+
+    def handle(self, *args, **options):
+        sizes = sorted(int(size) for size in options["sizes"].split(",") if size.strip())
+        if not sizes:
+            raise CommandError("--sizes must contain at least one row count.")
+
+        failures = []
+        with override_settings(ALLOWED_HOSTS=["testserver"], CONTENT_CACHE_ENABLED=False, THROTTLE_ENABLED=False):
+            client = staff_client()
+            for prefix, viewset, basename in registered_viewsets():
+                for action, counts in self.measure(client, viewset, basename, sizes):
+                    label = f"/api/{prefix}/ [{action}]"
+                    budget = _budget_for(viewset, action)
+                    if isinstance(counts, str):
+                        self.stdout.write(f"SKIP {label}: {counts}")
+                        continue
+                    summary = " -> ".join(str(c) for c in counts)
+                    if budget is None:
+                        self.stdout.write(f"---- {label}: {summary} queries (no budget declared)")
+                        continue
+                    if max(counts) > budget:
+                        failures.append(f"{label} ran {max(counts)} queries, budget is {budget}")
+                    elif len(set(counts)) > 1:
+                        failures.append(f"{label} query count grows with data: {summary}")
+                    else:
+                        self.stdout.write(self.style.SUCCESS(f"OK   {label}: {summary} / {budget}"))
+
+        if failures:
+            for failure in failures:
+                self.stderr.write(self.style.ERROR(f"FAIL {failure}"))
+            raise CommandError(f"{len(failures)} endpoint(s) over query budget.")
+
+    def measure(self, client, viewset, basename, sizes):
+        routes = get_routes(viewset, "", basename)
+        results = {route.action: [] for route in routes}
+        model = model_for(viewset)
+        for size in sizes:
+            try:
+                with transaction.atomic():
+                    rows = _Seeder().seed(model, size)
+                    for route in routes:
+                        results[route.action].append(self.count(client, route, rows[-1]))
+                    transaction.set_rollback(True)
+            except DatabaseError as exc:
+                return [(route.action, f"database error ({exc})") for route in routes]
+        return list(results.items())
+
+    def count(self, client, route, row):
+        kwargs = detail_kwargs(route.viewset, row) if route.detail else {}
+        url = reverse(route.url_name, kwargs=kwargs)
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(url, None if route.detail else {"page_size": 100})
+        if response.status_code != 200:
+            raise CommandError(f"GET {url} returned {response.status_code}")
+        return len(ctx.captured_queries)
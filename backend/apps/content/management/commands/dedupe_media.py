@@ -0,0 +1,68 @@
+import posixpath
+
+from django.core.files.base import File
+from django.core.management.base import BaseCommand
+from django.db.models import JSONField
+from django.utils import timezone
+
+from apps.content import cache, media, storage
+
+
+class Command(BaseCommand):
+    help = (
+        "Move uploads stored under their original names (report.pdf, report_bnpHHYZ.pdf) onto "
+        "content-addressed names, so identical files share one blob. Run gc_media afterwards "
+        "to delete the originals."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would move without changing anything.",
+        )
+
+    def handle(self, *args, **options):
+        moved, blobs = 0, set()
+        for model, field in storage.file_fields():
+            json_columns = [f.attname for f in model._meta.concrete_fields if isinstance(f, JSONField)]
+            changed = False
+            rows = model._default_manager.exclude(**{field.attname: ""}).exclude(**{f"{field.attname}__isnull": True})
+            for row in rows.values("pk", field.attname, *json_columns).iterator():
+                name = row[field.attname]
+                if media.HASHED_NAME.match(posixpath.basename(name)):
+                    continue  # already named by content (uploads, renditions, PDF previews)
+                if not field.storage.exists(name):
+                    self.stderr.write(self.style.WARNING(f"{model._meta.label} #{row['pk']}: {name} is missing"))
+                    continue
+                if options["dry_run"]:
+                    self.stdout.write(f"would move {name}")
+                    moved += 1
+                    continue
+
+                with field.storage.open(name, "rb") as handle:
+                    new_name = field.storage.save(name, File(handle, name), max_length=field.max_length)
+                if new_name == name:
+                    continue  # a blob name shortened to fit max_length
+                # QuerySet.update() skips auto_now; bump it so the ETag / Last-Modified change.
+                values = {field.attname: new_name, "updated_at": timezone.now()}
+                # Renditions / document info built from this file stay valid; only the name moved.
+                for column in json_columns:
+                    derived = row[column]
+                    if isinstance(derived, dict) and derived.get("source") == name:
+                        values[column] = {**derived, "source": new_name}
+                model._default_manager.filter(pk=row["pk"]).update(**values)
+                blobs.add(new_name)
+                moved += 1
+                changed = True
+                if options["verbosity"] > 1:
+                    self.stdout.write(f"{name} -> {new_name}")
+            if changed:
+                cache.bump_generation(model)
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.SUCCESS(f"Would move {moved} file reference(s)."))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f"Moved {moved} file reference(s) onto {len(blobs)} blob(s). Run gc_media to delete the originals."
+            ))
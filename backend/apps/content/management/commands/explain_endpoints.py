@@ -0,0 +1,114 @@
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+
+from apps.content.management.routes import detail_kwargs, get_routes, model_for, registered_viewsets, staff_client
+
+
+SQLITE_SCAN = re.compile(r"^SCAN (\w+)(.*)$")
+POSTGRES_SCAN = re.compile(r"Seq Scan on (\w+)")
+
+
+def sequential_scans(plan_rows):
+    """Table names read with a full sequential scan in an EXPLAIN result."""
+    tables = []
+    if connection.vendor == "sqlite":
+        for row in plan_rows:
+            match = SQLITE_SCAN.match(row[-1])
+            # "SCAN t USING INDEX i" walks an index in order; only a bare SCAN reads the table.
+            if match and "USING" not in match.group(2):
+                tables.append(match.group(1))
+    elif connection.vendor == "postgresql":
+        for row in plan_rows:
+            tables.extend(POSTGRES_SCAN.findall(row[0]))
+    return tables
+
+
+class Command(BaseCommand):
+    help = (
+        "Request every GET route in apps/content/urls.py, EXPLAIN each SQL query it runs and "
+        "report sequential scans on tables holding at least --threshold rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--threshold",
+            type=int,
+            default=1000,
+            help="Only report sequential scans on tables with at least this many rows (default: 1000).",
+        )
+        parser.add_argument(
+            "--verbose-plans",
+            action="store_true",
+            help="Print the full query plan of every query.",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ("sqlite", "postgresql"):
+            raise CommandError(f"EXPLAIN parsing is not implemented for {connection.vendor}.")
+
+        self.threshold = options["threshold"]
+        self.verbose_plans = options["verbose_plans"]
+        self.table_sizes = {}
+        findings = []
+
+        with override_settings(ALLOWED_HOSTS=["testserver"], CONTENT_CACHE_ENABLED=False, THROTTLE_ENABLED=False):
+            client = staff_client()
+            for prefix, viewset, basename in registered_viewsets():
+                for route in get_routes(viewset, prefix, basename):
+                    findings.extend(self.explain_route(client, route))
+
+        if findings:
+            for label, table, rows, sql in findings:
+                self.stderr.write(self.style.WARNING(f"SEQ SCAN {label}: {table} ({rows} rows)\n    {sql}"))
+            raise CommandError(f"{len(findings)} sequential scan(s) on tables over {self.threshold} rows.")
+        self.stdout.write(self.style.SUCCESS("No sequential scans over the threshold."))
+
+    def explain_route(self, client, route):
+        label = f"/api/{route.prefix}/ [{route.action}]"
+        kwargs = {}
+        if route.detail:
+            row = model_for(route.viewset)._default_manager.order_by("pk").first()
+            if row is None:
+                self.stdout.write(f"SKIP {label}: no rows to look up")
+                return []
+            kwargs = detail_kwargs(route.viewset, row)
+
+        url = reverse(route.url_name, kwargs=kwargs)
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(url)
+        if response.status_code != 200:
+            self.stdout.write(f"SKIP {label}: GET {url} returned {response.status_code}")
+            return []
+
+        findings = []
+        for query in ctx.captured_queries:
+            sql = query["sql"]
+            if not sql.lstrip().upper().startswith("SELECT"):
+                continue
+            with connection.cursor() as cursor:
+                cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}")
+                plan = cursor.fetchall()
+            if self.verbose_plans:
+                self.stdout.write(f"{label}\n    {sql}")
+                for row in plan:
+                    self.stdout.write(f"      {row[-1] if connection.vendor == 'sqlite' else row[0]}")
+            for table in sequential_scans(plan):
+                rows = self.table_size(table)
+                if rows is not None and rows >= self.threshold:
+                    findings.append((label, table, rows, sql))
+        self.stdout.write(f"OK   {label}: {len(ctx.captured_queries)} queries explained")
+        return findings
+
+    def table_size(self, table):
+        if table not in self.table_sizes:
+            if table not in connection.introspection.table_names():
+                self.table_sizes[table] = None
+            else:
+                with connection.cursor() as cursor:
+                    cursor.execute(f"SELECT COUNT(*) FROM {connection.ops.quote_name(table)}")
+                    self.table_sizes[table] = cursor.fetchone()[0]
+        return self.table_sizes[table]
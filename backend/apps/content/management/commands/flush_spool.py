@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from apps.content import spool
+
+
+class Command(BaseCommand):
+    help = (
+        "Commit spooled contact messages and newsletter sign-ups to the database. run_workers "
+        "does this on every poll; use this for a one-off flush or from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--kind",
+            action="append",
+            choices=sorted(spool.KINDS),
+            help="Only flush this kind (repeatable). Default: all.",
+        )
+
+    def handle(self, *args, **options):
+        committed = spool.flush(options["kind"])
+        for kind, count in committed.items():
+            self.stdout.write(f"{kind}: {count} record(s) committed, {spool.pending(kind)} pending")
+        self.stdout.write(self.style.SUCCESS(f"Committed {sum(committed.values())} record(s)."))
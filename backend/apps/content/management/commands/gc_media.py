@@ -0,0 +1,60 @@
+import os
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.content import storage
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete media files that no row references any more (uploads superseded by a newer "
+        "file, renditions of replaced images, abandoned temporary uploads)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="List what would be deleted without deleting it.",
+        )
+        parser.add_argument(
+            "--min-age",
+            type=float,
+            default=24,
+            help="Keep files modified in the last N hours (default: 24), so uploads whose row "
+                 "isn't committed yet survive.",
+        )
+
+    def handle(self, *args, **options):
+        media = storage.content_storage()
+        counts = storage.reference_counts()
+        cutoff = time.time() - options["min_age"] * 3600
+        kept = removed = freed = 0
+
+        for directory in storage.collected_directories():
+            root = media.path(directory)
+            for current, _, filenames in os.walk(root):
+                for filename in filenames:
+                    path = os.path.join(current, filename)
+                    name = os.path.relpath(path, media.location).replace(os.sep, "/")
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    if counts[name] or stat.st_mtime > cutoff:
+                        kept += 1
+                        if options["verbosity"] > 1:
+                            self.stdout.write(f"keep {name} ({counts[name]} reference(s))")
+                        continue
+                    removed += 1
+                    freed += stat.st_size
+                    if options["verbosity"] > 1 or options["dry_run"]:
+                        self.stdout.write(f"{'would delete' if options['dry_run'] else 'delete'} {name}")
+                    if not options["dry_run"]:
+                        os.remove(path)
+
+        verb = "Would delete" if options["dry_run"] else "Deleted"
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {removed} file(s), {freed / (1024 * 1024):.1f} MiB; {kept} kept."
+        ))
@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand
+
+from apps.content import cache, documents, jobs
+
+
+MODELS = {model._meta.model_name: model for model in documents.DOCUMENT_FIELDS}
+
+
+class Command(BaseCommand):
+    help = (
+        "Record page count, size and first-page preview for uploaded PDFs (and linearize them "
+        "when PDF_LINEARIZE is on). Uploads are queued for run_workers on save; this command "
+        "backfills older rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            choices=sorted(MODELS),
+            help="Only process this model (repeatable). Default: every model with documents.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Re-inspect documents even when their info is up to date.",
+        )
+        parser.add_argument(
+            "--queue",
+            action="store_true",
+            help="Queue background jobs for run_workers instead of processing here.",
+        )
+
+    def handle(self, *args, **options):
+        total = 0
+        for name, model in MODELS.items():
+            if options["model"] and name not in options["model"]:
+                continue
+            fields = documents.DOCUMENT_FIELDS[model]
+            count = 0
+            for instance in model._default_manager.order_by("pk").iterator():
+                if options["queue"]:
+                    count += len(jobs.enqueue_documents(instance, fields if options["force"] else None))
+                    continue
+                try:
+                    updated = documents.ingest_instance(instance, fields if options["force"] else None)
+                except Exception as exc:
+                    # Missing, unreadable or malformed file; keep going with the rest.
+                    self.stderr.write(self.style.WARNING(f"{name} #{instance.pk}: {exc}"))
+                    continue
+                if updated:
+                    count += 1
+            if count:
+                cache.bump_generation(model)
+            self.stdout.write(f"{name}: {count} object(s) updated")
+            total += count
+        self.stdout.write(self.style.SUCCESS(f"Updated document info for {total} object(s)."))
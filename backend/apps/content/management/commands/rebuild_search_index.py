@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from apps.content import search
+
+
+class Command(BaseCommand):
+    help = "Rebuild the site-wide search documents from the content tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--kind",
+            action="append",
+            choices=sorted(search.SEARCHABLE),
+            help="Only rebuild this kind (repeatable). Default: all kinds.",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            total = search.rebuild(options["kind"])
+        if isinstance(search.get_backend(), search.SQLiteBackend):
+            with connection.cursor() as cursor:
+                cursor.execute(f"INSERT INTO {search.FTS_TABLE}({search.FTS_TABLE}) VALUES ('optimize')")
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} document(s)."))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.content import siteconfig
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompile the /api/site-config/ snapshot. Admin saves rebuild it automatically; use this "
+        "after bulk imports or raw SQL edits that bypass model signals."
+    )
+
+    def handle(self, *args, **options):
+        snapshot = siteconfig.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Site configuration at version {snapshot.version} ({snapshot.digest[:12]})."))
@@ -0,0 +1,101 @@
+import multiprocessing
+import os
+import socket
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, connections
+from django.db.models import F
+
+from apps.content import jobs, models, spool
+
+
+class Command(BaseCommand):
+    help = (
+        "Process background jobs (image renditions, metadata stripping, PDF ingest) from the "
+        "database queue in a pool of worker processes, and commit spooled contact messages and "
+        "newsletter sign-ups. Safe to run several instances side by side."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=os.cpu_count() or 2,
+            help="Worker processes (default: number of CPUs).",
+        )
+        parser.add_argument(
+            "--poll",
+            type=float,
+            default=2.0,
+            help="Seconds to wait before polling an empty queue again (default: 2).",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit when no job is due instead of polling forever.",
+        )
+
+    def handle(self, *args, **options):
+        processes = max(1, options["processes"])
+        worker = f"{socket.gethostname()}:{os.getpid()}"
+        # Spawned (not forked) so pool processes don't share this process's DB connections;
+        # each sets Django up before unpickling any job function.
+        context = multiprocessing.get_context("spawn")
+        in_flight = {}
+        counts = {models.Job.DONE: 0, models.Job.PENDING: 0, models.Job.FAILED: 0}
+
+        self.stdout.write(f"Worker {worker} running {processes} process(es)")
+        with ProcessPoolExecutor(processes, mp_context=context, initializer=django.setup) as pool:
+            try:
+                while True:
+                    if spool.spool_enabled():
+                        self.flush_spool()
+                    jobs.requeue_stale()
+                    free = processes * 2 - len(in_flight)
+                    for job_id in jobs.claim(worker, free) if free > 0 else []:
+                        in_flight[pool.submit(jobs.execute, job_id)] = job_id
+
+                    if not in_flight:
+                        if options["once"]:
+                            break
+                        connections.close_all()
+                        time.sleep(options["poll"])
+                        continue
+
+                    done, _ = wait(in_flight, timeout=options["poll"], return_when=FIRST_COMPLETED)
+                    for future in done:
+                        job_id = in_flight.pop(future)
+                        try:
+                            error = future.result()
+                        except Exception as exc:  # the pool process itself died
+                            error = repr(exc)
+                        status = jobs.finish(job_id, error)
+                        counts[status] += 1
+                        if error:
+                            self.stderr.write(self.style.WARNING(f"job {job_id} -> {status}: {error.strip().splitlines()[-1]}"))
+            except KeyboardInterrupt:
+                for future, job_id in in_flight.items():
+                    if future.cancel():
+                        models.Job.objects.filter(pk=job_id, status=models.Job.RUNNING).update(
+                            status=models.Job.PENDING, locked_at=None, locked_by="", attempts=F("attempts") - 1,
+                        )
+                self.stdout.write("Interrupted; running jobs will be re-queued once their lock expires.")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{counts[models.Job.DONE]} done, {counts[models.Job.PENDING]} to retry, "
+            f"{counts[models.Job.FAILED]} failed"
+        ))
+
+    def flush_spool(self):
+        try:
+            committed = spool.flush()
+        except DatabaseError as exc:
+            # Records stay spooled and are retried on the next poll.
+            self.stderr.write(self.style.WARNING(f"spool: {exc}"))
+            return
+        for kind, count in committed.items():
+            if count:
+                self.stdout.write(f"spool: committed {count} {kind} record(s)")
@@ -0,0 +1,47 @@
+from collections import namedtuple
+
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from apps.content import urls
+
+
+Route = namedtuple("Route", "prefix viewset basename action url_name detail")
+
+
+def model_for(viewset):
+    queryset = getattr(viewset, "queryset", None)
+    if queryset is not None:
+        return queryset.model
+    return viewset.serializer_class.Meta.model
+
+
+def get_routes(viewset, prefix, basename):
+    """GET routes of one registered viewset: list, retrieve and GET extra actions."""
+    routes = []
+    if hasattr(viewset, "list"):
+        routes.append(Route(prefix, viewset, basename, "list", f"{basename}-list", False))
+    if hasattr(viewset, "retrieve"):
+        routes.append(Route(prefix, viewset, basename, "retrieve", f"{basename}-detail", True))
+    for extra in viewset.get_extra_actions():
+        if "get" in extra.mapping:
+            routes.append(Route(prefix, viewset, basename, extra.__name__, f"{basename}-{extra.url_name}", extra.detail))
+    return routes
+
+
+def registered_viewsets():
+    """``(prefix, viewset, basename)`` for every viewset registered in apps/content/urls.py."""
+    return list(urls.router.registry)
+
+
+def detail_kwargs(viewset, row):
+    lookup = viewset.lookup_url_kwarg or viewset.lookup_field or "pk"
+    return {lookup: getattr(row, viewset.lookup_field or "pk")}
+
+
+def staff_client():
+    """Client authenticated as an (unsaved) staff user, so staff-only GET routes are reachable
+    without session or user queries being added to the measurements."""
+    client = APIClient()
+    client.force_authenticate(get_user_model()(username="route-check", is_staff=True))
+    return client
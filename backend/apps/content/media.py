@@ -0,0 +1,202 @@
+"""Serve uploaded media (PDFs, videos, images) with byte ranges and strong validators.
+
+``django.conf.urls.static`` is development-only and ignores ``Range``, so PDF viewers and
+``<video>`` seeking re-download whole files. ``serve_media`` answers ``Range`` / ``If-Range``
+with ``206 Partial Content`` and streams through ``FileResponse``, which WSGI servers with a
+``wsgi.file_wrapper`` (gunicorn, uWSGI) turn into ``sendfile``. When a front proxy is
+configured the view only checks the path and hands the transfer off:
+
+* ``MEDIA_ACCEL_REDIRECT`` -- nginx internal location prefix for ``X-Accel-Redirect``;
+* ``MEDIA_X_SENDFILE = True`` -- Apache mod_xsendfile / lighttpd ``X-Sendfile``.
+"""
+import hashlib
+import mimetypes
+import os
+import posixpath
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+from django.views.decorators.http import require_safe
+
+
+BLOCK_SIZE = 64 * 1024
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+# Uploads on ContentAddressedStorage (``news/3f/<sha256>.jpg``), renditions
+# (``renditions/3f/<sha256>-640w.webp``) and PDF previews are named by a full SHA-256, so they
+# never change in place and browsers may keep them for a year without revalidating. Anything
+# else, including names that merely contain long digit runs, can be replaced under its name.
+HASHED_NAME = re.compile(r"^[0-9a-f]{64}(?:-\d+w)?\.[0-9a-z]+$")
+RANGE_HEADER = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def cache_control(path):
+    if HASHED_NAME.match(posixpath.basename(path)):
+        return f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"
+    return f"public, max-age={getattr(settings, 'MEDIA_CACHE_MAX_AGE', 3600)}"
+
+
+def file_etag(stat):
+    """Strong ETag from size and mtime (nanoseconds), like nginx's; changes on every rewrite."""
+    token = f"{stat.st_size:x}-{stat.st_mtime_ns:x}"
+    return quote_etag(hashlib.sha256(token.encode("ascii")).hexdigest()[:32])
+
+
+def parse_range(header, size):
+    """Return ``(start, end)`` (inclusive) for a single ``bytes=`` range.
+
+    ``None`` means "ignore the header and send the whole file" (malformed or multi-range
+    requests, which RFC 9110 allows us to treat that way); ``ValueError`` means the range
+    can't be satisfied (416).
+    """
+    match = RANGE_HEADER.match(header.replace(" ", ""))
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if size == 0:  # no byte of an empty file can be selected
+        raise ValueError(header)
+    if not first:  # suffix: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError(header)
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise ValueError(header)
+    return start, end
+
+
+def if_range_matches(request, etag, last_modified):
+    """``If-Range`` holds when it strongly matches the ETag or equals Last-Modified."""
+    value = request.META.get("HTTP_IF_RANGE")
+    if not value:
+        return True
+    value = value.strip()
+    if value.startswith('"'):
+        return value == etag
+    if value.startswith("W/"):
+        return False
+    return parse_http_date_safe(value) == last_modified
+
+
+class RangeFile:
+    """A file positioned at ``start`` whose reads stop after ``length`` bytes.
+
+    ``fileno()`` is passed through so ``wsgi.file_wrapper`` can still ``sendfile`` the
+    slice from the current offset, bounded by the response's ``Content-Length``.
+    """
+
+    def __init__(self, file, start, length):
+        self.file = file
+        self.remaining = length
+        self.name = file.name
+        file.seek(start)
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b""
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+def _proxy_headers(response, path, full_path):
+    accel = getattr(settings, "MEDIA_ACCEL_REDIRECT", "")
+    if accel:
+        # nginx decodes the URI before matching the internal location; names may contain
+        # spaces, "%", "?", "#" or non-ASCII characters.
+        response["X-Accel-Redirect"] = accel.rstrip("/") + "/" + quote(path)
+        return True
+    if getattr(settings, "MEDIA_X_SENDFILE", False):
+        response["X-Sendfile"] = full_path
+        return True
+    return False
+
+
+@require_safe
+def serve_media(request, path):
+    path = posixpath.normpath(path).lstrip("/")
+    full_path = safe_join(settings.MEDIA_ROOT, path)  # SuspiciousFileOperation (400) on traversal
+    try:
+        stat = os.stat(full_path)
+    except OSError:
+        raise Http404("Media file not found")
+    if not os.path.isfile(full_path):
+        raise Http404("Media file not found")
+
+    etag = file_etag(stat)
+    last_modified = int(stat.st_mtime)
+    content_type, encoding = mimetypes.guess_type(full_path)
+    content_type = content_type or "application/octet-stream"
+    validators = {
+        "ETag": etag,
+        "Last-Modified": http_date(last_modified),
+        "Cache-Control": cache_control(path),
+        "Accept-Ranges": "bytes",
+    }
+
+    conditional = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if conditional is not None:
+        for header, value in validators.items():
+            conditional[header] = value
+        return conditional
+
+    offloaded = HttpResponse(content_type=content_type)
+    if _proxy_headers(offloaded, path, full_path):
+        # The proxy serves the body (ranges included) and replaces the empty one sent here.
+        for header, value in validators.items():
+            offloaded[header] = value
+        return offloaded
+
+    size = stat.st_size
+    byte_range = None
+    range_header = request.META.get("HTTP_RANGE")
+    if range_header and if_range_matches(request, etag, last_modified):
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            for header, value in validators.items():
+                response[header] = value
+            return response
+
+    start, end = byte_range or (0, size - 1)
+    length = end - start + 1
+    if request.method == "HEAD":
+        response = HttpResponse(content_type=content_type)
+    else:
+        handle = open(full_path, "rb")
+        body = RangeFile(handle, start, length) if byte_range else handle
+        response = FileResponse(body, content_type=content_type)
+        response.block_size = BLOCK_SIZE
+    if byte_range:
+        response.status_code = 206
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    response["Content-Length"] = str(length)
+    if encoding:
+        # Serve .gz/.br uploads as opaque files rather than letting clients decompress them.
+        response["Content-Type"] = {"gzip": "application/gzip", "br": "application/x-brotli"}.get(
+            encoding, "application/octet-stream"
+        )
+    for header, value in validators.items():
+        response[header] = value
+    return response
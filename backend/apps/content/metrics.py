@@ -0,0 +1,316 @@
+"""Per-request performance metrics for the API.
+
+``MetricsMiddleware`` (apps/content/middleware.py) measures every ``/api/`` request:
+
+* ``total`` -- wall time through the whole middleware stack;
+* ``db`` -- number and time of SQL queries (a ``connection.execute_wrapper``);
+* ``serialize`` -- top-level serializer calls, timed by ``MetricsMixin`` on the viewsets
+  and by the compiled list path, minus queries they trigger;
+* ``render`` -- turning the response data into bytes;
+* ``size`` -- response body in bytes.
+
+They are sent back in a ``Server-Timing`` header, which browser dev tools show per request,
+and folded into per-route histograms. A route is the URL name (``news-list``,
+``public-news-detail``, ``bundle-home``). The histograms cover the last ``METRICS_WINDOW``
+seconds, kept as ten rolling slots. ``/api/_metrics`` serves them, plus cumulative request
+and throttle counters, in the Prometheus text format to staff users or to a scraper sending
+``Authorization: Bearer <METRICS_TOKEN>``.
+
+Everything lives in this process's memory, so each worker reports its own requests.
+"""
+import hmac
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from contextlib import contextmanager
+
+from django.conf import settings
+from rest_framework import permissions
+from rest_framework.renderers import BaseRenderer
+
+from . import throttling
+
+
+API_PREFIX = "/api/"
+SLOTS = 10
+UNMATCHED_ROUTE = "unmatched"
+# Any other method is counted as "other", so clients can't mint new label values.
+METHODS = {"GET", "HEAD", "OPTIONS", "POST", "PUT", "PATCH", "DELETE"}
+METRIC_PREFIX = "piriven_"
+
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 4, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# histogram -> (help, buckets, RequestMetrics attribute)
+HISTOGRAMS = OrderedDict([
+    ("request_duration_seconds", ("Request latency through the whole middleware stack.", DURATION_BUCKETS, "total")),
+    ("db_queries", ("SQL queries per request.", QUERY_BUCKETS, "queries")),
+    ("db_duration_seconds", ("Time spent in SQL queries per request.", DURATION_BUCKETS, "db")),
+    ("serialize_duration_seconds", ("Time spent in serializers per request.", DURATION_BUCKETS, "serialize")),
+    ("render_duration_seconds", ("Time spent rendering the response body per request.", DURATION_BUCKETS, "render")),
+    ("response_size_bytes", ("Response body size.", SIZE_BUCKETS, "size")),
+])
+
+
+def metrics_enabled():
+    return getattr(settings, "METRICS_ENABLED", True)
+
+
+def server_timing_enabled():
+    return getattr(settings, "METRICS_SERVER_TIMING", True)
+
+
+def window():
+    return getattr(settings, "METRICS_WINDOW", 5 * 60)
+
+
+class RequestMetrics:
+    """Measurements of one request; also the database execute wrapper counting its queries."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.total = 0.0
+        self.queries = 0
+        self.db = 0.0
+        self.serialize = 0.0
+        self.render = 0.0
+        self.size = None
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db += time.perf_counter() - started
+            self.queries += 1
+
+    def add(self, phase, seconds):
+        setattr(self, phase, getattr(self, phase) + seconds)
+
+    def finish(self, response):
+        self.total = time.perf_counter() - self.started
+        if response.streaming:
+            length = response.get("Content-Length")
+            self.size = int(length) if length and length.isdigit() else None
+        else:
+            self.size = len(response.content)
+
+    def server_timing(self):
+        entries = [
+            f"total;dur={self.total * 1000:.2f}",
+            f'db;dur={self.db * 1000:.2f};desc="{self.queries} queries"',
+            f"serialize;dur={self.serialize * 1000:.2f}",
+            f"render;dur={self.render * 1000:.2f}",
+        ]
+        if self.size is not None:
+            entries.append(f'size;desc="{self.size} bytes"')
+        return ", ".join(entries)
+
+
+def for_request(request):
+    """The RequestMetrics of ``request`` (a Django or DRF request), or None when not measured."""
+    return getattr(request, "metrics", None) if request is not None else None
+
+
+@contextmanager
+def timer(request, phase):
+    """Add the time spent in the block to ``phase`` of ``request``'s metrics, if it has any.
+
+    Queries run inside the block (a lazy queryset handed to a serializer) count as ``db``,
+    not as ``phase``, so the phases don't overlap.
+    """
+    recorder = for_request(request)
+    if recorder is None:
+        yield
+        return
+    started, db = time.perf_counter(), recorder.db
+    try:
+        yield
+    finally:
+        recorder.add(phase, time.perf_counter() - started - (recorder.db - db))
+
+
+def route_for(request):
+    match = getattr(request, "resolver_match", None)
+    return match.view_name if match is not None and match.view_name else UNMATCHED_ROUTE
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+        self.sum += value
+        self.count += 1
+
+    def merge(self, other):
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.sum += other.sum
+        self.count += other.count
+
+
+class Registry:
+    """Per-route histograms in ``SLOTS`` rolling time slots, plus cumulative request counts."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.slots = deque()  # (slot number, {(route, histogram): Histogram})
+        self.requests = Counter()  # (route, method, status) -> requests
+
+    def _slot_length(self):
+        return max(window() / SLOTS, 0.001)
+
+    def _expire(self, current):
+        while self.slots and self.slots[0][0] <= current - SLOTS:
+            self.slots.popleft()
+
+    def observe(self, route, method, status, recorder):
+        current = int(time.monotonic() // self._slot_length())
+        with self.lock:
+            self._expire(current)
+            if not self.slots or self.slots[-1][0] != current:
+                self.slots.append((current, {}))
+            histograms = self.slots[-1][1]
+            for name, (_, buckets, attribute) in HISTOGRAMS.items():
+                value = getattr(recorder, attribute)
+                if value is None:
+                    continue
+                histogram = histograms.get((route, name))
+                if histogram is None:
+                    histogram = histograms[route, name] = Histogram(buckets)
+                histogram.observe(value)
+            self.requests[route, method, status] += 1
+
+    def snapshot(self):
+        """``({(route, histogram): Histogram merged over the window}, request counts)``."""
+        current = int(time.monotonic() // self._slot_length())
+        merged = {}
+        with self.lock:
+            self._expire(current)
+            for _, histograms in self.slots:
+                for key, histogram in histograms.items():
+                    if key not in merged:
+                        merged[key] = Histogram(histogram.buckets)
+                    merged[key].merge(histogram)
+            requests = dict(self.requests)
+        return merged, requests
+
+    def clear(self):
+        with self.lock:
+            self.slots.clear()
+            self.requests.clear()
+
+
+registry = Registry()
+
+
+def record(request, response, recorder):
+    recorder.finish(response)
+    method = request.method if request.method in METHODS else "other"
+    registry.observe(route_for(request), method, response.status_code, recorder)
+    if server_timing_enabled():
+        response["Server-Timing"] = recorder.server_timing()
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{key}="{_label(value)}"' for key, value in labels.items()) + "}"
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def exposition():
+    """Everything in the Prometheus text exposition format (version 0.0.4)."""
+    merged, requests = registry.snapshot()
+    routes = sorted({route for route, _ in merged})
+    lines = []
+    for name, (help_text, buckets, _) in HISTOGRAMS.items():
+        metric = METRIC_PREFIX + name
+        lines.append(f"# HELP {metric} {help_text} Last {window():g}s, per route.")
+        lines.append(f"# TYPE {metric} histogram")
+        for route in routes:
+            histogram = merged.get((route, name))
+            if histogram is None:
+                continue
+            cumulative = 0
+            for bound, count in zip(buckets, histogram.counts):
+                cumulative += count
+                lines.append(f"{metric}_bucket{_labels(route=route, le=_number(float(bound)))} {cumulative}")
+            lines.append(f"{metric}_bucket{_labels(route=route, le='+Inf')} {histogram.count}")
+            lines.append(f"{metric}_sum{_labels(route=route)} {_number(histogram.sum)}")
+            lines.append(f"{metric}_count{_labels(route=route)} {histogram.count}")
+
+    metric = METRIC_PREFIX + "requests_total"
+    lines.append(f"# HELP {metric} Requests since the worker started.")
+    lines.append(f"# TYPE {metric} counter")
+    for (route, method, status), count in sorted(requests.items()):
+        lines.append(f"{metric}{_labels(route=route, method=method, status=status)} {count}")
+
+    metric = METRIC_PREFIX + "throttle_requests_total"
+    lines.append(f"# HELP {metric} Requests allowed or refused by each rate-limit budget.")
+    lines.append(f"# TYPE {metric} counter")
+    for scope, stats in throttling.counters().items():
+        for outcome in throttling.OUTCOMES:
+            lines.append(f"{metric}{_labels(scope=scope, outcome=outcome)} {stats[outcome]}")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsMixin:
+    """Time the top-level serialization of every serializer the view hands out."""
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        request = self.request
+        if for_request(request) is None:
+            return serializer
+        to_representation = serializer.to_representation
+
+        def timed(instance):
+            with timer(request, "serialize"):
+                return to_representation(instance)
+
+        # Instance attribute: nested children keep their own, untimed, method.
+        serializer.to_representation = timed
+        return serializer
+
+
+class HasMetricsAccess(permissions.BasePermission):
+    """Staff users, or a scraper sending ``Authorization: Bearer <METRICS_TOKEN>``."""
+
+    def has_permission(self, request, view):
+        token = getattr(settings, "METRICS_TOKEN", "")
+        if token:
+            header = request.META.get("HTTP_AUTHORIZATION", "")
+            if hmac.compare_digest(header.encode("utf-8"), f"Bearer {token}".encode("utf-8")):
+                return True
+        return bool(request.user and request.user.is_staff)
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class PrometheusRenderer(BaseRenderer):
+    media_type = "text/plain"
+    format = "prometheus"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, dict):  # error responses, e.g. 403
+            data = f"# {data.get('detail', data)}\n"
+        return data.encode(self.charset)
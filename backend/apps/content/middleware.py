@@ -0,0 +1,64 @@
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from django.urls import resolve
+
+from . import metrics
+
+
+class MetricsMiddleware:
+    """Measure every API request (apps/content/metrics.py): latency, SQL queries, render time
+    and response size, reported in ``Server-Timing`` and the per-route histograms.
+
+    First in ``MIDDLEWARE``, so the total covers the whole stack, the public API included.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not metrics.metrics_enabled() or not request.path_info.startswith(metrics.API_PREFIX):
+            return self.get_response(request)
+        recorder = request.metrics = metrics.RequestMetrics()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+        metrics.record(request, response, recorder)
+        return response
+
+    def process_template_response(self, request, response):
+        # Runs last among these hooks, right before Django renders the DRF response.
+        recorder = metrics.for_request(request)
+        if recorder is not None:
+            started = time.perf_counter()
+            response.add_post_render_callback(lambda rendered: recorder.add("render", time.perf_counter() - started))
+        return response
+
+
+class PublicAPIMiddleware:
+    """Answer the read-only public API (``PUBLIC_API_PREFIX``) right here, skipping every
+    middleware listed after this one.
+
+    Public GETs never use sessions, CSRF, authentication, messages or frame options, so
+    placing this after CORS, security and common middleware leaves exactly the stack those
+    requests need. Everything else continues down the normal chain.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefix = settings.PUBLIC_API_PREFIX
+
+    def __call__(self, request):
+        if not request.path_info.startswith(self.prefix):
+            return self.get_response(request)
+        # What BaseHandler does for a view, minus the view/template-response middleware hooks.
+        match = resolve(request.path_info)  # Resolver404 -> 404 via the handler
+        request.resolver_match = match
+        response = match.func(request, *match.args, **match.kwargs)
+        if callable(getattr(response, "render", None)):
+            with metrics.timer(request, "render"):
+                response = response.render()
+        return response
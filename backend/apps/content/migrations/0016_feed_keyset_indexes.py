@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0015_newsimage_noticeimage'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['-published_at', '-id'], name='news_published_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newslettersubscription',
+            index=models.Index(fields=['-created_at', '-id'], name='newsletter_created_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='publication',
+            index=models.Index(fields=['is_active', '-published_at', '-id'], name='pub_active_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='video',
+            index=models.Index(fields=['-published_at', '-id'], name='video_published_keyset_idx'),
+        ),
+    ]
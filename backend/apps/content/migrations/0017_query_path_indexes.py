@@ -0,0 +1,115 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:55
+
+from django.db import migrations, models
+
+
+# LibraryPublicationEntry is unmanaged (its table predates this app), so the autodetector
+# ignores its Meta.indexes. Create them directly when the table exists.
+LIBRARY_ENTRY_INDEXES = [
+    models.Index(fields=['is_active', '-published_at', '-created_at'], name='book_active_published_idx'),
+    models.Index(
+        fields=['is_active', '-published_at', '-created_at'],
+        condition=models.Q(is_featured=True),
+        name='book_featured_published_idx',
+    ),
+    models.Index(fields=['year'], name='book_year_idx'),
+]
+
+
+def _library_entry_constraints(apps, schema_editor):
+    model = apps.get_model('content', 'LibraryPublicationEntry')
+    connection = schema_editor.connection
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        if table not in connection.introspection.table_names(cursor):
+            return model, None
+        return model, connection.introspection.get_constraints(cursor, table)
+
+
+def add_library_indexes(apps, schema_editor):
+    model, existing = _library_entry_constraints(apps, schema_editor)
+    if existing is None:
+        return
+    for index in LIBRARY_ENTRY_INDEXES:
+        if index.name not in existing:
+            schema_editor.add_index(model, index)
+
+
+def remove_library_indexes(apps, schema_editor):
+    model, existing = _library_entry_constraints(apps, schema_editor)
+    if existing is None:
+        return
+    for index in LIBRARY_ENTRY_INDEXES:
+        if index.name in existing:
+            schema_editor.remove_index(model, index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0016_feed_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='aboutsection',
+            index=models.Index(fields=['is_active', 'position', 'created_at'], name='about_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='album',
+            index=models.Index(fields=['is_active', 'position', '-published_at', '-created_at'], name='album_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['-created_at'], name='contact_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='downloadcategory',
+            index=models.Index(fields=['position', 'name'], name='downloadcat_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['start_date'], name='event_start_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='externallink',
+            index=models.Index(fields=['position', 'name'], name='extlink_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='footerabout',
+            index=models.Index(fields=['is_active', '-updated_at'], name='footerabout_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='footerlink',
+            index=models.Index(fields=['is_active', 'position', 'name'], name='footerlink_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryimage',
+            index=models.Index(fields=['album', 'position', 'created_at'], name='gallery_album_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='herointro',
+            index=models.Index(fields=['is_active', '-updated_at'], name='herointro_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='heroslide',
+            index=models.Index(fields=['position', '-created_at'], name='heroslide_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(condition=models.Q(('is_featured', True)), fields=['-published_at'], name='news_featured_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notice',
+            index=models.Index(fields=['-published_at', '-priority'], name='notice_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='publication',
+            index=models.Index(fields=['category', 'is_active', '-published_at', '-created_at'], name='pub_category_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sitetextsnippet',
+            index=models.Index(fields=['is_active', 'key'], name='snippet_active_key_idx'),
+        ),
+        migrations.RunPython(add_library_indexes, remove_library_indexes),
+    ]
@@ -0,0 +1,109 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:57
+
+from django.db import migrations, models
+
+
+FTS_TABLE = 'content_searchdocument_fts'
+
+SQLITE_CREATE = [
+    # Sinhala words contain combining vowel signs (M*) and zero-width joiners (Cf);
+    # treat them as token characters so words are not split apart.
+    # Prefix indexes keep typeahead (last token matched as a prefix) from expanding
+    # into a scan of every term in the vocabulary.
+    f"""CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        kind UNINDEXED, title, title_si, body, body_si,
+        content='content_searchdocument', content_rowid='id',
+        tokenize="unicode61 categories 'L* N* Co M* Cf'",
+        prefix='2 3 4'
+    )""",
+    # Titles outrank bodies; ORDER BY rank then uses these weights.
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rank) VALUES ('rank', 'bm25(10.0, 10.0, 1.0, 1.0)')",
+    f"""CREATE TRIGGER content_searchdocument_ai AFTER INSERT ON content_searchdocument BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, kind, title, title_si, body, body_si)
+        VALUES (new.id, new.kind, new.title, new.title_si, new.body, new.body_si);
+    END""",
+    f"""CREATE TRIGGER content_searchdocument_ad AFTER DELETE ON content_searchdocument BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, kind, title, title_si, body, body_si)
+        VALUES ('delete', old.id, old.kind, old.title, old.title_si, old.body, old.body_si);
+    END""",
+    f"""CREATE TRIGGER content_searchdocument_au AFTER UPDATE ON content_searchdocument BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, kind, title, title_si, body, body_si)
+        VALUES ('delete', old.id, old.kind, old.title, old.title_si, old.body, old.body_si);
+        INSERT INTO {FTS_TABLE}(rowid, kind, title, title_si, body, body_si)
+        VALUES (new.id, new.kind, new.title, new.title_si, new.body, new.body_si);
+    END""",
+]
+SQLITE_DROP = [
+    'DROP TRIGGER IF EXISTS content_searchdocument_au',
+    'DROP TRIGGER IF EXISTS content_searchdocument_ad',
+    'DROP TRIGGER IF EXISTS content_searchdocument_ai',
+    f'DROP TABLE IF EXISTS {FTS_TABLE}',
+]
+
+# Same expression as apps.content.search.PG_VECTOR so the planner can use the index.
+POSTGRES_CREATE = [
+    """CREATE INDEX content_searchdocument_tsv_idx ON content_searchdocument USING GIN ((
+        setweight(to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(title_si, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(body, '') || ' ' || coalesce(body_si, '')), 'B')
+    ))""",
+]
+POSTGRES_DROP = ['DROP INDEX IF EXISTS content_searchdocument_tsv_idx']
+
+
+def _run(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute('PRAGMA compile_options')
+            if 'ENABLE_FTS5' not in {row[0] for row in cursor.fetchall()}:
+                return  # search falls back to icontains
+        _run(schema_editor, SQLITE_CREATE)
+    elif vendor == 'postgresql':
+        _run(schema_editor, POSTGRES_CREATE)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        _run(schema_editor, SQLITE_DROP)
+    elif vendor == 'postgresql':
+        _run(schema_editor, POSTGRES_DROP)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0017_query_path_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('kind', models.CharField(max_length=32)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('title', models.CharField(blank=True, max_length=255)),
+                ('title_si', models.CharField(blank=True, max_length=255)),
+                ('body', models.TextField(blank=True)),
+                ('body_si', models.TextField(blank=True)),
+                ('summary', models.TextField(blank=True)),
+                ('summary_si', models.TextField(blank=True)),
+                ('slug', models.CharField(blank=True, max_length=255)),
+                ('published_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Search document',
+                'verbose_name_plural': 'Search documents',
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='searchdoc_kind_object_uniq')],
+            },
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
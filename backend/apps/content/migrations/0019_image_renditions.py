@@ -0,0 +1,83 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:15
+
+from django.db import migrations, models
+
+
+# LibraryPublicationEntry is unmanaged, so add its column directly when the table exists.
+LIBRARY_ENTRY_TABLE = 'library_publicationentry'
+LIBRARY_ENTRY_COLUMN = 'cover_renditions'
+
+
+def _library_columns(schema_editor):
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        if LIBRARY_ENTRY_TABLE not in connection.introspection.table_names(cursor):
+            return None
+        return {column.name for column in connection.introspection.get_table_description(cursor, LIBRARY_ENTRY_TABLE)}
+
+
+def add_library_column(apps, schema_editor):
+    columns = _library_columns(schema_editor)
+    if columns is None or LIBRARY_ENTRY_COLUMN in columns:
+        return
+    column_type = models.JSONField().db_type(schema_editor.connection)
+    schema_editor.execute(
+        f"ALTER TABLE {schema_editor.quote_name(LIBRARY_ENTRY_TABLE)} "
+        f"ADD COLUMN {schema_editor.quote_name(LIBRARY_ENTRY_COLUMN)} {column_type} NOT NULL DEFAULT '{{}}'"
+    )
+
+
+def remove_library_column(apps, schema_editor):
+    columns = _library_columns(schema_editor)
+    if columns is None or LIBRARY_ENTRY_COLUMN not in columns:
+        return
+    schema_editor.execute(
+        f"ALTER TABLE {schema_editor.quote_name(LIBRARY_ENTRY_TABLE)} "
+        f"DROP COLUMN {schema_editor.quote_name(LIBRARY_ENTRY_COLUMN)}"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0018_search_document'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='album',
+            name='cover_renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='galleryimage',
+            name='image_renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='heroslide',
+            name='image_renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='image_renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='newsimage',
+            name='image_renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='publication',
+            name='cover_renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='video',
+            name='thumbnail_renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.RunPython(add_library_column, remove_library_column),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0020_background_jobs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='album',
+            name='cover_placeholder',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='galleryimage',
+            name='image_placeholder',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='heroslide',
+            name='image_placeholder',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='newsimage',
+            name='image_placeholder',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='noticeimage',
+            name='image_placeholder',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:29
+
+import apps.content.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0022_document_info'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='album',
+            name='cover',
+            field=models.ImageField(blank=True, null=True, storage=apps.content.storage.content_storage, upload_to='albums/covers/'),
+        ),
+        migrations.AlterField(
+            model_name='galleryimage',
+            name='image',
+            field=models.ImageField(storage=apps.content.storage.content_storage, upload_to='albums/images/'),
+        ),
+        migrations.AlterField(
+            model_name='heroslide',
+            name='image',
+            field=models.ImageField(storage=apps.content.storage.content_storage, upload_to='slides'),
+        ),
+        migrations.AlterField(
+            model_name='news',
+            name='image',
+            field=models.ImageField(blank=True, null=True, storage=apps.content.storage.content_storage, upload_to='news'),
+        ),
+        migrations.AlterField(
+            model_name='newsimage',
+            name='image',
+            field=models.ImageField(storage=apps.content.storage.content_storage, upload_to='news/gallery'),
+        ),
+        migrations.AlterField(
+            model_name='notice',
+            name='image',
+            field=models.ImageField(blank=True, null=True, storage=apps.content.storage.content_storage, upload_to='notice'),
+        ),
+        migrations.AlterField(
+            model_name='noticeimage',
+            name='image',
+            field=models.ImageField(storage=apps.content.storage.content_storage, upload_to='notice/gallery'),
+        ),
+        migrations.AlterField(
+            model_name='publication',
+            name='cover',
+            field=models.ImageField(blank=True, null=True, storage=apps.content.storage.content_storage, upload_to='publication_covers'),
+        ),
+        migrations.AlterField(
+            model_name='publication',
+            name='file',
+            field=models.FileField(storage=apps.content.storage.content_storage, upload_to='publications'),
+        ),
+        migrations.AlterField(
+            model_name='video',
+            name='file',
+            field=models.FileField(blank=True, help_text='Upload MP4/WebM etc. Leave empty if using a URL.', null=True, storage=apps.content.storage.content_storage, upload_to='videos'),
+        ),
+        migrations.AlterField(
+            model_name='video',
+            name='thumbnail',
+            field=models.ImageField(blank=True, null=True, storage=apps.content.storage.content_storage, upload_to='video_thumbs'),
+        ),
+    ]
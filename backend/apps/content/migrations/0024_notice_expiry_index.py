@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0023_content_addressed_storage'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notice',
+            index=models.Index(fields=['expires_at', '-published_at', '-priority'], name='notice_expiry_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0024_notice_expiry_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SiteConfigSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('version', models.PositiveBigIntegerField(default=0)),
+                ('digest', models.CharField(blank=True, help_text='SHA-256 of the compiled data', max_length=64)),
+                ('data', models.JSONField(blank=True, default=dict)),
+            ],
+            options={
+                'verbose_name': 'Site configuration snapshot',
+                'verbose_name_plural': 'Site configuration snapshot',
+            },
+        ),
+    ]
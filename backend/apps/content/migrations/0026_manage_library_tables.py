@@ -0,0 +1,107 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:40
+
+import apps.content.storage
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# The library tables predate this app and its models were unmanaged, so the migration state
+# never followed their later fields and indexes, and a fresh database never got the tables.
+# Bring the state up to date, then create the tables when they are missing or add whatever
+# columns and indexes an existing database lacks. Reversing leaves the tables in place.
+LIBRARY_MODELS = ['LibraryPublicationCategory', 'LibraryPublicationEntry', 'LibraryPublicationImage']
+
+
+def create_library_tables(apps, schema_editor):
+    connection = schema_editor.connection
+    for name in LIBRARY_MODELS:
+        model = apps.get_model('content', name)
+        table = model._meta.db_table
+        with connection.cursor() as cursor:
+            if table not in connection.introspection.table_names(cursor):
+                schema_editor.create_model(model)
+                continue
+            columns = {column.name for column in connection.introspection.get_table_description(cursor, table)}
+        for field in model._meta.local_fields:
+            if field.column not in columns:
+                schema_editor.add_field(model, field)
+        # Read indexes after adding columns: SQLite rebuilds the table (indexes included) to add one.
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, table)
+        for index in model._meta.indexes:
+            if index.name not in constraints:
+                schema_editor.add_index(model, index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0025_site_config_snapshot'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterModelOptions(
+                    name='librarypublicationcategory',
+                    options={'ordering': ['position', 'name'], 'verbose_name': 'Book category', 'verbose_name_plural': 'Book categories'},
+                ),
+                migrations.AlterModelOptions(
+                    name='librarypublicationentry',
+                    options={'ordering': ['-published_at', '-created_at'], 'verbose_name': 'Book (Library)', 'verbose_name_plural': 'Books (Library)'},
+                ),
+                migrations.AlterModelOptions(
+                    name='librarypublicationimage',
+                    options={'ordering': ['created_at'], 'verbose_name': 'Publication Image', 'verbose_name_plural': 'Publication Images'},
+                ),
+                migrations.AddField(
+                    model_name='librarypublicationentry',
+                    name='category',
+                    field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='publications', to='content.librarypublicationcategory'),
+                ),
+                migrations.AddField(
+                    model_name='librarypublicationentry',
+                    name='cover_renditions',
+                    field=models.JSONField(blank=True, default=dict, editable=False),
+                ),
+                migrations.AddField(
+                    model_name='librarypublicationentry',
+                    name='pdf_file_info',
+                    field=models.JSONField(blank=True, default=dict, editable=False),
+                ),
+                migrations.AddField(
+                    model_name='librarypublicationimage',
+                    name='publication',
+                    field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='images', to='content.librarypublicationentry'),
+                ),
+                migrations.AlterField(
+                    model_name='librarypublicationentry',
+                    name='cover',
+                    field=models.ImageField(blank=True, null=True, storage=apps.content.storage.content_storage, upload_to='publication_covers/'),
+                ),
+                migrations.AlterField(
+                    model_name='librarypublicationentry',
+                    name='pdf_file',
+                    field=models.FileField(blank=True, help_text='Optional PDF for the book', null=True, storage=apps.content.storage.content_storage, upload_to='publications/'),
+                ),
+                migrations.AlterField(
+                    model_name='librarypublicationimage',
+                    name='image',
+                    field=models.ImageField(storage=apps.content.storage.content_storage, upload_to='publication_images/'),
+                ),
+                migrations.AddIndex(
+                    model_name='librarypublicationentry',
+                    index=models.Index(fields=['is_active', '-published_at', '-created_at'], name='book_active_published_idx'),
+                ),
+                migrations.AddIndex(
+                    model_name='librarypublicationentry',
+                    index=models.Index(condition=models.Q(('is_featured', True)), fields=['is_active', '-published_at', '-created_at'], name='book_featured_published_idx'),
+                ),
+                migrations.AddIndex(
+                    model_name='librarypublicationentry',
+                    index=models.Index(fields=['year'], name='book_year_idx'),
+                ),
+            ],
+        ),
+        migrations.RunPython(create_library_tables, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0026_manage_library_tables'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contactmessage',
+            name='submission_id',
+            field=models.UUIDField(blank=True, editable=False, help_text='Spool record id (see apps/content/spool.py); makes replayed submissions a no-op', null=True, unique=True),
+        ),
+    ]
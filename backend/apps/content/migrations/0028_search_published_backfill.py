@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:14
+
+from django.db import migrations, models
+
+from apps.content import search
+
+
+def backfill_search_documents(apps, schema_editor):
+    """Index rows that existed before 0018; later ones were indexed by the model signals.
+
+    Kinds that already have documents (say, after ``manage.py rebuild_search_index``) are
+    left alone.
+    """
+    SearchDocument = apps.get_model('content', 'SearchDocument')
+    for kind, spec in search.SEARCHABLE.items():
+        if SearchDocument.objects.filter(kind=kind).exists():
+            continue
+        model = apps.get_model('content', spec.model.__name__)
+        batch = []
+        for obj in model._default_manager.order_by('pk').iterator(chunk_size=500):
+            if spec.visible and not spec.visible(obj):
+                continue
+            batch.append(SearchDocument(kind=kind, object_id=obj.pk, **search.document_values(kind, obj)))
+            if len(batch) >= 500:
+                SearchDocument.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            SearchDocument.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0027_contact_submission_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='searchdocument',
+            index=models.Index(fields=['-published_at', '-id'], name='searchdoc_published_idx'),
+        ),
+        migrations.RunPython(backfill_search_documents, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,10 @@
 from django.db import models
+from django.utils import timezone
 from django.utils.text import slugify
 from django.core.exceptions import ValidationError
 
+from .storage import content_storage
+
 
 class TimeStamped(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
@@ -15,7 +18,8 @@ class News(TimeStamped):
     title = models.CharField(max_length=255)
     title_si = models.CharField(max_length=255, blank=True)
     slug = models.SlugField(max_length=255, unique=True, blank=True)
-    image = models.ImageField(upload_to="news", blank=True, null=True)
+    image = models.ImageField(upload_to="news", storage=content_storage, blank=True, null=True)
+    image_renditions = models.JSONField(default=dict, blank=True, editable=False)
     excerpt = models.TextField(blank=True)
     excerpt_si = models.TextField(blank=True)
     content = models.TextField()
@@ -25,6 +29,14 @@ class News(TimeStamped):
 
     class Meta:
         verbose_name_plural = "News"
+        indexes = [
+            models.Index(fields=["-published_at", "-id"], name="news_published_keyset_idx"),
+            models.Index(
+                fields=["-published_at"],
+                condition=models.Q(is_featured=True),
+                name="news_featured_published_idx",
+            ),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.slug:
@@ -37,7 +49,9 @@ class News(TimeStamped):
 
 class NewsImage(TimeStamped):
     news = models.ForeignKey(News, on_delete=models.CASCADE, related_name="gallery_images")
-    image = models.ImageField(upload_to="news/gallery")
+    image = models.ImageField(upload_to="news/gallery", storage=content_storage)
+    image_renditions = models.JSONField(default=dict, blank=True, editable=False)
+    image_placeholder = models.JSONField(default=dict, blank=True, editable=False)
     caption = models.CharField(max_length=255, blank=True)
     caption_si = models.CharField(max_length=255, blank=True)
     position = models.PositiveIntegerField(default=0)
@@ -51,18 +65,36 @@ class NewsImage(TimeStamped):
         return self.caption or f"Image for {self.news.title}"
 
 
+class NoticeQuerySet(models.QuerySet):
+    def current(self, now=None):
+        """Notices that never expire or haven't expired yet."""
+        now = now or timezone.now()
+        return self.filter(models.Q(expires_at__isnull=True) | models.Q(expires_at__gt=now))
+
+    def next_expiry(self, now=None):
+        """The earliest ``expires_at`` still in the future, or None."""
+        now = now or timezone.now()
+        return self.filter(expires_at__gt=now).aggregate(next=models.Min("expires_at"))["next"]
+
+
 class Notice(TimeStamped):
     title = models.CharField(max_length=255)
     title_si = models.CharField(max_length=255, blank=True)
     content = models.TextField()
     content_si = models.TextField(blank=True)
-    image = models.ImageField(upload_to="notice", blank=True, null=True)
+    image = models.ImageField(upload_to="notice", storage=content_storage, blank=True, null=True)
     published_at = models.DateTimeField()
     expires_at = models.DateTimeField(blank=True, null=True)
     priority = models.PositiveIntegerField(default=0)
 
+    objects = NoticeQuerySet.as_manager()
+
     class Meta:
         ordering = ["-published_at", "-priority"]
+        indexes = [
+            models.Index(fields=["-published_at", "-priority"], name="notice_published_idx"),
+            models.Index(fields=["expires_at", "-published_at", "-priority"], name="notice_expiry_idx"),
+        ]
 
     def __str__(self):
         return self.title
@@ -70,7 +102,8 @@ class Notice(TimeStamped):
 
 class NoticeImage(TimeStamped):
     notice = models.ForeignKey(Notice, on_delete=models.CASCADE, related_name="gallery_images")
-    image = models.ImageField(upload_to="notice/gallery")
+    image = models.ImageField(upload_to="notice/gallery", storage=content_storage)
+    image_placeholder = models.JSONField(default=dict, blank=True, editable=False)
     caption = models.CharField(max_length=255, blank=True)
     caption_si = models.CharField(max_length=255, blank=True)
     position = models.PositiveIntegerField(default=0)
@@ -89,11 +122,13 @@ class Publication(TimeStamped):
     title_si = models.CharField(max_length=255, blank=True)
     description = models.TextField(blank=True)
     description_si = models.TextField(blank=True)
-    file = models.FileField(upload_to="publications")
+    file = models.FileField(upload_to="publications", storage=content_storage)
+    file_info = models.JSONField(default=dict, blank=True, editable=False)
     external_url = models.URLField(blank=True, help_text="Optional external link instead of file")
     published_at = models.DateTimeField()
     is_active = models.BooleanField(default=True)
-    cover = models.ImageField(upload_to="publication_covers", blank=True, null=True)
+    cover = models.ImageField(upload_to="publication_covers", storage=content_storage, blank=True, null=True)
+    cover_renditions = models.JSONField(default=dict, blank=True, editable=False)
     department = models.CharField(max_length=255, blank=True)
     department_si = models.CharField(max_length=255, blank=True)
     # Category is added below via DownloadCategory foreign key once the model is declared
@@ -101,6 +136,14 @@ class Publication(TimeStamped):
     class Meta:
         verbose_name = "Downloadable file"
         verbose_name_plural = "Downloadable files"
+        indexes = [
+            models.Index(fields=["is_active", "-published_at", "-id"], name="pub_active_keyset_idx"),
+            # DownloadCategoryViewSet prefetch: category IN (...) AND is_active ORDER BY -published_at, -created_at
+            models.Index(
+                fields=["category", "is_active", "-published_at", "-created_at"],
+                name="pub_category_active_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -115,6 +158,7 @@ class Video(TimeStamped):
     )
     file = models.FileField(
         upload_to="videos",
+        storage=content_storage,
         blank=True,
         null=True,
         help_text="Upload MP4/WebM etc. Leave empty if using a URL."
@@ -122,7 +166,13 @@ class Video(TimeStamped):
     description = models.TextField(blank=True)
     description_si = models.TextField(blank=True)
     published_at = models.DateTimeField()
-    thumbnail = models.ImageField(upload_to="video_thumbs", blank=True, null=True)
+    thumbnail = models.ImageField(upload_to="video_thumbs", storage=content_storage, blank=True, null=True)
+    thumbnail_renditions = models.JSONField(default=dict, blank=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["-published_at", "-id"], name="video_published_keyset_idx"),
+        ]
 
     def clean(self):
         # Ensure at least one of file/url is set
@@ -147,13 +197,21 @@ class Album(TimeStamped):
     slug = models.SlugField(max_length=220, unique=True, blank=True)
     description = models.TextField(blank=True)
     description_si = models.TextField(blank=True)
-    cover = models.ImageField(upload_to="albums/covers/", blank=True, null=True)
+    cover = models.ImageField(upload_to="albums/covers/", storage=content_storage, blank=True, null=True)
+    cover_renditions = models.JSONField(default=dict, blank=True, editable=False)
+    cover_placeholder = models.JSONField(default=dict, blank=True, editable=False)
     is_active = models.BooleanField(default=True)
     position = models.PositiveIntegerField(default=0)
     published_at = models.DateField(blank=True, null=True)
 
     class Meta:
         ordering = ["position", "-published_at", "-created_at"]
+        indexes = [
+            models.Index(
+                fields=["is_active", "position", "-published_at", "-created_at"],
+                name="album_active_order_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -165,13 +223,18 @@ class Album(TimeStamped):
 
 class GalleryImage(TimeStamped):
     album = models.ForeignKey(Album, on_delete=models.CASCADE, related_name="images")
-    image = models.ImageField(upload_to="albums/images/")
+    image = models.ImageField(upload_to="albums/images/", storage=content_storage)
+    image_renditions = models.JSONField(default=dict, blank=True, editable=False)
+    image_placeholder = models.JSONField(default=dict, blank=True, editable=False)
     caption = models.CharField(max_length=255, blank=True)
     caption_si = models.CharField(max_length=255, blank=True)
     position = models.PositiveIntegerField(default=0)
 
     class Meta:
         ordering = ["position", "created_at"]
+        indexes = [
+            models.Index(fields=["album", "position", "created_at"], name="gallery_album_order_idx"),
+        ]
 
     def __str__(self):
         return f"{self.album.title} - {self.caption or self.image.name}"
@@ -185,6 +248,11 @@ class Event(TimeStamped):
     start_date = models.DateField()
     end_date = models.DateField(blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["start_date"], name="event_start_date_idx"),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -207,6 +275,9 @@ class ExternalLink(TimeStamped):
 
     class Meta:
         ordering = ["position", "name"]
+        indexes = [
+            models.Index(fields=["position", "name"], name="extlink_order_idx"),
+        ]
 
     def __str__(self):
         return self.name
@@ -223,6 +294,9 @@ class FooterLink(TimeStamped):
         ordering = ["position", "name"]
         verbose_name = "Footer link"
         verbose_name_plural = "Footer links"
+        indexes = [
+            models.Index(fields=["is_active", "position", "name"], name="footerlink_active_order_idx"),
+        ]
 
     def __str__(self):
         return self.name
@@ -233,7 +307,9 @@ class HeroSlide(TimeStamped):
     title_si = models.CharField(max_length=255, blank=True)
     subtitle = models.CharField(max_length=255, blank=True)
     subtitle_si = models.CharField(max_length=255, blank=True)
-    image = models.ImageField(upload_to="slides")
+    image = models.ImageField(upload_to="slides", storage=content_storage)
+    image_renditions = models.JSONField(default=dict, blank=True, editable=False)
+    image_placeholder = models.JSONField(default=dict, blank=True, editable=False)
     button_label = models.CharField(max_length=100, blank=True)
     button_label_si = models.CharField(max_length=100, blank=True)
     button_url = models.URLField(blank=True)
@@ -241,6 +317,9 @@ class HeroSlide(TimeStamped):
 
     class Meta:
         ordering = ["position", "-created_at"]
+        indexes = [
+            models.Index(fields=["position", "-created_at"], name="heroslide_order_idx"),
+        ]
 
     def __str__(self):
         return self.title
@@ -249,6 +328,11 @@ class HeroSlide(TimeStamped):
 class NewsletterSubscription(TimeStamped):
     email = models.EmailField(unique=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="newsletter_created_keyset_idx"),
+        ]
+
     def __str__(self):
         return self.email
 
@@ -262,10 +346,19 @@ class DownloadCategory(TimeStamped):
 
     class Meta:
         ordering = ["position", "name"]
+        indexes = [
+            models.Index(fields=["position", "name"], name="downloadcat_order_idx"),
+        ]
 
     def __str__(self):
         return self.name
 
+    @property
+    def listed_publications(self):
+        """Publications nested in API responses: the view's top-N prefetch when it made one."""
+        top = getattr(self, "top_publications", None)
+        return top if top is not None else self.publications.all()
+
 
 # Link Publication to DownloadCategory
 Publication.add_to_class(
@@ -297,7 +390,6 @@ class LibraryPublicationCategory(TimeStamped):
         verbose_name = "Book category"
         verbose_name_plural = "Book categories"
         db_table = "library_publicationcategory"
-        managed = False
 
     def __str__(self):
         return self.name
@@ -320,8 +412,10 @@ class LibraryPublicationEntry(TimeStamped):
     description = models.TextField(blank=True)
     description_si = models.TextField(blank=True)
 
-    cover = models.ImageField(upload_to="publication_covers/", blank=True, null=True)
-    pdf_file = models.FileField(upload_to="publications/", blank=True, null=True, help_text="Optional PDF for the book")
+    cover = models.ImageField(upload_to="publication_covers/", storage=content_storage, blank=True, null=True)
+    cover_renditions = models.JSONField(default=dict, blank=True, editable=False)
+    pdf_file = models.FileField(upload_to="publications/", storage=content_storage, blank=True, null=True, help_text="Optional PDF for the book")
+    pdf_file_info = models.JSONField(default=dict, blank=True, editable=False)
     external_url = models.URLField(blank=True, help_text="If provided, link to this instead of pdf_file")
 
     published_at = models.DateField(null=True, blank=True)
@@ -330,10 +424,18 @@ class LibraryPublicationEntry(TimeStamped):
 
     class Meta:
         ordering = ["-published_at", "-created_at"]
+        indexes = [
+            models.Index(fields=["is_active", "-published_at", "-created_at"], name="book_active_published_idx"),
+            models.Index(
+                fields=["is_active", "-published_at", "-created_at"],
+                condition=models.Q(is_featured=True),
+                name="book_featured_published_idx",
+            ),
+            models.Index(fields=["year"], name="book_year_idx"),
+        ]
         verbose_name = "Book (Library)"
         verbose_name_plural = "Books (Library)"
         db_table = "library_publicationentry"
-        managed = False
 
     def clean(self):
         if not self.pdf_file and not self.external_url:
@@ -351,7 +453,7 @@ class LibraryPublicationEntry(TimeStamped):
 
 class LibraryPublicationImage(TimeStamped):
     publication = models.ForeignKey("LibraryPublicationEntry", on_delete=models.CASCADE, related_name="images")
-    image = models.ImageField(upload_to="publication_images/")
+    image = models.ImageField(upload_to="publication_images/", storage=content_storage)
     caption = models.CharField(max_length=255, blank=True)
     caption_si = models.CharField(max_length=255, blank=True)
 
@@ -360,7 +462,6 @@ class LibraryPublicationImage(TimeStamped):
         verbose_name = "Publication Image"
         verbose_name_plural = "Publication Images"
         db_table = "library_publicationimage"
-        managed = False
 
     def __str__(self):
         return f"Image for {self.publication.title}"
@@ -382,6 +483,9 @@ class HeroIntro(TimeStamped):
     is_active = models.BooleanField(default=True)
 
     class Meta:
+        indexes = [
+            models.Index(fields=["is_active", "-updated_at"], name="herointro_active_idx"),
+        ]
         verbose_name = "Hero intro"
         verbose_name_plural = "Hero intro"
 
@@ -402,6 +506,9 @@ class AboutSection(TimeStamped):
 
     class Meta:
         ordering = ["position", "nav_label"]
+        indexes = [
+            models.Index(fields=["is_active", "position", "created_at"], name="about_active_order_idx"),
+        ]
         verbose_name = "About section"
         verbose_name_plural = "About sections"
 
@@ -419,6 +526,9 @@ class SiteTextSnippet(TimeStamped):
 
     class Meta:
         ordering = ["key"]
+        indexes = [
+            models.Index(fields=["is_active", "key"], name="snippet_active_key_idx"),
+        ]
         verbose_name = "Site text snippet"
         verbose_name_plural = "Site text snippets"
 
@@ -432,9 +542,16 @@ class ContactMessage(TimeStamped):
     subject = models.CharField(max_length=255, blank=True)
     message = models.TextField()
     is_handled = models.BooleanField(default=False)
+    submission_id = models.UUIDField(
+        unique=True, blank=True, null=True, editable=False,
+        help_text="Spool record id (see apps/content/spool.py); makes replayed submissions a no-op",
+    )
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at"], name="contact_created_idx"),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.subject or 'Message'}"
@@ -485,6 +602,9 @@ class FooterAbout(TimeStamped):
 
     class Meta:
         ordering = ["-updated_at", "-created_at"]
+        indexes = [
+            models.Index(fields=["is_active", "-updated_at"], name="footerabout_active_idx"),
+        ]
         verbose_name = "Footer about"
         verbose_name_plural = "Footer about"
 
@@ -499,3 +619,88 @@ class FooterAbout(TimeStamped):
 
 
 
+
+
+class SearchDocument(TimeStamped):
+    """Flattened, bilingual copy of a searchable object (see apps/content/search.py)."""
+
+    kind = models.CharField(max_length=32)
+    object_id = models.PositiveBigIntegerField()
+    title = models.CharField(max_length=255, blank=True)
+    title_si = models.CharField(max_length=255, blank=True)
+    body = models.TextField(blank=True)
+    body_si = models.TextField(blank=True)
+    summary = models.TextField(blank=True)
+    summary_si = models.TextField(blank=True)
+    slug = models.CharField(max_length=255, blank=True)
+    published_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "object_id"], name="searchdoc_kind_object_uniq"),
+        ]
+        indexes = [
+            # Search ranks only the newest matches; the SQLite backend picks them off this index.
+            models.Index(fields=["-published_at", "-id"], name="searchdoc_published_idx"),
+        ]
+        verbose_name = "Search document"
+        verbose_name_plural = "Search documents"
+
+    def __str__(self):
+        return f"{self.kind}:{self.object_id} {self.title}"
+
+
+class Job(TimeStamped):
+    """Unit of background work (see apps/content/jobs.py), processed by ``manage.py run_workers``."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (RUNNING, "Running"),
+        (DONE, "Done"),
+        (FAILED, "Failed"),
+    ]
+
+    kind = models.CharField(max_length=64)
+    key = models.CharField(max_length=255, unique=True, help_text="Idempotency key: one job per key")
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(blank=True, null=True)
+    locked_by = models.CharField(max_length=128, blank=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "run_after"], name="job_status_run_after_idx"),
+        ]
+        verbose_name = "Background job"
+        verbose_name_plural = "Background jobs"
+
+    def __str__(self):
+        return f"{self.kind} [{self.status}] {self.key}"
+
+
+class SiteConfigSnapshot(TimeStamped):
+    """Compiled site configuration served by ``/api/site-config/`` (see apps/content/siteconfig.py).
+
+    A single row; ``version`` increases whenever the compiled ``data`` changes.
+    """
+
+    version = models.PositiveBigIntegerField(default=0)
+    digest = models.CharField(max_length=64, blank=True, help_text="SHA-256 of the compiled data")
+    data = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        verbose_name = "Site configuration snapshot"
+        verbose_name_plural = "Site configuration snapshot"
+
+    def __str__(self):
+        return f"Site configuration v{self.version}"
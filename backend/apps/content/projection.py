@@ -0,0 +1,48 @@
+from django.db.models import Prefetch
+from rest_framework import permissions
+
+
+class ProjectionMixin:
+    """List/detail serializer split and column pruning for read requests.
+
+    ``list_serializer_class`` (when set) renders the actions in ``list_actions``. For safe
+    methods the queryset then skips whatever the request's serializer won't render, so list
+    pages and ``?fields=``/``?omit=`` requests neither read nor serialize large bodies:
+
+    * columns named in ``deferrable_fields`` are ``defer()``-ed unless a field reads them;
+    * ``prefetch_related`` lookups for relations that aren't rendered are dropped.
+    """
+
+    list_serializer_class = None
+    list_actions = ("list",)
+    deferrable_fields = ()
+
+    def get_serializer_class(self):
+        if self.action in self.list_actions and self.list_serializer_class is not None:
+            return self.list_serializer_class
+        return super().get_serializer_class()
+
+    def rendered_sources(self):
+        serializer = self.get_serializer()
+        return {field.source.split(".")[0] for field in serializer._readable_fields}
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request is None or self.request.method not in permissions.SAFE_METHODS:
+            return queryset
+
+        sources = self.rendered_sources()
+        unread = [name for name in self.deferrable_fields if name not in sources]
+        if unread:
+            queryset = queryset.defer(*unread)
+
+        lookups = queryset._prefetch_related_lookups
+        kept = [lookup for lookup in lookups if _prefetch_root(lookup) in sources]
+        if len(kept) != len(lookups):
+            queryset = queryset.prefetch_related(None).prefetch_related(*kept)
+        return queryset
+
+
+def _prefetch_root(lookup):
+    path = lookup.prefetch_through if isinstance(lookup, Prefetch) else lookup
+    return path.split("__")[0]
@@ -0,0 +1,21 @@
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+
+from . import urls, views
+
+
+# Form endpoints take writes and their lists are staff-only, so they stay on /api/ only.
+PRIVATE_BASENAMES = {"newsletter", "contact"}
+
+router = DefaultRouter()
+router.APIRootView = views.public_view(DefaultRouter.APIRootView)
+for prefix, viewset, basename in urls.router.registry:
+    if basename not in PRIVATE_BASENAMES:
+        router.register(prefix, views.public_view(viewset), basename=f"public-{basename}")
+
+urlpatterns = [
+    path("bundle/home/", views.public_view(views.HomeBundleView).as_view(), name="public-bundle-home"),
+    path("site-config/", views.public_view(views.SiteConfigView).as_view(), name="public-site-config"),
+    path("search/", views.public_view(views.SearchView).as_view(), name="public-search"),
+    path("", include(router.urls)),
+]
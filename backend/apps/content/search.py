@@ -0,0 +1,279 @@
+"""Site-wide bilingual search over a denormalized ``SearchDocument`` table.
+
+Each searchable object (news, notices, publications, videos, events, albums, library
+books) is flattened into one ``SearchDocument`` row holding its English and Sinhala
+text. The row is kept current by model signals and indexed by:
+
+* SQLite: an FTS5 external-content table maintained by triggers (see migration 0018),
+  ranked with bm25.
+* PostgreSQL: a GIN index over a weighted ``tsvector`` expression, ranked with ts_rank.
+* anything else: ``icontains`` over the flattened table.
+"""
+import unicodedata
+from collections import namedtuple
+from datetime import datetime, time
+
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+
+from . import models
+
+
+FTS_TABLE = "content_searchdocument_fts"
+# bm25 weight per FTS5 column (kind, title, title_si, body, body_si): titles outrank bodies.
+BM25_WEIGHTS = "0.0, 10.0, 10.0, 1.0, 1.0"
+
+# Must match the index expression created in migration 0018.
+PG_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(d.title, '') || ' ' || coalesce(d.title_si, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(d.body, '') || ' ' || coalesce(d.body_si, '')), 'B')"
+)
+
+SUMMARY_LENGTH = 240
+MAX_TOKENS = 8
+# Only the newest MAX_RESULTS matches (by published_at) are ranked and paged: very common
+# terms match most of the corpus, and scoring all of it costs far more than the results
+# anyone pages to.
+MAX_RESULTS = 1000
+
+
+Spec = namedtuple("Spec", "model title body slug date visible")
+
+SEARCHABLE = {
+    "news": Spec(models.News, "title", ("excerpt", "content"), "slug", "published_at", None),
+    "notice": Spec(models.Notice, "title", ("content",), None, "published_at", None),
+    "publication": Spec(
+        models.Publication, "title", ("description", "department"), None, "published_at",
+        lambda obj: obj.is_active,
+    ),
+    "video": Spec(models.Video, "title", ("description",), None, "published_at", None),
+    "event": Spec(models.Event, "title", ("description",), None, "start_date", None),
+    "album": Spec(
+        models.Album, "title", ("description",), "slug", "published_at",
+        lambda obj: obj.is_active,
+    ),
+    "book": Spec(
+        models.LibraryPublicationEntry, "title", ("subtitle", "authors", "description"), None, "published_at",
+        lambda obj: obj.is_active,
+    ),
+}
+
+KIND_BY_MODEL = {spec.model: kind for kind, spec in SEARCHABLE.items()}
+
+
+def _text(obj, fields, suffix=""):
+    return "\n".join(filter(None, (getattr(obj, f"{name}{suffix}", "") for name in fields)))
+
+
+def _as_datetime(value):
+    if value is None or isinstance(value, datetime):
+        return value
+    return timezone.make_aware(datetime.combine(value, time.min))
+
+
+def document_values(kind, obj):
+    spec = SEARCHABLE[kind]
+    body = _text(obj, spec.body)
+    body_si = _text(obj, spec.body, "_si")
+    return {
+        "title": getattr(obj, spec.title)[:255],
+        "title_si": getattr(obj, f"{spec.title}_si", "")[:255],
+        "body": body,
+        "body_si": body_si,
+        "summary": body[:SUMMARY_LENGTH],
+        "summary_si": body_si[:SUMMARY_LENGTH],
+        "slug": getattr(obj, spec.slug) if spec.slug else "",
+        "published_at": _as_datetime(getattr(obj, spec.date)),
+    }
+
+
+def index_instance(instance):
+    kind = KIND_BY_MODEL.get(type(instance))
+    if kind is None:
+        return
+    spec = SEARCHABLE[kind]
+    if spec.visible and not spec.visible(instance):
+        remove_instance(instance)
+        return
+    models.SearchDocument.objects.update_or_create(
+        kind=kind,
+        object_id=instance.pk,
+        defaults=document_values(kind, instance),
+    )
+
+
+def remove_instance(instance):
+    kind = KIND_BY_MODEL.get(type(instance))
+    if kind is not None:
+        models.SearchDocument.objects.filter(kind=kind, object_id=instance.pk).delete()
+
+
+def rebuild(kinds=None, batch_size=500):
+    """Re-create every search document (or those of ``kinds``). Returns the number indexed."""
+    total = 0
+    for kind, spec in SEARCHABLE.items():
+        if kinds and kind not in kinds:
+            continue
+        models.SearchDocument.objects.filter(kind=kind).delete()
+        batch = []
+        for obj in spec.model._default_manager.order_by("pk").iterator(chunk_size=batch_size):
+            if spec.visible and not spec.visible(obj):
+                continue
+            batch.append(models.SearchDocument(kind=kind, object_id=obj.pk, **document_values(kind, obj)))
+            if len(batch) >= batch_size:
+                models.SearchDocument.objects.bulk_create(batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            models.SearchDocument.objects.bulk_create(batch)
+            total += len(batch)
+    return total
+
+
+def tokenize(text):
+    """Split on anything that is not a letter, combining mark, digit or joiner.
+
+    Sinhala words carry combining vowel signs (Mn/Mc) and zero-width joiners (Cf) that
+    ``str.isalnum``/``\\w`` treat as separators; keeping them whole matches how the FTS5
+    tokenizer is configured.
+    """
+    tokens, current = [], []
+    for char in text:
+        if unicodedata.category(char)[0] in "LMN" or unicodedata.category(char) == "Cf":
+            current.append(char)
+        elif current:
+            tokens.append("".join(current))
+            current = []
+    if current:
+        tokens.append("".join(current))
+    return tokens[:MAX_TOKENS]
+
+
+def _kind_filter(kinds, params, column="d.kind"):
+    if not kinds:
+        return ""
+    params.extend(kinds)
+    return f" AND {column} IN (%s)" % ", ".join(["%s"] * len(kinds))
+
+
+class SQLiteBackend:
+    def match_expression(self, tokens):
+        # Quote every token (no FTS5 operator injection) and prefix-match the last one.
+        return " ".join(f'"{token}"' for token in tokens) + "*"
+
+    def count(self, tokens, kinds):
+        params = [self.match_expression(tokens)]
+        where = _kind_filter(kinds, params, column="kind")
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT COUNT(*) FROM (SELECT 1 FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s{where} LIMIT %s)",
+                params + [MAX_RESULTS],
+            )
+            return cursor.fetchone()[0]
+
+    def page(self, tokens, kinds, offset, limit):
+        expression = self.match_expression(tokens)
+        params = [expression, expression]
+        where = _kind_filter(kinds, params)
+        params.extend([MAX_RESULTS, limit, offset])
+        # The candidates are the newest MAX_RESULTS matches of every kind, read off the
+        # published_at index. Only they are scored (the unary + keeps FTS5 scanning the
+        # match list once instead of re-running the match per candidate rowid), and only
+        # the page's rows are joined back to the document table.
+        return models.SearchDocument.objects.raw(
+            f"SELECT d.*, -hits.score AS score FROM ("
+            f"SELECT rowid, bm25({FTS_TABLE}, {BM25_WEIGHTS}) AS score FROM {FTS_TABLE} "
+            f"WHERE {FTS_TABLE} MATCH %s AND +rowid IN ("
+            f"SELECT d.id FROM content_searchdocument d INDEXED BY searchdoc_published_idx "
+            f"WHERE d.id IN (SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s){where} "
+            f"ORDER BY d.published_at DESC, d.id DESC LIMIT %s"
+            f") ORDER BY score LIMIT %s OFFSET %s"
+            f") hits JOIN content_searchdocument d ON d.id = hits.rowid ORDER BY hits.score",
+            params,
+        )
+
+
+class PostgresBackend:
+    def tsquery(self, tokens):
+        return " & ".join(tokens[:-1] + [f"{tokens[-1]}:*"])
+
+    def count(self, tokens, kinds):
+        params = [self.tsquery(tokens)]
+        where = _kind_filter(kinds, params)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT COUNT(*) FROM (SELECT 1 FROM content_searchdocument d "
+                f"WHERE {PG_VECTOR} @@ to_tsquery('simple', %s){where} LIMIT %s) hits",
+                params + [MAX_RESULTS],
+            )
+            return cursor.fetchone()[0]
+
+    def page(self, tokens, kinds, offset, limit):
+        query = self.tsquery(tokens)
+        params = [query, query]
+        where = _kind_filter(kinds, params)
+        params.extend([MAX_RESULTS, limit, offset])
+        # Same candidate set as count(): the newest MAX_RESULTS matches, then ranked.
+        return models.SearchDocument.objects.raw(
+            f"SELECT d.*, ts_rank({PG_VECTOR}, to_tsquery('simple', %s)) AS score FROM ("
+            f"SELECT d.* FROM content_searchdocument d "
+            f"WHERE {PG_VECTOR} @@ to_tsquery('simple', %s){where} "
+            f"ORDER BY d.published_at DESC NULLS LAST, d.id DESC LIMIT %s"
+            f") d ORDER BY score DESC, d.published_at DESC LIMIT %s OFFSET %s",
+            params,
+        )
+
+
+class FallbackBackend:
+    def queryset(self, tokens, kinds):
+        qs = models.SearchDocument.objects.all()
+        for token in tokens:
+            qs = qs.filter(
+                Q(title__icontains=token) | Q(title_si__icontains=token)
+                | Q(body__icontains=token) | Q(body_si__icontains=token)
+            )
+        if kinds:
+            qs = qs.filter(kind__in=kinds)
+        return qs.order_by("-published_at", "-id")
+
+    def count(self, tokens, kinds):
+        return self.queryset(tokens, kinds).count()
+
+    def page(self, tokens, kinds, offset, limit):
+        return self.queryset(tokens, kinds)[offset:offset + limit]
+
+
+def get_backend():
+    if connection.vendor == "postgresql":
+        return PostgresBackend()
+    if connection.vendor == "sqlite" and FTS_TABLE in connection.introspection.table_names():
+        return SQLiteBackend()
+    return FallbackBackend()
+
+
+class SearchResults:
+    """Lazy, sliceable result set so DRF/Django paginators can page it like a queryset."""
+
+    def __init__(self, text, kinds=None, backend=None):
+        self.tokens = tokenize(text)
+        self.kinds = [kind for kind in (kinds or []) if kind in SEARCHABLE]
+        self.backend = backend or get_backend()
+        self._count = None
+
+    def count(self):
+        if self._count is None:
+            self._count = self.backend.count(self.tokens, self.kinds) if self.tokens else 0
+        return self._count
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, item):
+        if not isinstance(item, slice):
+            return self[item:item + 1][0]
+        if not self.tokens:
+            return []
+        start = item.start or 0
+        stop = item.stop if item.stop is not None else self.count()
+        return list(self.backend.page(self.tokens, self.kinds, start, max(stop - start, 0)))
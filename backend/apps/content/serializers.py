@@ -1,13 +1,132 @@
-﻿from rest_framework import serializers
-from . import models
+﻿from django.utils.functional import cached_property
+from rest_framework import permissions, serializers
+from . import documents, images, models
 
 
-class NewsImageSerializer(serializers.ModelSerializer):
+LANGUAGE_QUERY_PARAM = "lang"
+LANGUAGES = ("en", "si")
+
+
+class LanguageProjectionMixin:
+    """``?lang=en|si`` renders one language per translatable field instead of both.
+
+    For every ``<field>``/``<field>_si`` pair only ``<field>`` is emitted: ``en`` drops
+    the Sinhala fields before anything is serialized, ``si`` moves the Sinhala value into
+    ``<field>`` and falls back to English when it is blank. Nested serializers read the
+    same request from the root context. Writes always see every field.
+    """
+
+    def requested_language(self):
+        request = self.context.get("request")
+        if request is None or request.method not in permissions.SAFE_METHODS:
+            return None
+        lang = request.query_params.get(LANGUAGE_QUERY_PARAM)
+        return lang if lang in LANGUAGES else None
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if self.requested_language() == "en":
+            for name in [name for name in fields if name.endswith("_si") and name[:-3] in fields]:
+                del fields[name]
+        return fields
+
+    @cached_property
+    def _translated_fields(self):
+        readable = {field.field_name for field in self._readable_fields}
+        return [name[:-3] for name in readable if name.endswith("_si") and name[:-3] in readable]
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if self.requested_language() == "si":
+            for name in self._translated_fields:
+                value = data.pop(f"{name}_si")
+                if value:
+                    data[name] = value
+        return data
+
+
+FIELDS_QUERY_PARAM = "fields"
+OMIT_QUERY_PARAM = "omit"
+
+
+def _names(value):
+    return {name.strip() for name in (value or "").split(",") if name.strip()}
+
+
+class SparseFieldsMixin:
+    """``?fields=a,b`` keeps only the named top-level fields, ``?omit=a,b`` drops them.
+
+    Unknown names are ignored. When ``?lang=`` is also given, naming ``title`` keeps
+    ``title_si`` too so the language projection can still fall back between them.
+    """
+
+    def is_root(self):
+        parent = self.parent
+        return parent is None or (isinstance(parent, serializers.ListSerializer) and parent.parent is None)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get("request")
+        if request is None or request.method not in permissions.SAFE_METHODS or not self.is_root():
+            return fields
+
+        params = request.query_params
+        wanted = _names(params.get(FIELDS_QUERY_PARAM))
+        omitted = _names(params.get(OMIT_QUERY_PARAM))
+        if wanted and params.get(LANGUAGE_QUERY_PARAM) in LANGUAGES:
+            wanted |= {f"{name}_si" for name in wanted}
+        for name in list(fields):
+            if (wanted and name not in wanted) or name in omitted:
+                del fields[name]
+        return fields
+
+
+class ContentSerializer(SparseFieldsMixin, LanguageProjectionMixin, serializers.ModelSerializer):
+    """Base for read-mostly content serializers: sparse fieldsets plus language projection."""
+
+
+class RenditionsField(serializers.ReadOnlyField):
+    """Renders a ``<field>_renditions`` JSON column as ``{width, height, src, sources}``.
+
+    ``sources`` holds one ``{type, srcset}`` entry per format (AVIF, WebP, JPEG), ready
+    for ``<picture><source>``; ``null`` until the renditions have been generated.
+    """
+
+    def to_representation(self, value):
+        request = self.context.get("request")
+
+        def build_url(name):
+            url = images.rendition_url(name)
+            return request.build_absolute_uri(url) if request is not None else url
+
+        return images.srcset_structure(value, build_url)
+
+
+class PlaceholderField(serializers.ReadOnlyField):
+    """Renders a ``<field>_placeholder`` JSON column as ``{width, height, color, blurhash}``."""
+
+    def to_representation(self, value):
+        return images.placeholder_structure(value)
+
+
+class DocumentInfoField(serializers.ReadOnlyField):
+    """Renders a ``<field>_info`` JSON column as ``{pages, size, linearized}``; ``null`` until ingested."""
+
+    def to_representation(self, value):
+        return documents.info_structure(value)
+
+
+class NewsImageSerializer(ContentSerializer):
+    image_renditions = RenditionsField()
+    image_placeholder = PlaceholderField()
+
     class Meta:
         model = models.NewsImage
         fields = [
             "id",
             "image",
+            "image_renditions",
+            "image_placeholder",
             "caption",
             "caption_si",
             "position",
@@ -16,7 +135,31 @@ class NewsImageSerializer(serializers.ModelSerializer):
         ]
 
 
-class NewsSerializer(serializers.ModelSerializer):
+class NewsListSerializer(ContentSerializer):
+    """News cards: no body and no gallery."""
+
+    image_renditions = RenditionsField()
+
+    class Meta:
+        model = models.News
+        fields = [
+            "id",
+            "title",
+            "title_si",
+            "slug",
+            "image",
+            "image_renditions",
+            "excerpt",
+            "excerpt_si",
+            "published_at",
+            "is_featured",
+            "created_at",
+            "updated_at",
+        ]
+
+
+class NewsSerializer(ContentSerializer):
+    image_renditions = RenditionsField()
     gallery_images = NewsImageSerializer(many=True, read_only=True)
 
     class Meta:
@@ -27,6 +170,7 @@ class NewsSerializer(serializers.ModelSerializer):
             "title_si",
             "slug",
             "image",
+            "image_renditions",
             "excerpt",
             "excerpt_si",
             "content",
@@ -39,12 +183,15 @@ class NewsSerializer(serializers.ModelSerializer):
         ]
 
 
-class NoticeImageSerializer(serializers.ModelSerializer):
+class NoticeImageSerializer(ContentSerializer):
+    image_placeholder = PlaceholderField()
+
     class Meta:
         model = models.NoticeImage
         fields = [
             "id",
             "image",
+            "image_placeholder",
             "caption",
             "caption_si",
             "position",
@@ -53,7 +200,30 @@ class NoticeImageSerializer(serializers.ModelSerializer):
         ]
 
 
-class NoticeSerializer(serializers.ModelSerializer):
+class NoticeListSerializer(ContentSerializer):
+    """Notice cards: the body is replaced by the ``content_excerpt`` annotations of NoticeViewSet."""
+
+    excerpt = serializers.CharField(source="content_excerpt", read_only=True)
+    excerpt_si = serializers.CharField(source="content_si_excerpt", read_only=True)
+
+    class Meta:
+        model = models.Notice
+        fields = [
+            "id",
+            "title",
+            "title_si",
+            "excerpt",
+            "excerpt_si",
+            "image",
+            "published_at",
+            "expires_at",
+            "priority",
+            "created_at",
+            "updated_at",
+        ]
+
+
+class NoticeSerializer(ContentSerializer):
     gallery_images = NoticeImageSerializer(many=True, read_only=True)
 
     class Meta:
@@ -74,14 +244,18 @@ class NoticeSerializer(serializers.ModelSerializer):
         ]
 
 
-class PublicationSerializer(serializers.ModelSerializer):
+class PublicationSerializer(ContentSerializer):
+    cover_renditions = RenditionsField()
+    file_info = DocumentInfoField()
+
     class Meta:
         model = models.Publication
         fields = "__all__"
 
 
-class DownloadCategorySerializer(serializers.ModelSerializer):
-    publications = PublicationSerializer(many=True, read_only=True)
+class DownloadCategorySerializer(ContentSerializer):
+    publications = PublicationSerializer(many=True, read_only=True, source="listed_publications")
+    publications_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = models.DownloadCategory
@@ -93,10 +267,12 @@ class DownloadCategorySerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
             "publications",
+            "publications_count",
         ]
 
 
-class VideoSerializer(serializers.ModelSerializer):
+class VideoSerializer(ContentSerializer):
+    thumbnail_renditions = RenditionsField()
     playback_url = serializers.SerializerMethodField()
 
     class Meta:
@@ -110,42 +286,51 @@ class VideoSerializer(serializers.ModelSerializer):
         return obj.url or (obj.file.url if obj.file else "")
 
 
-class GalleryImageSerializer(serializers.ModelSerializer):
+class GalleryImageSerializer(ContentSerializer):
+    image_renditions = RenditionsField()
+    image_placeholder = PlaceholderField()
+
     class Meta:
         model = models.GalleryImage
-        fields = ["id", "image", "caption", "caption_si", "position", "created_at", "updated_at"]
+        fields = ["id", "image", "image_renditions", "image_placeholder", "caption", "caption_si", "position", "created_at", "updated_at"]
 
-class AlbumSerializer(serializers.ModelSerializer):
+class AlbumSerializer(ContentSerializer):
+    cover_renditions = RenditionsField()
+    cover_placeholder = PlaceholderField()
     images = GalleryImageSerializer(many=True, read_only=True)
 
     class Meta:
         model = models.Album
         fields = [
-            "id", "title", "title_si", "slug", "description", "description_si", "cover",
+            "id", "title", "title_si", "slug", "description", "description_si",
+            "cover", "cover_renditions", "cover_placeholder",
             "is_active", "position", "published_at",
             "images", "created_at", "updated_at",
         ]
 
 
-class EventSerializer(serializers.ModelSerializer):
+class EventSerializer(ContentSerializer):
     class Meta:
         model = models.Event
         fields = "__all__"
 
 
-class StatSerializer(serializers.ModelSerializer):
+class StatSerializer(ContentSerializer):
     class Meta:
         model = models.Stat
         fields = "__all__"
 
 
-class ExternalLinkSerializer(serializers.ModelSerializer):
+class ExternalLinkSerializer(ContentSerializer):
     class Meta:
         model = models.ExternalLink
         fields = "__all__"
 
 
-class HeroSlideSerializer(serializers.ModelSerializer):
+class HeroSlideSerializer(ContentSerializer):
+    image_renditions = RenditionsField()
+    image_placeholder = PlaceholderField()
+
     class Meta:
         model = models.HeroSlide
         fields = "__all__"
@@ -157,37 +342,44 @@ class NewsletterSubscriptionSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
+class NewsletterSpoolSerializer(NewsletterSubscriptionSerializer):
+    """Validates a sign-up for the spool; duplicates are dropped at commit, not looked up here."""
+
+    class Meta(NewsletterSubscriptionSerializer.Meta):
+        extra_kwargs = {"email": {"validators": []}}
+
+
 class ContactMessageSerializer(serializers.ModelSerializer):
     class Meta:
         model = models.ContactMessage
         fields = ["id", "name", "email", "subject", "message", "created_at"]
 
 
-class ContactInfoSerializer(serializers.ModelSerializer):
+class ContactInfoSerializer(ContentSerializer):
     class Meta:
         model = models.ContactInfo
         fields = "__all__"
 
 
-class FooterAboutSerializer(serializers.ModelSerializer):
+class FooterAboutSerializer(ContentSerializer):
     class Meta:
         model = models.FooterAbout
         fields = "__all__"
 
 
-class FooterLinkSerializer(serializers.ModelSerializer):
+class FooterLinkSerializer(ContentSerializer):
     class Meta:
         model = models.FooterLink
         fields = "__all__"
 
 
-class HeroIntroSerializer(serializers.ModelSerializer):
+class HeroIntroSerializer(ContentSerializer):
     class Meta:
         model = models.HeroIntro
         fields = "__all__"
 
 
-class AboutSectionSerializer(serializers.ModelSerializer):
+class AboutSectionSerializer(ContentSerializer):
     class Meta:
         model = models.AboutSection
         fields = [
@@ -196,7 +388,7 @@ class AboutSectionSerializer(serializers.ModelSerializer):
         ]
 
 
-class SiteTextSnippetSerializer(serializers.ModelSerializer):
+class SiteTextSnippetSerializer(ContentSerializer):
     class Meta:
         model = models.SiteTextSnippet
         fields = [
@@ -205,19 +397,19 @@ class SiteTextSnippetSerializer(serializers.ModelSerializer):
         ]
 
 
-class LibraryPublicationImageSerializer(serializers.ModelSerializer):
+class LibraryPublicationImageSerializer(ContentSerializer):
     class Meta:
         model = models.LibraryPublicationImage
         fields = ["id", "image", "caption", "caption_si", "created_at", "updated_at"]
 
 
-class LibraryPublicationCategoryMiniSerializer(serializers.ModelSerializer):
+class LibraryPublicationCategoryMiniSerializer(ContentSerializer):
     class Meta:
         model = models.LibraryPublicationCategory
         fields = ["id", "name", "name_si", "slug"]
 
 
-class LibraryPublicationEntrySerializer(serializers.ModelSerializer):
+class LibraryPublicationEntrySerializer(ContentSerializer):
     category = LibraryPublicationCategoryMiniSerializer(read_only=True)
     category_id = serializers.PrimaryKeyRelatedField(
         queryset=models.LibraryPublicationCategory.objects.all(),
@@ -227,6 +419,8 @@ class LibraryPublicationEntrySerializer(serializers.ModelSerializer):
         allow_null=True,
     )
     images = LibraryPublicationImageSerializer(many=True, read_only=True)
+    cover_renditions = RenditionsField()
+    pdf_file_info = DocumentInfoField()
     download_href = serializers.ReadOnlyField()
 
     class Meta:
@@ -235,15 +429,15 @@ class LibraryPublicationEntrySerializer(serializers.ModelSerializer):
             "id",
             "category", "category_id",
             "title", "title_si", "subtitle", "subtitle_si", "authors", "authors_si", "year", "description", "description_si",
-            "cover", "pdf_file", "external_url", "download_href",
+            "cover", "cover_renditions", "pdf_file", "pdf_file_info", "external_url", "download_href",
             "published_at", "is_active", "is_featured",
             "images",
             "created_at", "updated_at",
         ]
 
 
-class LibraryPublicationCategorySerializer(serializers.ModelSerializer):
-    publications_count = serializers.IntegerField(source="publications.count", read_only=True)
+class LibraryPublicationCategorySerializer(ContentSerializer):
+    publications_count = serializers.SerializerMethodField()
 
     class Meta:
         model = models.LibraryPublicationCategory
@@ -258,3 +452,29 @@ class LibraryPublicationCategorySerializer(serializers.ModelSerializer):
             "publications_count",
         ]
 
+    def get_publications_count(self, obj):
+        # Views annotate the count in the list query; fall back for unannotated instances (e.g. create).
+        count = getattr(obj, "active_publications_count", None)
+        if count is None:
+            count = obj.publications.filter(is_active=True).count()
+        return count
+
+
+class SearchResultSerializer(ContentSerializer):
+    type = serializers.CharField(source="kind", read_only=True)
+    id = serializers.IntegerField(source="object_id", read_only=True)
+    score = serializers.SerializerMethodField()
+
+    class Meta:
+        model = models.SearchDocument
+        fields = [
+            "type", "id", "slug",
+            "title", "title_si",
+            "summary", "summary_si",
+            "published_at",
+            "score",
+        ]
+
+    def get_score(self, obj):
+        score = getattr(obj, "score", None)
+        return round(score, 4) if score is not None else None
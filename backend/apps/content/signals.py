@@ -0,0 +1,60 @@
+from django.db.models.signals import post_delete, post_save
+
+from . import cache, documents, images, jobs, models, search, siteconfig
+
+
+def invalidate_content_cache(sender, **kwargs):
+    cache.bump_generation(sender)
+
+
+def update_search_document(sender, instance, raw=False, **kwargs):
+    if not raw:
+        search.index_instance(instance)
+
+
+def remove_search_document(sender, instance, **kwargs):
+    search.remove_instance(instance)
+
+
+def queue_image_jobs(sender, instance, raw=False, **kwargs):
+    # Renditions are built by ``manage.py run_workers`` so uploads don't block the save.
+    if not raw:
+        jobs.enqueue_images(instance)
+
+
+def queue_document_jobs(sender, instance, raw=False, **kwargs):
+    # PDFs are inspected (and optionally linearized) by the worker, not during the save.
+    if not raw:
+        jobs.enqueue_documents(instance)
+
+
+def rebuild_site_config(sender, raw=False, **kwargs):
+    if not raw:
+        siteconfig.schedule_rebuild()
+
+
+def connect(app_config):
+    for model in app_config.get_models():
+        if model in (models.Job, models.SiteConfigSnapshot):
+            # Queue bookkeeping and the site-config snapshot never appear in a cached response.
+            continue
+        post_save.connect(invalidate_content_cache, sender=model, dispatch_uid=f"content-cache-save-{model._meta.label_lower}")
+        post_delete.connect(invalidate_content_cache, sender=model, dispatch_uid=f"content-cache-delete-{model._meta.label_lower}")
+
+    for spec in search.SEARCHABLE.values():
+        label = spec.model._meta.label_lower
+        post_save.connect(update_search_document, sender=spec.model, dispatch_uid=f"content-search-save-{label}")
+        post_delete.connect(remove_search_document, sender=spec.model, dispatch_uid=f"content-search-delete-{label}")
+
+    for model in images.IMAGE_FIELDS:
+        label = model._meta.label_lower
+        post_save.connect(queue_image_jobs, sender=model, dispatch_uid=f"content-image-jobs-{label}")
+
+    for model in documents.DOCUMENT_FIELDS:
+        label = model._meta.label_lower
+        post_save.connect(queue_document_jobs, sender=model, dispatch_uid=f"content-document-jobs-{label}")
+
+    for model in siteconfig.SNAPSHOT_MODELS:
+        label = model._meta.label_lower
+        post_save.connect(rebuild_site_config, sender=model, dispatch_uid=f"content-site-config-save-{label}")
+        post_delete.connect(rebuild_site_config, sender=model, dispatch_uid=f"content-site-config-delete-{label}")
@@ -0,0 +1,141 @@
+"""Versioned snapshot of the site-wide configuration served by ``/api/site-config/``.
+
+The hero intro, footer, contact details, text snippets, links, stats and about sections
+are read on every page but change only through the admin. ``rebuild`` compiles them into
+one JSON document and stores it in the single ``SiteConfigSnapshot`` row. The version goes
+up only when the compiled data actually changes. Saving or deleting any of
+``SNAPSHOT_MODELS`` rebuilds it once the transaction commits.
+
+Each worker process keeps the last snapshot in memory. It compares its version with the
+row at most once every ``SITE_CONFIG_CHECK_INTERVAL`` seconds, and reloads the data only
+when the version moved. Between checks a request costs no queries at all.
+
+The snapshot holds both languages (``title`` and ``title_si``). ``?lang=`` and ``?fields=``
+do not apply to it.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.http import quote_etag
+from rest_framework.utils.encoders import JSONEncoder
+
+from . import models
+from . import serializers as s
+
+
+SNAPSHOT_ID = 1
+
+# section -> (queryset factory, serializer); querysets match the public list endpoints.
+SECTIONS = OrderedDict([
+    ("hero_intro", (lambda: models.HeroIntro.objects.filter(is_active=True).order_by("-updated_at")[:1], s.HeroIntroSerializer)),
+    ("footer_about", (lambda: models.FooterAbout.objects.filter(is_active=True).order_by("-updated_at", "-created_at")[:1], s.FooterAboutSerializer)),
+    ("contact_info", (lambda: models.ContactInfo.objects.order_by("-created_at")[:1], s.ContactInfoSerializer)),
+    ("text_snippets", (lambda: models.SiteTextSnippet.objects.filter(is_active=True).order_by("key"), s.SiteTextSnippetSerializer)),
+    ("footer_links", (lambda: models.FooterLink.objects.filter(is_active=True).order_by("position", "name"), s.FooterLinkSerializer)),
+    ("links", (lambda: models.ExternalLink.objects.all(), s.ExternalLinkSerializer)),
+    ("stats", (lambda: models.Stat.objects.order_by("pk"), s.StatSerializer)),
+    ("about_sections", (lambda: models.AboutSection.objects.filter(is_active=True).order_by("position", "created_at"), s.AboutSectionSerializer)),
+])
+
+SNAPSHOT_MODELS = (
+    models.HeroIntro,
+    models.FooterAbout,
+    models.ContactInfo,
+    models.SiteTextSnippet,
+    models.FooterLink,
+    models.ExternalLink,
+    models.Stat,
+    models.AboutSection,
+)
+
+
+class Snapshot(namedtuple("Snapshot", "version digest data")):
+    __slots__ = ()
+
+    @property
+    def etag(self):
+        return quote_etag(self.digest[:32])
+
+    def payload(self):
+        return {"version": self.version, **self.data}
+
+
+class _Memory:
+    """The snapshot this process last saw, and when it last compared versions."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.snapshot = None
+        self.checked = 0.0
+
+
+_memory = _Memory()
+
+
+def check_interval():
+    return getattr(settings, "SITE_CONFIG_CHECK_INTERVAL", 5)
+
+
+def compile_sections():
+    data = OrderedDict()
+    for name, (queryset, serializer_class) in SECTIONS.items():
+        data[name] = serializer_class(queryset(), many=True).data
+    # Round-trip through JSON so the stored, remembered and hashed forms are identical.
+    encoded = json.dumps(data, cls=JSONEncoder, sort_keys=True)
+    return json.loads(encoded), hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _remember(row):
+    snapshot = Snapshot(row.version, row.digest, row.data)
+    with _memory.lock:
+        _memory.snapshot = snapshot
+        _memory.checked = time.monotonic()
+    return snapshot
+
+
+def rebuild():
+    """Recompile the snapshot, bumping its version if the data changed; returns the Snapshot."""
+    with transaction.atomic():
+        # Locking the row serializes concurrent rebuilds, so the last one to commit has
+        # compiled the latest data.
+        row, _ = models.SiteConfigSnapshot.objects.select_for_update().get_or_create(pk=SNAPSHOT_ID)
+        data, digest = compile_sections()
+        if digest != row.digest:
+            row.version += 1
+            row.digest = digest
+            row.data = data
+            row.save()
+    return _remember(row)
+
+
+def schedule_rebuild():
+    """Rebuild after the current transaction commits (immediately outside one)."""
+    transaction.on_commit(rebuild)
+
+
+def forget():
+    """Drop this process's copy, so the next ``current()`` reads the row."""
+    with _memory.lock:
+        _memory.snapshot = None
+        _memory.checked = 0.0
+
+
+def current():
+    """The current snapshot, from memory while the last version check is recent enough."""
+    snapshot = _memory.snapshot
+    if snapshot is not None and time.monotonic() - _memory.checked < check_interval():
+        return snapshot
+
+    version = models.SiteConfigSnapshot.objects.filter(pk=SNAPSHOT_ID).values_list("version", flat=True).first()
+    if version is None:
+        return rebuild()
+    if snapshot is None or snapshot.version != version:
+        return _remember(models.SiteConfigSnapshot.objects.get(pk=SNAPSHOT_ID))
+    with _memory.lock:
+        _memory.checked = time.monotonic()
+    return snapshot
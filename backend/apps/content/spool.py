@@ -0,0 +1,203 @@
+"""Durable local spool for public form submissions (contact messages, newsletter sign-ups).
+
+The create endpoints validate a submission, write it here and answer ``202 Accepted``
+without touching the database, so a burst of sign-ups doesn't queue behind admin edits
+for SQLite's write lock. ``flush`` (run by ``manage.py run_workers``, or
+``manage.py flush_spool``) commits spooled records in batches with
+``bulk_create(ignore_conflicts=True)``. Rows are dated when the submission was received,
+not when the batch was committed.
+
+Each kind is a Maildir-style directory under ``SPOOL_DIR``::
+
+    spool/contact/tmp/   being written (never read)
+    spool/contact/new/   complete records, waiting to be committed
+    spool/contact/cur/   claimed by a committer
+
+A record is written to ``tmp/``, fsynced and renamed into ``new/``, so a reader only ever
+sees whole files and an acknowledged submission survives a crash. Committers claim records
+by renaming them into ``cur/`` (only one rename wins) and delete them after the batch
+commits. Claims older than ``SPOOL_CLAIM_TIMEOUT`` (a committer died mid-batch) go back to
+``new/``. Replaying a record is harmless: newsletter e-mails are unique, and contact
+messages carry their record id in ``submission_id``.
+"""
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, DateTimeField, F, Value, When
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from . import cache, models
+from . import serializers as s
+
+
+# kind -> (model, serializer validating submissions without database lookups)
+KINDS = {
+    "contact": (models.ContactMessage, s.ContactMessageSerializer),
+    "newsletter": (models.NewsletterSubscription, s.NewsletterSpoolSerializer),
+}
+
+# kind -> unique column identifying the row a record becomes
+ROW_KEYS = {
+    "contact": "submission_id",
+    "newsletter": "email",
+}
+
+
+def spool_enabled():
+    return getattr(settings, "INGEST_SPOOL", True)
+
+
+def spool_dir():
+    return Path(getattr(settings, "SPOOL_DIR", Path(settings.BASE_DIR) / "spool"))
+
+
+def batch_size():
+    return getattr(settings, "SPOOL_BATCH_SIZE", 500)
+
+
+def claim_timeout():
+    return getattr(settings, "SPOOL_CLAIM_TIMEOUT", 5 * 60)
+
+
+def _directory(kind, state):
+    path = spool_dir() / kind / state
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _fsync_directory(path):
+    # Makes the rename itself durable; not possible (or needed) on Windows.
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def append(kind, data):
+    """Durably spool one validated submission; returns its record id."""
+    record_id = uuid.uuid4().hex
+    record = {"id": record_id, "received_at": timezone.now().isoformat(), "data": data}
+    # Time-ordered names, so records are committed roughly in arrival order.
+    name = f"{time.time_ns():020d}-{record_id}.json"
+    temporary = _directory(kind, "tmp") / name
+    with open(temporary, "w", encoding="utf-8") as handle:
+        json.dump(record, handle, ensure_ascii=False)
+        handle.flush()
+        os.fsync(handle.fileno())
+    target = _directory(kind, "new")
+    os.replace(temporary, target / name)
+    _fsync_directory(target)
+    return record_id
+
+
+def recover(kind, now=None):
+    """Return claims older than ``SPOOL_CLAIM_TIMEOUT`` to ``new/``. Returns the count."""
+    now = now or time.time()
+    pending = _directory(kind, "new")
+    recovered = 0
+    for path in _directory(kind, "cur").iterdir():
+        try:
+            if now - path.stat().st_mtime < claim_timeout():
+                continue
+            os.replace(path, pending / path.name)
+        except FileNotFoundError:
+            continue
+        recovered += 1
+    return recovered
+
+
+def claim(kind, limit):
+    """Move up to ``limit`` of the oldest records into ``cur/``; returns their claimed paths."""
+    claimed_dir = _directory(kind, "cur")
+    claimed = []
+    for path in sorted(_directory(kind, "new").iterdir())[:limit]:
+        target = claimed_dir / path.name
+        try:
+            os.replace(path, target)
+        except FileNotFoundError:
+            continue  # another committer took it
+        # Restart the claim clock (rename keeps the original mtime).
+        os.utime(target)
+        claimed.append(target)
+    return claimed
+
+
+def build_instance(kind, record):
+    model, _ = KINDS[kind]
+    if model is models.ContactMessage:
+        return model(submission_id=record["id"], **record["data"])
+    return model(**record["data"])
+
+
+def row_key(kind, record):
+    return record["id"] if ROW_KEYS[kind] == "submission_id" else record["data"][ROW_KEYS[kind]]
+
+
+def backdate(kind, records, inserted_since):
+    """Set ``created_at`` of the rows just inserted to when their records were received.
+
+    ``bulk_create`` stamps ``auto_now_add`` with the flush time whatever the instance holds.
+    Rows that already existed (a replayed record, a repeated sign-up) predate
+    ``inserted_since`` and keep their own. One UPDATE per batch.
+    """
+    model, _ = KINDS[kind]
+    column = ROW_KEYS[kind]
+    received = {row_key(kind, record): parse_datetime(record["received_at"]) for record in records}
+    model._default_manager.filter(**{f"{column}__in": list(received)}, created_at__gte=inserted_since).update(
+        created_at=Case(
+            *(When(**{column: key}, then=Value(stamp)) for key, stamp in received.items()),
+            default=F("created_at"),
+            output_field=DateTimeField(),
+        ),
+    )
+
+
+def commit(kind, paths):
+    """Insert the records in ``paths`` and delete the files. Returns the number of records."""
+    model, _ = KINDS[kind]
+    records = []
+    for path in paths:
+        with open(path, encoding="utf-8") as handle:
+            records.append(json.load(handle))
+    if records:
+        with transaction.atomic():
+            inserted_since = timezone.now()
+            model._default_manager.bulk_create(
+                [build_instance(kind, record) for record in records],
+                batch_size=batch_size(),
+                ignore_conflicts=True,
+            )
+            backdate(kind, records, inserted_since)
+        # bulk_create sends no post_save, so invalidate cached responses here.
+        cache.bump_generation(model)
+    for path in paths:
+        path.unlink(missing_ok=True)
+    return len(records)
+
+
+def flush(kinds=None):
+    """Commit everything spooled for ``kinds`` (default: all). Returns ``{kind: records}``."""
+    committed = {}
+    for kind in kinds or KINDS:
+        recover(kind)
+        committed[kind] = 0
+        while True:
+            paths = claim(kind, batch_size())
+            if not paths:
+                break
+            committed[kind] += commit(kind, paths)
+    return committed
+
+
+def pending(kind):
+    """Records waiting in ``new/`` or claimed in ``cur/``."""
+    return sum(1 for state in ("new", "cur") for _ in _directory(kind, state).iterdir())
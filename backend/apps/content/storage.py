@@ -0,0 +1,184 @@
+"""Content-addressed storage for uploaded media.
+
+Every ``FileField`` / ``ImageField`` in ``models.py`` stores its uploads under the SHA-256 of
+the bytes instead of the client's file name::
+
+    publications/report.pdf  ->  publications/3f/3fa9...c0e1.pdf
+
+Uploading the same file twice reuses the existing blob instead of writing a
+``report_bnpHHYZ.pdf`` copy. A name never changes its contents, so ``media.serve_media``
+marks these URLs immutable. Blobs are never deleted when a row lets go of them, because
+another row may share them. ``manage.py gc_media`` counts the references and removes blobs
+nobody points at. ``manage.py dedupe_media`` moves uploads made before this storage existed
+onto hashed names.
+"""
+import hashlib
+import os
+import posixpath
+import re
+import uuid
+from collections import Counter
+
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.base import File
+from django.core.files.storage import FileSystemStorage
+from django.db.models import FileField, JSONField
+from django.utils import timezone
+
+
+BLOB_STEM = re.compile(r"^[0-9a-f]{32,64}$")
+
+
+def file_digest(content):
+    digest = hashlib.sha256()
+    for chunk in content.chunks():
+        digest.update(chunk if isinstance(chunk, bytes) else chunk.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """``FileSystemStorage`` that names files ``<upload_to>/<h[:2]>/<sha256><ext>``."""
+
+    content_addressed = True
+
+    def blob_name(self, name, digest, max_length=None):
+        directory, basename = posixpath.split(name.replace("\\", "/"))
+        stem, extension = posixpath.splitext(basename)
+        extension = extension.lower()
+        if BLOB_STEM.match(stem) and posixpath.basename(directory) == stem[:2]:
+            # Re-storing a blob (e.g. after stripping metadata): keep the same fan-out level.
+            directory = posixpath.dirname(directory)
+        # Shorter prefixes only when a column's max_length is tight; 128 bits still can't collide.
+        for length in (64, 48, 32):
+            candidate = posixpath.join(directory, digest[:2], digest[:length] + extension)
+            if max_length is None or len(candidate) <= max_length:
+                return candidate
+        raise SuspiciousFileOperation(f"Storage can not find an available filename for {name!r}.")
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, "chunks"):
+            content = File(content, name)
+        return super().save(self.blob_name(name, file_digest(content), max_length), content, max_length)
+
+    def get_available_name(self, name, max_length=None):
+        # The name is derived from the contents, so an existing file is the same file.
+        return name
+
+    def _save(self, name, content):
+        if self.exists(name):
+            return name
+        # Write under a temporary name and rename into place, so a concurrent reader (or a
+        # second upload of the same bytes) never sees a partial blob.
+        temporary = super()._save(posixpath.join(posixpath.dirname(name), f".upload-{uuid.uuid4().hex}"), content)
+        os.replace(self.path(temporary), self.path(name))
+        return name
+
+
+_content_storage = ContentAddressedStorage()
+
+
+def content_storage():
+    """Storage callable for model fields (keeps migrations free of storage instances)."""
+    return _content_storage
+
+
+def is_content_addressed(storage):
+    return getattr(storage, "content_addressed", False)
+
+
+def replace_contents(instance, field_name, content):
+    """Store new bytes for an existing upload (e.g. metadata stripped) and point the row at them.
+
+    A content-addressed blob may be shared with other rows, so the old one is deleted only
+    when no file column references it any more. Other storages reuse the name. Returns the
+    stored name.
+    """
+    field_file = getattr(instance, field_name)
+    storage, name = field_file.storage, field_file.name
+    if not is_content_addressed(storage):
+        storage.delete(name)
+    saved = storage.save(name, content)
+    if saved != name:
+        updated_at = timezone.now()
+        type(instance)._default_manager.filter(pk=instance.pk).update(**{field_name: saved, "updated_at": updated_at})
+        field_file.name = saved
+        instance.updated_at = updated_at
+        if is_content_addressed(storage) and not is_referenced(name):
+            # Don't leave the replaced bytes (say, GPS metadata) around until gc_media.
+            storage.delete(name)
+    return saved
+
+
+# --- reference counting -----------------------------------------------------------------
+
+def file_fields():
+    """``(model, field)`` for every file field of the content app on content-addressed storage."""
+    from django.apps import apps
+
+    for model in apps.get_app_config("content").get_models():
+        for field in model._meta.get_fields():
+            if isinstance(field, FileField) and is_content_addressed(field.storage):
+                yield model, field
+
+
+def is_referenced(name):
+    """Whether any file column of the content app currently holds ``name``."""
+    return any(
+        model._default_manager.filter(**{field.attname: name}).exists()
+        for model, field in file_fields()
+    )
+
+
+def _strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _strings(item)
+
+
+def reference_counts():
+    """How many times each stored name is referenced.
+
+    Counts file columns plus every string inside the content app's JSON columns, which is
+    where renditions, PDF previews and queued jobs record file names. Over-counting a string that merely looks
+    like a path only keeps a file alive, so this errs on the safe side.
+    """
+    from django.apps import apps
+
+    from .models import Job
+
+    counts = Counter()
+    for model in apps.get_app_config("content").get_models():
+        queryset = model._default_manager.all()
+        if model is Job:
+            # Finished jobs keep their payload for the record; only queued work pins a file.
+            queryset = queryset.filter(status__in=(Job.PENDING, Job.RUNNING))
+        columns = [
+            field.attname for field in model._meta.concrete_fields
+            if isinstance(field, (FileField, JSONField))
+        ]
+        if not columns:
+            continue
+        for row in queryset.values_list(*columns).iterator():
+            for value in row:
+                counts.update(name for name in _strings(value) if name)
+    return counts
+
+
+def collected_directories():
+    """Top-level media directories whose unreferenced files ``gc_media`` may delete."""
+    from . import documents, images
+
+    directories = {field.upload_to.strip("/") for _, field in file_fields() if isinstance(field.upload_to, str)}
+    directories.update({images.RENDITION_DIR, documents.PREVIEW_DIR})
+    # Drop nested directories (``news/gallery`` is walked as part of ``news``).
+    return sorted(
+        directory for directory in directories
+        if directory and not any(directory.startswith(parent + "/") for parent in directories)
+    )
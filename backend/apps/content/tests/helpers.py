@@ -0,0 +1,26 @@
+import io
+import shutil
+import tempfile
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from PIL import Image
+
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def png_upload(name="photo.png", size=(48, 32), color=(200, 120, 40)):
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, "PNG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+
+def temporary_directory(test_case, setting):
+    """Point ``setting`` (``MEDIA_ROOT``, ``SPOOL_DIR``) at a fresh directory for one test."""
+    path = tempfile.mkdtemp()
+    test_case.addCleanup(shutil.rmtree, path, ignore_errors=True)
+    settings_override = override_settings(**{setting: path})
+    settings_override.enable()
+    test_case.addCleanup(settings_override.disable)
+    return path
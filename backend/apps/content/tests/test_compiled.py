@@ -0,0 +1,57 @@
+from datetime import date, timedelta
+from unittest import mock
+
+from django.core.cache import cache as default_cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from .. import compiled, images, models, serializers
+from .helpers import LOCMEM_CACHE, png_upload, temporary_directory
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHE, CONTENT_CACHE_ENABLED=False, THROTTLE_ENABLED=False, JOBS_EAGER=False,
+    IMAGE_RENDITION_WIDTHS=(16,),
+)
+class CompiledProjectionTests(TestCase):
+    urls_to_compare = (
+        "/api/news/",
+        "/api/news/?lang=si",
+        "/api/news/?fields=id,title,image,image_renditions",
+        "/api/notices/?lang=si&omit=content",
+        "/api/gallery/",
+        "/api/events/",
+        "/api/stats/",
+    )
+
+    def setUp(self):
+        temporary_directory(self, "MEDIA_ROOT")
+        default_cache.clear()
+        now = timezone.now()
+        for day in range(3):
+            news = models.News.objects.create(
+                title=f"News {day}", title_si="" if day else "පුවත්", content="Body", content_si="සිංහල",
+                published_at=now - timedelta(days=day), image=png_upload(f"{day}.png", color=(day * 60, 90, 30)),
+            )
+        images.render_instance(news)
+        models.Notice.objects.create(title="Notice", title_si="නිවේදනය", content="x" * 400, published_at=now)
+        album = models.Album.objects.create(title="Vesak")
+        images.render_instance(models.GalleryImage.objects.create(album=album, image=png_upload(), caption="Lanterns"))
+        models.Event.objects.create(title="Exam", start_date=date(2026, 11, 2))
+        models.Stat.objects.create(label="Pirivenas", value="750")
+
+    def test_compiled_lists_match_the_serializers(self):
+        for url in self.urls_to_compare:
+            with self.subTest(url=url):
+                with mock.patch.object(compiled.Plan, "render", autospec=True, side_effect=compiled.Plan.render) as render:
+                    fast = self.client.get(url)
+                self.assertEqual(fast.status_code, 200)
+                self.assertTrue(render.called, f"{url} was not compiled")
+
+                with self.settings(COMPILED_SERIALIZERS=False):
+                    slow = self.client.get(url)
+                self.assertEqual(fast.content, slow.content)
+
+    def test_nested_serializers_stay_on_the_drf_path(self):
+        self.assertIn("images", compiled.uncompiled_fields(serializers.AlbumSerializer()))
+        self.assertEqual(compiled.uncompiled_fields(serializers.StatSerializer()), [])
@@ -0,0 +1,32 @@
+from django.core.cache import cache as default_cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from .. import models
+from .helpers import LOCMEM_CACHE
+
+
+@override_settings(CACHES=LOCMEM_CACHE, THROTTLE_ENABLED=False)
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        default_cache.clear()
+        models.News.objects.create(title="Vesak programme", content="Details", published_at=timezone.now())
+
+    def test_cache_hit_answers_without_queries(self):
+        first = self.client.get("/api/news/")
+        with self.assertNumQueries(0):
+            cached = self.client.get("/api/news/")
+        with self.assertNumQueries(0):
+            revalidated = self.client.get("/api/news/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(cached["ETag"], first["ETag"])
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_list_etag_changes_when_a_row_is_deleted(self):
+        models.News.objects.create(title="Second", content="x", published_at=timezone.now())
+        first = self.client.get("/api/news/")
+        self.assertNotIn("Last-Modified", first)
+
+        models.News.objects.filter(title="Second").delete()
+        response = self.client.get("/api/news/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["count"], 1)
@@ -0,0 +1,79 @@
+from unittest import mock
+
+from django.core.files.storage import FileSystemStorage
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from .. import images, models
+from .helpers import LOCMEM_CACHE, png_upload, temporary_directory
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHE, CONTENT_CACHE_ENABLED=False, THROTTLE_ENABLED=False, JOBS_EAGER=False,
+    IMAGE_RENDITION_WIDTHS=(16, 32),
+)
+class RenditionTests(TestCase):
+    def setUp(self):
+        self.media_root = temporary_directory(self, "MEDIA_ROOT")
+        album = models.Album.objects.create(title="Vesak")
+        self.image = models.GalleryImage.objects.create(album=album, image=png_upload(size=(48, 32)))
+
+    def test_each_width_is_stored_once_per_format(self):
+        renditions = images.render_instance(self.image)["image_renditions"]
+
+        self.assertEqual(renditions["source"], self.image.image.name)
+        self.assertEqual((renditions["width"], renditions["height"]), (48, 32))
+        self.assertEqual(list(renditions["formats"]), images.available_formats())
+        for entries in renditions["formats"].values():
+            self.assertEqual([width for width, _ in entries], [16, 32])
+            for _, name in entries:
+                self.assertTrue(images.rendition_storage().exists(name))
+
+        # A second pass reuses the stored files instead of writing new ones.
+        self.assertEqual(images.build_renditions(self.image.image), renditions)
+
+    def test_urls_come_from_the_storage_that_wrote_the_renditions(self):
+        cdn = FileSystemStorage(location=self.media_root, base_url="https://cdn.example.org/media/")
+        with mock.patch.object(images, "rendition_storage", return_value=cdn):
+            images.render_instance(self.image)
+            compiled = self.client.get("/api/gallery/").json()["results"][0]
+            rendered = self.client.get(f"/api/gallery/{self.image.pk}/").json()
+
+        self.assertEqual(compiled["image_renditions"], rendered["image_renditions"])
+        self.assertTrue(rendered["image_renditions"]["src"].startswith("https://cdn.example.org/media/renditions/"))
+        for source in rendered["image_renditions"]["sources"]:
+            self.assertIn("https://cdn.example.org/media/renditions/", source["srcset"])
+
+
+def decode83(text):
+    value = 0
+    for character in text:
+        value = value * 83 + images.BASE83.index(character)
+    return value
+
+
+@override_settings(JOBS_EAGER=False)
+class PlaceholderTests(TestCase):
+    def test_blurhash_encodes_the_component_grid_and_average_colour(self):
+        for size, (x_components, y_components) in (((48, 32), (4, 3)), ((32, 48), (3, 4))):
+            with self.subTest(size=size):
+                image = Image.new("RGB", size, (200, 120, 40))
+                encoded = images.blurhash(image, x_components, y_components)
+
+                self.assertEqual(len(encoded), 6 + 2 * (x_components * y_components - 1))
+                self.assertEqual(decode83(encoded[0]), (x_components - 1) + (y_components - 1) * 9)
+                average = decode83(encoded[2:6])
+                self.assertEqual((average >> 16, average >> 8 & 255, average & 255), (200, 120, 40))
+
+    def test_portrait_uploads_get_a_tall_placeholder(self):
+        temporary_directory(self, "MEDIA_ROOT")
+        album = models.Album.objects.create(title="Vesak")
+        image = models.GalleryImage.objects.create(album=album, image=png_upload(size=(32, 48)))
+
+        placeholder = images.render_instance(image)["image_placeholder"]
+
+        self.assertEqual(placeholder["source"], image.image.name)
+        self.assertEqual(images.placeholder_structure(placeholder), {
+            "width": 32, "height": 48, "color": "#c87828", "blurhash": placeholder["blurhash"],
+        })
+        self.assertEqual(decode83(placeholder["blurhash"][0]), 2 + 3 * 9)
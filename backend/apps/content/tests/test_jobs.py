@@ -0,0 +1,86 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache as default_cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from .. import jobs, models
+from .helpers import LOCMEM_CACHE, png_upload, temporary_directory
+
+
+def fail(payload):
+    raise RuntimeError(f"cannot process {payload['name']}")
+
+
+@override_settings(JOBS_EAGER=False)
+@mock.patch.dict(jobs.HANDLERS, {"fail": fail})
+class JobQueueTests(TestCase):
+    def test_enqueue_is_idempotent_and_rearms_failed_jobs(self):
+        job = jobs.enqueue("fail", "fail:1", {"name": "a"})
+        self.assertEqual(jobs.enqueue("fail", "fail:1", {"name": "a"}).pk, job.pk)
+
+        models.Job.objects.filter(pk=job.pk).update(status=models.Job.FAILED, attempts=5, last_error="boom")
+        job = jobs.enqueue("fail", "fail:1", {"name": "a"})
+        self.assertEqual((job.status, job.attempts, job.last_error), (models.Job.PENDING, 0, ""))
+        self.assertEqual(models.Job.objects.count(), 1)
+
+    def test_a_job_is_claimed_by_one_worker(self):
+        job = jobs.enqueue("fail", "fail:1", {"name": "a"})
+        self.assertEqual(jobs.claim("worker-a", 10), [job.pk])
+        self.assertEqual(jobs.claim("worker-b", 10), [])
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.locked_by, job.attempts), (models.Job.RUNNING, "worker-a", 1))
+
+    def test_failures_back_off_then_fail_for_good(self):
+        job = jobs.enqueue("fail", "fail:1", {"name": "a"}, max_attempts=2)
+        [claimed] = jobs.claim("worker", 10)
+        before = timezone.now()
+        self.assertEqual(jobs.finish(claimed, jobs.execute(claimed)), models.Job.PENDING)
+
+        job.refresh_from_db()
+        self.assertGreaterEqual(job.run_after, before + timedelta(seconds=jobs.RETRY_DELAY))
+        self.assertIn("cannot process a", job.last_error)
+        self.assertEqual(jobs.claim("worker", 10), [])  # not due yet
+
+        models.Job.objects.filter(pk=job.pk).update(run_after=timezone.now())
+        [claimed] = jobs.claim("worker", 10)
+        self.assertEqual(jobs.finish(claimed, jobs.execute(claimed)), models.Job.FAILED)
+        self.assertEqual(jobs.claim("worker", 10), [])
+
+    def test_jobs_of_a_dead_worker_are_requeued_after_the_lock_timeout(self):
+        job = jobs.enqueue("fail", "fail:1", {"name": "a"})
+        jobs.claim("worker", 10)
+        self.assertEqual(jobs.requeue_stale(), 0)
+
+        later = timezone.now() + jobs.lock_timeout() + timedelta(seconds=1)
+        self.assertEqual(jobs.requeue_stale(later), 1)
+        self.assertEqual(jobs.claim("worker-b", 10), [job.pk])
+
+
+@override_settings(CACHES=LOCMEM_CACHE, THROTTLE_ENABLED=False, JOBS_EAGER=False, IMAGE_RENDITION_WIDTHS=(16,))
+class ImageJobTests(TestCase):
+    def setUp(self):
+        temporary_directory(self, "MEDIA_ROOT")
+        default_cache.clear()
+
+        self.news = models.News.objects.create(
+            title="Vesak programme", content="Details", published_at=timezone.now(), image=png_upload(),
+        )
+        self.url = f"/api/news/{self.news.slug}/"
+
+    def test_etag_changes_after_worker_writes_renditions(self):
+        before = self.client.get(self.url)
+        self.assertEqual(before.status_code, 200)
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=before["ETag"]).status_code, 304)
+
+        # The image job writes through QuerySet.update(), bypassing auto_now.
+        jobs.process_image({
+            "model": "content.news", "pk": self.news.pk, "field": "image", "name": self.news.image.name,
+        })
+
+        after = self.client.get(self.url, HTTP_IF_NONE_MATCH=before["ETag"])
+        self.assertEqual(after.status_code, 200)
+        self.assertNotEqual(after["ETag"], before["ETag"])
+        self.assertTrue(after.json()["image_renditions"])
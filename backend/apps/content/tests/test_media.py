@@ -0,0 +1,53 @@
+from django.test import SimpleTestCase
+
+from .. import media
+
+
+class CacheControlTests(SimpleTestCase):
+    digest = "3fa9" + "0" * 56 + "c0e1"
+
+    def test_names_carrying_a_full_sha256_are_immutable(self):
+        for path in (
+            f"news/3f/{self.digest}.jpg",
+            f"renditions/3f/{self.digest}-640w.webp",
+            f"publication_covers/previews/{self.digest}.jpg",
+        ):
+            with self.subTest(path=path):
+                self.assertIn("immutable", media.cache_control(path))
+
+    def test_other_names_revalidate(self):
+        for path in (
+            "publications/report-2024010112345678.pdf",
+            "news/photo_0123456789abcdef0123.jpg",
+            f"news/3f/{self.digest[:32]}.jpg",
+            f"news/copy-of-{self.digest}.jpg",
+        ):
+            with self.subTest(path=path):
+                self.assertNotIn("immutable", media.cache_control(path))
+
+
+class ParseRangeTests(SimpleTestCase):
+    def test_satisfiable_ranges(self):
+        cases = {
+            "bytes=0-99": (0, 99),
+            "bytes=500-": (500, 999),
+            "bytes=990-5000": (990, 999),
+            "bytes=-100": (900, 999),
+            "bytes=-5000": (0, 999),
+            "bytes = 0-9": (0, 9),
+            "bytes=999-999": (999, 999),
+        }
+        for header, expected in cases.items():
+            with self.subTest(header=header):
+                self.assertEqual(media.parse_range(header, 1000), expected)
+
+    def test_ignored_headers_send_the_whole_file(self):
+        for header in ("bytes=5-1", "bytes=0-1,5-6", "items=0-1", "bytes=-", "bytes=a-b", ""):
+            with self.subTest(header=header):
+                self.assertIsNone(media.parse_range(header, 1000))
+
+    def test_unsatisfiable_ranges(self):
+        for header, size in (("bytes=1000-", 1000), ("bytes=-0", 1000), ("bytes=0-", 0), ("bytes=-5", 0)):
+            with self.subTest(header=header, size=size):
+                with self.assertRaises(ValueError):
+                    media.parse_range(header, size)
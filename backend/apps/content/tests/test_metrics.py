@@ -0,0 +1,75 @@
+import re
+from unittest import mock
+
+from django.core.cache import cache as default_cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from .. import metrics
+from .helpers import LOCMEM_CACHE
+
+
+class RegistryTests(SimpleTestCase):
+    def observe(self, registry, now, **values):
+        recorder = metrics.RequestMetrics()
+        for name, value in values.items():
+            setattr(recorder, name, value)
+        with mock.patch.object(metrics.time, "monotonic", return_value=now):
+            registry.observe("news-list", "GET", 200, recorder)
+
+    def snapshot(self, registry, now):
+        with mock.patch.object(metrics.time, "monotonic", return_value=now):
+            return registry.snapshot()
+
+    def test_histograms_bucket_each_observation_once(self):
+        registry = metrics.Registry()
+        for queries in (0, 2, 2, 7, 500):
+            self.observe(registry, 1000.0, queries=queries)
+        histogram = self.snapshot(registry, 1000.0)[0]["news-list", "db_queries"]
+        self.assertEqual(dict(zip(metrics.QUERY_BUCKETS, histogram.counts)), {
+            0: 1, 1: 0, 2: 2, 3: 0, 4: 0, 5: 0, 10: 1, 20: 0, 50: 0, 100: 0,
+        })
+        self.assertEqual((histogram.count, histogram.sum), (5, 511))
+
+    @override_settings(METRICS_WINDOW=100)
+    def test_histograms_cover_the_window_and_counters_do_not(self):
+        registry = metrics.Registry()
+        self.observe(registry, 1000.0, total=0.02)
+        self.observe(registry, 1050.0, total=0.03)
+
+        histograms, requests = self.snapshot(registry, 1095.0)
+        self.assertEqual(histograms["news-list", "request_duration_seconds"].count, 2)
+        histograms, requests = self.snapshot(registry, 1105.0)
+        self.assertEqual(histograms["news-list", "request_duration_seconds"].count, 1)
+        histograms, requests = self.snapshot(registry, 1200.0)
+        self.assertEqual(histograms, {})
+        self.assertEqual(requests, {("news-list", "GET", 200): 2})
+
+
+@override_settings(CACHES=LOCMEM_CACHE, THROTTLE_ENABLED=False, METRICS_TOKEN="scrape-me")
+class MetricsEndpointTests(TestCase):
+    def setUp(self):
+        default_cache.clear()
+        metrics.registry.clear()
+        self.addCleanup(metrics.registry.clear)
+
+    def test_server_timing_reports_the_queries_a_request_ran(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/stats/")
+        self.assertGreater(len(queries), 0)
+        timing = response["Server-Timing"]
+        self.assertRegex(timing, r"^total;dur=[\d.]+, db;dur=[\d.]+;desc=\"\d+ queries\", serialize;dur=")
+        self.assertEqual(int(re.search(r'"(\d+) queries"', timing).group(1)), len(queries))
+
+    def test_prometheus_exposition_needs_the_token(self):
+        self.client.get("/api/stats/")
+        self.assertEqual(self.client.get("/api/_metrics").status_code, 403)
+
+        response = self.client.get("/api/_metrics", HTTP_AUTHORIZATION="Bearer scrape-me")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        body = response.content.decode()
+        self.assertIn('piriven_requests_total{route="stats-list",method="GET",status="200"} 1', body)
+        self.assertIn('piriven_request_duration_seconds_bucket{route="stats-list",le="+Inf"} 1', body)
+        self.assertIn('piriven_throttle_requests_total{scope="write",outcome="allowed"}', body)
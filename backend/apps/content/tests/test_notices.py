@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+from django.core.cache import cache as default_cache
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+from rest_framework.request import Request
+
+from .. import models, views
+from .helpers import LOCMEM_CACHE
+
+
+@override_settings(CACHES=LOCMEM_CACHE, THROTTLE_ENABLED=False, CONTENT_CACHE_TIMEOUT=3600)
+class NoticeExpiryTests(TestCase):
+    def setUp(self):
+        default_cache.clear()
+        now = timezone.now()
+        self.expired = models.Notice.objects.create(title="Closed", content="x", published_at=now, expires_at=now - timedelta(days=1))
+        models.Notice.objects.create(title="Open", content="x", published_at=now, expires_at=now + timedelta(minutes=2))
+        models.Notice.objects.create(title="Standing", content="x", published_at=now)
+
+    def titles(self, url):
+        return sorted(notice["title"] for notice in self.client.get(url).json()["results"])
+
+    def test_listings_drop_expired_notices(self):
+        self.assertEqual(self.titles("/api/notices/"), ["Open", "Standing"])
+        self.assertEqual(self.titles("/api/notices/?include_expired=1"), ["Closed", "Open", "Standing"])
+        self.assertEqual(self.client.get(f"/api/notices/{self.expired.pk}/").status_code, 200)
+
+    def test_cached_list_expires_with_the_next_notice(self):
+        view = views.NoticeViewSet(action="list", request=Request(RequestFactory().get("/api/notices/")))
+        self.assertTrue(110 <= view.get_cache_timeout() <= 120)
+
+        view.request = Request(RequestFactory().get("/api/notices/", {"include_expired": "1"}))
+        self.assertEqual(view.get_cache_timeout(), 3600)
@@ -0,0 +1,31 @@
+import io
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from .. import models, views
+from .helpers import LOCMEM_CACHE
+
+
+class QueryBudgetTests(TestCase):
+    def check_budgets(self):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        try:
+            call_command("check_query_budgets", "--sizes", "2,6", stdout=stdout, stderr=stderr)
+        finally:
+            self.output = stdout.getvalue() + stderr.getvalue()
+
+    def test_every_endpoint_stays_within_its_budget(self):
+        with self.settings(CACHES=LOCMEM_CACHE):
+            self.check_budgets()
+        self.assertIn("OK   /api/albums/ [list]", self.output)
+        self.assertIn("OK   /api/publications/ [list]", self.output)
+        self.assertNotIn("FAIL", self.output)
+
+    def test_album_images_without_prefetch_fail_the_check(self):
+        unprefetched = models.Album.objects.all()
+        with self.settings(CACHES=LOCMEM_CACHE), mock.patch.object(views.AlbumViewSet, "queryset", unprefetched):
+            with self.assertRaisesMessage(CommandError, "over query budget"):
+                self.check_budgets()
+        self.assertIn("FAIL /api/albums/ [list]", self.output)
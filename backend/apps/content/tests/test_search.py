@@ -0,0 +1,44 @@
+from datetime import timedelta
+from unittest import mock, skipUnless
+
+from django.test import TestCase
+from django.utils import timezone
+
+from .. import models, search
+
+
+@skipUnless(isinstance(search.get_backend(), search.SQLiteBackend), "needs the SQLite FTS5 index")
+class SearchRankingTests(TestCase):
+    def test_candidates_are_the_newest_matches_across_kinds(self):
+        now = timezone.now()
+        for day in range(3):
+            models.News.objects.create(title=f"Pirivena results {day}", content="x", published_at=now - timedelta(days=day))
+        for year in range(3):
+            models.Notice.objects.create(title=f"Pirivena notice {year}", content="x", published_at=now - timedelta(days=400 * (year + 1)))
+        # rebuild() inserts kind by kind, so the old notices get the highest rowids.
+        search.rebuild()
+
+        with mock.patch.object(search, "MAX_RESULTS", 3):
+            results = search.SearchResults("pirivena")
+            self.assertEqual(results.count(), 3)
+            self.assertEqual({document.kind for document in results[0:10]}, {"news"})
+
+            notices = search.SearchResults("pirivena", ["notice"])
+            self.assertEqual([document.kind for document in notices[0:10]], ["notice"] * 3)
+
+    def test_title_matches_outrank_body_matches_in_either_language(self):
+        now = timezone.now()
+        models.News.objects.create(title="Annual report", content="dhamma school timetable", published_at=now)
+        models.Notice.objects.create(title="Dhamma school", content="Open on Sunday", published_at=now - timedelta(days=30))
+        models.Notice.objects.create(
+            title="Sunday classes", title_si="දහම් පාසල", content="Details", published_at=now - timedelta(days=60),
+        )
+        models.News.objects.create(
+            title="Weekly notes", content="x", content_si="දහම් පාසල නිවාඩු", published_at=now - timedelta(days=1),
+        )
+
+        titles = [document.title for document in search.SearchResults("dhamma school")[0:10]]
+        self.assertEqual(titles, ["Dhamma school", "Annual report"])
+
+        titles = [document.title for document in search.SearchResults("දහම් පාසල")[0:10]]
+        self.assertEqual(titles, ["Sunday classes", "Weekly notes"])
@@ -0,0 +1,45 @@
+from django.test import TestCase, override_settings
+
+from .. import models, siteconfig
+from .helpers import LOCMEM_CACHE
+
+
+@override_settings(CACHES=LOCMEM_CACHE, THROTTLE_ENABLED=False, SITE_CONFIG_CHECK_INTERVAL=60)
+class SiteConfigSnapshotTests(TestCase):
+    def setUp(self):
+        siteconfig.forget()
+        self.addCleanup(siteconfig.forget)
+
+    def test_version_moves_only_when_the_data_changes(self):
+        first = siteconfig.current()
+        self.assertEqual(siteconfig.rebuild().version, first.version)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            models.Stat.objects.create(label="Pirivenas", value="750")
+
+        second = siteconfig.current()
+        self.assertEqual(second.version, first.version + 1)
+        self.assertEqual([stat["label"] for stat in second.data["stats"]], ["Pirivenas"])
+        self.assertNotEqual(second.etag, first.etag)
+
+    def test_requests_between_version_checks_run_no_queries(self):
+        first = self.client.get("/api/site-config/")
+        self.assertEqual(first.json()["version"], siteconfig.current().version)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get("/api/site-config/").json(), first.json())
+            self.assertEqual(self.client.get("/api/site-config/", HTTP_IF_NONE_MATCH=first["ETag"]).status_code, 304)
+
+    def test_other_processes_pick_up_a_new_version_at_their_next_check(self):
+        stale = siteconfig.current()
+        # Another process rebuilt the snapshot; this one still holds the old version in memory.
+        models.SiteConfigSnapshot.objects.filter(pk=siteconfig.SNAPSHOT_ID).update(
+            version=stale.version + 1, digest="f" * 64, data={**stale.data, "stats": [{"label": "Students"}]},
+        )
+
+        with self.assertNumQueries(0):
+            self.assertEqual(siteconfig.current(), stale)
+        with override_settings(SITE_CONFIG_CHECK_INTERVAL=0):
+            fresh = siteconfig.current()
+        self.assertEqual(fresh.version, stale.version + 1)
+        self.assertEqual(fresh.data["stats"], [{"label": "Students"}])
@@ -0,0 +1,54 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from .. import models, spool
+from .helpers import LOCMEM_CACHE, temporary_directory
+
+
+@override_settings(CACHES=LOCMEM_CACHE, SPOOL_BATCH_SIZE=2)
+class SpoolCommitTests(TestCase):
+    def setUp(self):
+        temporary_directory(self, "SPOOL_DIR")
+        self.received = timezone.now() - timedelta(hours=6)
+
+    def append(self, kind, data):
+        with mock.patch.object(spool.timezone, "now", return_value=self.received):
+            return spool.append(kind, data)
+
+    def test_flush_commits_records_dated_when_received(self):
+        record_id = self.append("contact", {"name": "Nimal", "email": "nimal@example.com", "subject": "", "message": "Hello"})
+        for address in ("a@example.com", "b@example.com", "c@example.com"):
+            self.append("newsletter", {"email": address})
+
+        self.assertEqual(spool.flush(), {"contact": 1, "newsletter": 3})
+
+        message = models.ContactMessage.objects.get()
+        self.assertEqual(message.submission_id.hex, record_id)
+        self.assertEqual(message.created_at, self.received)
+        self.assertEqual(
+            set(models.NewsletterSubscription.objects.values_list("created_at", flat=True)), {self.received},
+        )
+        for state in ("new", "cur"):
+            self.assertEqual(list((spool.spool_dir() / "contact" / state).iterdir()), [])
+
+    def test_replayed_records_are_committed_once(self):
+        self.append("contact", {"name": "Nimal", "email": "nimal@example.com", "subject": "", "message": "Hello"})
+        self.append("newsletter", {"email": "a@example.com"})
+        records = {
+            kind: [(path.name, path.read_text(encoding="utf-8")) for path in (spool.spool_dir() / kind / "new").iterdir()]
+            for kind in ("contact", "newsletter")
+        }
+        spool.flush()
+        existing = models.NewsletterSubscription.objects.get().created_at
+
+        # A committer that died after inserting leaves its claimed records behind.
+        for kind, files in records.items():
+            for name, text in files:
+                (spool.spool_dir() / kind / "new" / name).write_text(text, encoding="utf-8")
+        self.assertEqual(spool.flush(), {"contact": 1, "newsletter": 1})
+
+        self.assertEqual(models.ContactMessage.objects.count(), 1)
+        self.assertEqual(models.NewsletterSubscription.objects.get().created_at, existing)
@@ -0,0 +1,45 @@
+import io
+import os
+
+from django.core.cache import cache as default_cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from .. import media, models
+from .helpers import LOCMEM_CACHE, png_upload, temporary_directory
+
+
+@override_settings(CACHES=LOCMEM_CACHE, THROTTLE_ENABLED=False, JOBS_EAGER=False)
+class ContentAddressedStorageTests(TestCase):
+    def setUp(self):
+        self.media_root = temporary_directory(self, "MEDIA_ROOT")
+        default_cache.clear()
+
+    def test_identical_uploads_share_one_blob(self):
+        first = models.News.objects.create(title="One", content="x", published_at=timezone.now(), image=png_upload("a.png"))
+        second = models.News.objects.create(title="Two", content="x", published_at=timezone.now(), image=png_upload("b.png"))
+
+        self.assertEqual(first.image.name, second.image.name)
+        self.assertRegex(first.image.name, r"^news/[0-9a-f]{2}/[0-9a-f]{64}\.png$")
+        self.assertTrue(media.HASHED_NAME.match(os.path.basename(first.image.name)))
+
+    def test_dedupe_changes_the_list_etag(self):
+        news = models.News.objects.create(title="Vesak", content="x", published_at=timezone.now())
+        os.makedirs(os.path.join(self.media_root, "news"))
+        with open(os.path.join(self.media_root, "news", "vesak.png"), "wb") as handle:
+            handle.write(png_upload().read())
+        # An upload made before content-addressed storage, still under its original name.
+        models.News.objects.filter(pk=news.pk).update(image="news/vesak.png")
+
+        before = self.client.get("/api/news/")
+        self.assertTrue(before.json()["results"][0]["image"].endswith("/news/vesak.png"))
+
+        call_command("dedupe_media", stdout=io.StringIO())
+
+        after = self.client.get("/api/news/", HTTP_IF_NONE_MATCH=before["ETag"])
+        self.assertEqual(after.status_code, 200)
+        self.assertNotEqual(after["ETag"], before["ETag"])
+        news.refresh_from_db()
+        self.assertTrue(after.json()["results"][0]["image"].endswith(news.image.name))
+        self.assertNotEqual(news.image.name, "news/vesak.png")
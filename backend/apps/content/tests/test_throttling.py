@@ -0,0 +1,51 @@
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from .. import throttling
+from .helpers import LOCMEM_CACHE
+
+
+class TokenBucketTests(SimpleTestCase):
+    def test_parse_rate(self):
+        self.assertEqual(throttling.parse_rate("10/min"), (10, 10 / 60))
+        self.assertEqual(throttling.parse_rate("5/hour"), (5, 5 / 3600))
+        self.assertIsNone(throttling.parse_rate(""))
+
+    def test_a_full_bucket_allows_a_burst_then_the_refill_rate(self):
+        store = throttling.MemoryStore()
+        waits = [store.take("read:1.2.3.4", 3, 1.0, 100.0) for _ in range(4)]
+        self.assertEqual(waits, [0, 0, 0, 1.0])
+        self.assertAlmostEqual(store.take("read:1.2.3.4", 3, 1.0, 100.5), 0.5)
+        self.assertEqual(store.take("read:1.2.3.4", 3, 1.0, 101.0), 0)
+        # Other clients have their own bucket.
+        self.assertEqual(store.take("read:5.6.7.8", 3, 1.0, 101.0), 0)
+
+    def test_memory_store_keeps_only_the_most_recent_clients(self):
+        store = throttling.MemoryStore(max_keys=2)
+        for ident in ("a", "b", "c"):
+            store.take(ident, 1, 1.0, 0.0)
+        self.assertEqual(list(store.buckets), ["b", "c"])
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHE, THROTTLE_ENABLED=True, THROTTLE_CACHE_ALIAS="", INGEST_SPOOL=False,
+    THROTTLE_RATES={"read": "", "write": "2/min", "email": "5/hour"},
+)
+class ThrottledEndpointTests(TestCase):
+    def setUp(self):
+        throttling.get_store().clear()
+        self.addCleanup(throttling.get_store().clear)
+
+    def subscribe(self, number, address="10.0.0.1"):
+        return self.client.post("/api/newsletter/", {"email": f"reader{number}@example.com"}, REMOTE_ADDR=address)
+
+    def test_writes_over_the_budget_get_429_with_retry_after(self):
+        self.assertEqual([self.subscribe(n).status_code for n in range(2)], [201, 201])
+        refused = self.subscribe(2)
+        self.assertEqual(refused.status_code, 429)
+        self.assertTrue(1 <= int(refused["Retry-After"]) <= 30)
+        self.assertEqual(self.subscribe(3, address="10.0.0.2").status_code, 201)
+
+    def test_exempt_addresses_are_not_charged(self):
+        with self.settings(THROTTLE_EXEMPT_IPS=["10.0.0.1"]):
+            self.assertEqual({self.subscribe(n).status_code for n in range(4)}, {201})
+        self.assertEqual(throttling.counters()["write"]["throttled"], 0)
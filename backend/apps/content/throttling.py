@@ -0,0 +1,240 @@
+"""Token-bucket throttling for the public API.
+
+Three budgets, each a bucket of ``N`` requests refilled at ``N`` per period (``"300/min"``):
+
+* ``read`` -- GET/HEAD per client IP (off unless ``THROTTLE_READ_RATE`` is set);
+* ``write`` -- POST/PUT/PATCH/DELETE per client IP;
+* ``email`` -- submissions per e-mail address (contact form, newsletter), whatever the IP.
+
+A full bucket allows a burst of ``N``; after that requests are admitted at the refill rate.
+Refused requests get ``429`` with ``Retry-After`` (seconds until a token is available).
+Staff users are never throttled, nor are ``THROTTLE_EXEMPT_IPS`` (say, the Next.js server
+rendering pages for every visitor) charged to the per-IP budgets.
+
+Buckets live in this process's memory by default, so each worker enforces its own budget.
+``THROTTLE_CACHE_ALIAS`` names a cache (e.g. Redis) to share buckets and counters between
+workers. The shared updates are read-modify-write, so concurrent requests can occasionally
+slip through. Allowed/throttled counts per budget are served to staff at ``/api/_throttle/``.
+"""
+import logging
+import math
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework import permissions
+from rest_framework.exceptions import Throttled
+from rest_framework.throttling import BaseThrottle
+
+
+logger = logging.getLogger(__name__)
+
+SCOPES = ("read", "write", "email")
+DEFAULT_RATES = {"read": "", "write": "10/min", "email": "5/hour"}
+PERIODS = {"s": 1, "m": 60, "h": 60 * 60, "d": 24 * 60 * 60}
+KEY_PREFIX = "throttle:"
+OUTCOMES = ("allowed", "throttled")
+
+
+def throttle_enabled():
+    return getattr(settings, "THROTTLE_ENABLED", True)
+
+
+def parse_rate(rate):
+    """``"10/min"`` -> ``(capacity, tokens per second)``; ``None`` for an empty rate (no limit)."""
+    if not rate:
+        return None
+    count, period = rate.split("/")
+    capacity = int(count)
+    seconds = PERIODS[period.strip()[0].lower()]
+    return capacity, capacity / seconds
+
+
+def rate_for(scope):
+    return getattr(settings, "THROTTLE_RATES", {}).get(scope, DEFAULT_RATES[scope])
+
+
+def refill(state, capacity, rate, now):
+    """Tokens in a bucket last seen as ``state`` (``(tokens, timestamp)``), at ``now``."""
+    if state is None:
+        return float(capacity)
+    tokens, updated = state
+    return min(float(capacity), tokens + (now - updated) * rate)
+
+
+def consume(state, capacity, rate, now):
+    """Take one token. Returns ``(new state, seconds to wait)``; a wait of 0 means allowed."""
+    tokens = refill(state, capacity, rate, now)
+    if tokens >= 1:
+        return (tokens - 1, now), 0
+    return (tokens, now), (1 - tokens) / rate
+
+
+class MemoryStore:
+    """Buckets and counters in this process, bounded to the ``max_keys`` most recent clients."""
+
+    def __init__(self, max_keys=10_000):
+        self.max_keys = max_keys
+        self.lock = threading.Lock()
+        self.buckets = OrderedDict()
+        self.counts = Counter()
+
+    def take(self, key, capacity, rate, now):
+        with self.lock:
+            state, wait = consume(self.buckets.pop(key, None), capacity, rate, now)
+            self.buckets[key] = state
+            while len(self.buckets) > self.max_keys:
+                self.buckets.popitem(last=False)
+        return wait
+
+    def count(self, scope, outcome):
+        with self.lock:
+            self.counts[scope, outcome] += 1
+
+    def counters(self):
+        with self.lock:
+            return dict(self.counts)
+
+    def clear(self):
+        with self.lock:
+            self.buckets.clear()
+            self.counts.clear()
+
+
+class CacheStore:
+    """Buckets and counters in a Django cache shared by every worker."""
+
+    def __init__(self, alias):
+        self.cache = caches[alias]
+
+    def take(self, key, capacity, rate, now):
+        state, wait = consume(self.cache.get(KEY_PREFIX + key), capacity, rate, now)
+        # An idle bucket is full again after capacity / rate seconds; let it expire then.
+        self.cache.set(KEY_PREFIX + key, state, math.ceil(capacity / rate) + 1)
+        return wait
+
+    def _counter_key(self, scope, outcome):
+        return f"{KEY_PREFIX}count:{scope}:{outcome}"
+
+    def count(self, scope, outcome):
+        key = self._counter_key(scope, outcome)
+        if not self.cache.add(key, 1, None):
+            try:
+                self.cache.incr(key)
+            except ValueError:  # evicted between add() and incr()
+                self.cache.add(key, 1, None)
+
+    def counters(self):
+        keys = {self._counter_key(scope, outcome): (scope, outcome) for scope in SCOPES for outcome in OUTCOMES}
+        return {keys[key]: value for key, value in self.cache.get_many(list(keys)).items()}
+
+    def clear(self):
+        self.cache.delete_many([self._counter_key(scope, outcome) for scope in SCOPES for outcome in OUTCOMES])
+
+
+_memory_store = MemoryStore()
+
+
+def get_store():
+    alias = getattr(settings, "THROTTLE_CACHE_ALIAS", "")
+    return CacheStore(alias) if alias else _memory_store
+
+
+def check(scope, ident):
+    """Charge one request from ``ident`` to ``scope``'s bucket; returns the wait (0 = allowed)."""
+    parsed = parse_rate(rate_for(scope))
+    if parsed is None or not ident:
+        return 0
+    capacity, rate = parsed
+    store = get_store()
+    wait = store.take(f"{scope}:{ident}", capacity, rate, time.time())
+    store.count(scope, "throttled" if wait else "allowed")
+    if wait:
+        logger.info("Throttled %s request from %s (retry in %.1fs)", scope, ident, wait)
+    return wait
+
+
+def normalized_email(value):
+    return value.strip().lower() if isinstance(value, str) else ""
+
+
+def is_exempt(request):
+    user = getattr(request, "user", None)
+    return not throttle_enabled() or bool(user is not None and user.is_staff)
+
+
+def retry_after(wait):
+    return str(max(1, math.ceil(wait)))
+
+
+def client_ident(request):
+    """Client IP as DRF's throttles see it (honours ``NUM_PROXIES``); empty when exempt."""
+    ident = BaseThrottle().get_ident(request)
+    return "" if ident in getattr(settings, "THROTTLE_EXEMPT_IPS", ()) else ident
+
+
+def throttled_detail(wait):
+    return str(Throttled(wait).detail)
+
+
+def counters():
+    """``{scope: {"rate": ..., "allowed": n, "throttled": n}}`` from the active store."""
+    counts = get_store().counters()
+    return {
+        scope: {"rate": rate_for(scope), **{outcome: counts.get((scope, outcome), 0) for outcome in OUTCOMES}}
+        for scope in SCOPES
+    }
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """DRF throttle charging one bucket; subclasses pick the scope and the client key."""
+
+    scope = None
+
+    def applies(self, request):
+        return True
+
+    def get_key(self, request):
+        return client_ident(request)
+
+    def allow_request(self, request, view):
+        self.wait_seconds = 0
+        if is_exempt(request) or not self.applies(request):
+            return True
+        self.wait_seconds = check(self.scope, self.get_key(request))
+        return not self.wait_seconds
+
+    def wait(self):
+        return self.wait_seconds or None
+
+
+class ReadThrottle(TokenBucketThrottle):
+    scope = "read"
+
+    def applies(self, request):
+        return request.method in permissions.SAFE_METHODS
+
+
+class WriteThrottle(TokenBucketThrottle):
+    scope = "write"
+
+    def applies(self, request):
+        return request.method not in permissions.SAFE_METHODS
+
+
+class EmailThrottle(TokenBucketThrottle):
+    """Submissions naming the same ``email``, whichever IP they come from."""
+
+    scope = "email"
+
+    def applies(self, request):
+        return request.method not in permissions.SAFE_METHODS
+
+    def get_key(self, request):
+        try:
+            data = request.data
+        except Exception:  # unparseable body: the view will answer 400 anyway
+            return ""
+        return normalized_email(data.get("email") if hasattr(data, "get") else None)
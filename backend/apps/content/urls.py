@@ -26,6 +26,14 @@ router.register(r"contact-info", views.ContactInfoViewSet, basename="contact-inf
 router.register(r"footer-about", views.FooterAboutViewSet, basename="footer-about")
 
 urlpatterns = [
+    # Ahead of the router: POSTs are spooled and committed in batches (apps/content/spool.py).
+    path("contact/", views.spooled_create("contact", views.ContactMessageViewSet), name="contact-submit"),
+    path("newsletter/", views.spooled_create("newsletter", views.NewsletterSubscriptionViewSet), name="newsletter-submit"),
+    path("bundle/home/", views.HomeBundleView.as_view(), name="bundle-home"),
+    path("site-config/", views.SiteConfigView.as_view(), name="site-config"),
+    path("_throttle/", views.ThrottleStatsView.as_view(), name="throttle-stats"),
+    path("_metrics", views.MetricsView.as_view(), name="metrics"),
+    path("search/", views.SearchView.as_view(), name="search"),
     path("", include(router.urls)),
 ]
 
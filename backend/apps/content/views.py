@@ -1,18 +1,66 @@
-﻿from rest_framework import viewsets, mixins
+﻿import hashlib
+import json
+import math
+
+from asgiref.sync import sync_to_async
+
+from rest_framework import permissions, viewsets, mixins
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework import filters
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
+from django.conf import settings
 from django.db import models as django_models
-
-from . import models, serializers
+from django.db.models.functions import Left
+from django.http import Http404, JsonResponse
+from django.utils.cache import get_conditional_response
+from django.utils import timezone
+from django.utils.http import quote_etag
+from django.views.decorators.csrf import csrf_exempt
+
+from . import jobs, metrics, models, search, serializers, siteconfig, spool, throttling
 from . import serializers as s
+from .cache import CachedResponseMixin, cached_section
+from .compiled import CompiledListMixin
+from .conditional import ConditionalGetMixin
+from .metrics import MetricsMixin
+from .pagination import FeedPaginationMixin, StandardPagination
+from .projection import ProjectionMixin
+from .renderers import FastJSONRenderer
+
+
+class PublicReadOnlyMixin:
+    """GET-only, anonymous, JSON-only variant of a view for the public read API
+    (apps/content/public_urls.py). Without authentication or permission classes a request
+    never touches a session or user; writes answer 405."""
+
+    http_method_names = ["get", "head", "options"]
+    authentication_classes = ()
+    permission_classes = ()
+    renderer_classes = (FastJSONRenderer,)
+
+
+def public_view(view_class):
+    return type(f"Public{view_class.__name__}", (PublicReadOnlyMixin, view_class), {})
+
+
+NOTICE_EXCERPT_LENGTH = 300
+INCLUDE_EXPIRED_PARAM = "include_expired"
+DOWNLOAD_TOP_PARAM = "top"
+DOWNLOAD_TOP_MAX = 50
 
 
-class NewsViewSet(viewsets.ModelViewSet):
+class NewsViewSet(MetricsMixin, FeedPaginationMixin, ProjectionMixin, ConditionalGetMixin, CachedResponseMixin, CompiledListMixin, viewsets.ModelViewSet):
     queryset = models.News.objects.all().prefetch_related("gallery_images").order_by("-published_at")
     serializer_class = s.NewsSerializer
+    list_serializer_class = s.NewsListSerializer
+    list_actions = ("list", "featured")
+    deferrable_fields = ("excerpt", "excerpt_si", "content", "content_si")
+    query_budget = 4
+    cache_dependencies = (models.News, models.NewsImage)
+    conditional_relations = ("gallery_images",)
     lookup_field = "slug"
     lookup_value_regex = "[0-9A-Za-z-]+"
 
@@ -31,60 +79,113 @@ class NewsViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=["get"])
     def featured(self, request):
-        qs = self.get_queryset().filter(is_featured=True)[:5]
-        return Response(self.get_serializer(qs, many=True).data)
+        def build():
+            qs = self.get_queryset().filter(is_featured=True)[:5]
+            return Response(self.get_serializer(qs, many=True).data)
+        return self.cached_response(request, build)
 
 
-class NoticeViewSet(viewsets.ModelViewSet):
+class NoticeViewSet(MetricsMixin, ProjectionMixin, ConditionalGetMixin, CachedResponseMixin, CompiledListMixin, viewsets.ModelViewSet):
     queryset = models.Notice.objects.all().prefetch_related("gallery_images")
     serializer_class = s.NoticeSerializer
+    list_serializer_class = s.NoticeListSerializer
+    deferrable_fields = ("content", "content_si")
+    query_budget = 4
+    cache_dependencies = (models.Notice, models.NoticeImage)
+    conditional_relations = ("gallery_images",)
 
+    def include_expired(self):
+        value = self.request.query_params.get(INCLUDE_EXPIRED_PARAM, "") if self.request else ""
+        return value.lower() in ("true", "1", "yes")
 
-class PublicationViewSet(viewsets.ModelViewSet):
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if self.action == "list":
+            if not self.include_expired():
+                # Detail pages stay reachable; only the listings drop expired notices.
+                qs = qs.current()
+            # Cut the card excerpts in SQL so the full bodies never leave the database.
+            qs = qs.annotate(
+                content_excerpt=Left("content", NOTICE_EXCERPT_LENGTH),
+                content_si_excerpt=Left("content_si", NOTICE_EXCERPT_LENGTH),
+            )
+        return qs
+
+    def get_cache_timeout(self):
+        timeout = super().get_cache_timeout()
+        if self.action != "list" or self.include_expired():
+            return timeout
+        # The cached list must not outlive the next notice that drops out of it.
+        next_expiry = models.Notice.objects.next_expiry()
+        if next_expiry is None:
+            return timeout
+        return max(1, min(timeout, math.ceil((next_expiry - timezone.now()).total_seconds())))
+
+
+class PublicationViewSet(MetricsMixin, FeedPaginationMixin, ProjectionMixin, ConditionalGetMixin, CachedResponseMixin, CompiledListMixin, viewsets.ModelViewSet):
     queryset = models.Publication.objects.filter(is_active=True).order_by("-published_at")
     serializer_class = s.PublicationSerializer
+    deferrable_fields = ("description", "description_si")
+    query_budget = 3
 
 
-class VideoViewSet(viewsets.ModelViewSet):
+class VideoViewSet(MetricsMixin, FeedPaginationMixin, ProjectionMixin, ConditionalGetMixin, CachedResponseMixin, viewsets.ModelViewSet):
     queryset = models.Video.objects.all().order_by("-published_at")
     serializer_class = s.VideoSerializer
+    deferrable_fields = ("description", "description_si")
+    query_budget = 3
 
 
-class AlbumViewSet(viewsets.ModelViewSet):
-    queryset = models.Album.objects.all()
+class AlbumViewSet(MetricsMixin, ProjectionMixin, ConditionalGetMixin, CachedResponseMixin, viewsets.ModelViewSet):
+    queryset = models.Album.objects.all().prefetch_related(
+        django_models.Prefetch(
+            "images",
+            queryset=models.GalleryImage.objects.order_by("position", "created_at"),
+        )
+    )
     serializer_class = serializers.AlbumSerializer
+    deferrable_fields = ("description", "description_si")
+    query_budget = 4
+    cache_dependencies = (models.Album, models.GalleryImage)
+    conditional_relations = ("images",)
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ["is_active", "slug"]
     search_fields = ["title", "description"]
     ordering_fields = ["position", "published_at", "created_at"]
     ordering = ["position", "-published_at", "-created_at"]
 
-class GalleryImageViewSet(viewsets.ModelViewSet):
+class GalleryImageViewSet(MetricsMixin, ConditionalGetMixin, CachedResponseMixin, CompiledListMixin, viewsets.ModelViewSet):
     queryset = models.GalleryImage.objects.all()
     serializer_class = serializers.GalleryImageSerializer
+    query_budget = 3
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ["album"]
     ordering_fields = ["position", "created_at"]
 
 
-class EventViewSet(viewsets.ModelViewSet):
+class EventViewSet(MetricsMixin, ProjectionMixin, ConditionalGetMixin, CachedResponseMixin, CompiledListMixin, viewsets.ModelViewSet):
     queryset = models.Event.objects.all().order_by("start_date")
     serializer_class = s.EventSerializer
+    deferrable_fields = ("description", "description_si")
+    query_budget = 3
 
 
-class StatViewSet(viewsets.ModelViewSet):
-    queryset = models.Stat.objects.all()
+class StatViewSet(MetricsMixin, ConditionalGetMixin, CachedResponseMixin, CompiledListMixin, viewsets.ModelViewSet):
+    queryset = models.Stat.objects.order_by("id")
     serializer_class = s.StatSerializer
+    query_budget = 3
 
 
-class ExternalLinkViewSet(viewsets.ModelViewSet):
+class ExternalLinkViewSet(MetricsMixin, ConditionalGetMixin, CachedResponseMixin, CompiledListMixin, viewsets.ModelViewSet):
     queryset = models.ExternalLink.objects.all()
     serializer_class = s.ExternalLinkSerializer
+    query_budget = 3
 
 
-class FooterLinkViewSet(viewsets.ModelViewSet):
+class FooterLinkViewSet(MetricsMixin, ConditionalGetMixin, CachedResponseMixin, CompiledListMixin, viewsets.ModelViewSet):
     queryset = models.FooterLink.objects.all().order_by("position", "name")
     serializer_class = s.FooterLinkSerializer
+    query_budget = 3
 
     def get_queryset(self):
         qs = super().get_queryset()
@@ -94,43 +195,157 @@ class FooterLinkViewSet(viewsets.ModelViewSet):
         return qs
 
 
-class HeroSlideViewSet(viewsets.ModelViewSet):
+class HeroSlideViewSet(MetricsMixin, ConditionalGetMixin, CachedResponseMixin, CompiledListMixin, viewsets.ModelViewSet):
     queryset = models.HeroSlide.objects.all().order_by("position")
     serializer_class = s.HeroSlideSerializer
+    query_budget = 3
 
 
-class NewsletterSubscriptionViewSet(mixins.CreateModelMixin,
+class NewsletterSubscriptionViewSet(MetricsMixin, FeedPaginationMixin,
+                                    mixins.CreateModelMixin,
                                     mixins.ListModelMixin,
                                     viewsets.GenericViewSet):
     queryset = models.NewsletterSubscription.objects.all().order_by("-created_at")
     serializer_class = s.NewsletterSubscriptionSerializer
+    query_budget = 2
+    keyset_field = "created_at"
 
+    def get_permissions(self):
+        # Subscriber addresses are private; anyone may subscribe, only staff may list them.
+        if self.action == "list":
+            return [permissions.IsAdminUser()]
+        return super().get_permissions()
 
-class DownloadCategoryViewSet(viewsets.ModelViewSet):
-    queryset = models.DownloadCategory.objects.all().order_by("position").prefetch_related(
-        django_models.Prefetch(
-            "publications",
-            queryset=models.Publication.objects.filter(is_active=True).order_by("-published_at", "-created_at")
+
+def active_publications():
+    return models.Publication.objects.filter(is_active=True).order_by("-published_at", "-created_at")
+
+
+class DownloadCategoryViewSet(MetricsMixin, ConditionalGetMixin, CachedResponseMixin, viewsets.ModelViewSet):
+    """Download categories with their publications.
+
+    ``?top=N`` nests only each category's newest N publications (one windowed prefetch query,
+    so the payload is O(categories)); ``publications_count`` always has the full total and
+    ``/download-categories/{id}/publications/`` pages through the rest.
+    """
+
+    queryset = models.DownloadCategory.objects.annotate(
+        publications_count=django_models.Count(
+            "publications", filter=django_models.Q(publications__is_active=True)
         )
+    ).order_by("position").prefetch_related(
+        django_models.Prefetch("publications", queryset=active_publications())
     )
     serializer_class = s.DownloadCategorySerializer
+    query_budget = {"list": 4, "retrieve": 4, "publications": 3}
+    cache_dependencies = (models.DownloadCategory, models.Publication)
+    conditional_relations = ("publications",)
+    pagination_class = StandardPagination  # the downloads page pages publications with ?page_size=
+    lookup_value_regex = "[0-9]+"
+
+    def publications_limit(self):
+        value = self.request.query_params.get(DOWNLOAD_TOP_PARAM) if self.request else None
+        try:
+            return min(max(int(value), 0), DOWNLOAD_TOP_MAX) if value else None
+        except ValueError:
+            return None
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        limit = self.publications_limit()
+        if limit is not None:
+            # A sliced prefetch runs as one ROW_NUMBER() OVER (PARTITION BY category) query.
+            qs = qs.prefetch_related(None).prefetch_related(
+                django_models.Prefetch("publications", queryset=active_publications()[:limit], to_attr="top_publications")
+            )
+        return qs
+
+    @action(detail=True, methods=["get"])
+    def publications(self, request, pk=None):
+        def build():
+            if not models.DownloadCategory.objects.filter(pk=pk).exists():
+                raise Http404
+            page = self.paginate_queryset(active_publications().filter(category_id=pk))
+            serializer = s.PublicationSerializer(page, many=True, context=self.get_serializer_context())
+            with metrics.timer(request, "serialize"):
+                data = serializer.data
+            return self.get_paginated_response(data)
+        return self.cached_response(request, build)
 
 
-class ContactMessageViewSet(mixins.CreateModelMixin,
+class ContactMessageViewSet(MetricsMixin, mixins.CreateModelMixin,
                             mixins.ListModelMixin,
                             viewsets.GenericViewSet):
     queryset = models.ContactMessage.objects.all().order_by("-created_at")
     serializer_class = s.ContactMessageSerializer
+    query_budget = 2
+
+    def get_permissions(self):
+        if self.action == "list":
+            return [permissions.IsAdminUser()]
+        return super().get_permissions()
+
+
+def _submitted_data(request):
+    if request.content_type == "application/json":
+        return json.loads(request.body or b"{}")
+    return request.POST
+
+
+def _throttled(wait):
+    return JsonResponse(
+        {"detail": throttling.throttled_detail(wait)}, status=429, headers={"Retry-After": throttling.retry_after(wait)},
+    )
 
 
-class ContactInfoViewSet(viewsets.ModelViewSet):
+def spooled_create(kind, viewset_class):
+    """Async view for a public form endpoint: POST validates the submission, appends it to
+    the spool (apps/content/spool.py) and answers 202 without touching the database.
+
+    Other methods, and POST while ``INGEST_SPOOL`` is off, go to ``viewset_class`` as before.
+    """
+    _, serializer_class = spool.KINDS[kind]
+    fallback = viewset_class.as_view({"get": "list", "post": "create"})
+
+    async def view(request, *args, **kwargs):
+        if request.method != "POST" or not spool.spool_enabled():
+            return await sync_to_async(fallback)(request, *args, **kwargs)
+        # The same write and e-mail budgets the DRF throttles apply (apps/content/throttling.py).
+        exempt = not throttling.throttle_enabled() or (await request.auser()).is_staff
+        check = sync_to_async(throttling.check, thread_sensitive=False)
+        if not exempt:
+            wait = await check("write", throttling.client_ident(request))
+            if wait:
+                return _throttled(wait)
+        try:
+            data = _submitted_data(request)
+        except ValueError as exc:
+            return JsonResponse({"detail": f"JSON parse error - {exc}"}, status=400)
+        serializer = serializer_class(data=data)
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=400)
+        if not exempt:
+            wait = await check("email", throttling.normalized_email(serializer.validated_data.get("email")))
+            if wait:
+                return _throttled(wait)
+        submission_id = await sync_to_async(spool.append, thread_sensitive=False)(kind, serializer.validated_data)
+        if jobs.jobs_eager():
+            await sync_to_async(spool.flush)([kind])
+        return JsonResponse({"status": "accepted", "submission_id": submission_id}, status=202)
+
+    return csrf_exempt(view)
+
+
+class ContactInfoViewSet(MetricsMixin, ConditionalGetMixin, CachedResponseMixin, CompiledListMixin, viewsets.ModelViewSet):
     queryset = models.ContactInfo.objects.all().order_by("-created_at")
     serializer_class = s.ContactInfoSerializer
+    query_budget = 3
 
 
-class FooterAboutViewSet(viewsets.ModelViewSet):
+class FooterAboutViewSet(MetricsMixin, ConditionalGetMixin, CachedResponseMixin, CompiledListMixin, viewsets.ModelViewSet):
     queryset = models.FooterAbout.objects.all().order_by("-updated_at", "-created_at")
     serializer_class = s.FooterAboutSerializer
+    query_budget = 3
 
     def get_queryset(self):
         qs = super().get_queryset()
@@ -140,8 +355,9 @@ class FooterAboutViewSet(viewsets.ModelViewSet):
         return qs
 
 
-class HeroIntroViewSet(viewsets.ModelViewSet):
+class HeroIntroViewSet(MetricsMixin, ConditionalGetMixin, CachedResponseMixin, CompiledListMixin, viewsets.ModelViewSet):
     serializer_class = s.HeroIntroSerializer
+    query_budget = 3
 
     def get_queryset(self):
         qs = models.HeroIntro.objects.all().order_by("-updated_at")
@@ -151,8 +367,9 @@ class HeroIntroViewSet(viewsets.ModelViewSet):
         return qs
 
 
-class AboutSectionViewSet(viewsets.ModelViewSet):
+class AboutSectionViewSet(MetricsMixin, ConditionalGetMixin, CachedResponseMixin, CompiledListMixin, viewsets.ModelViewSet):
     serializer_class = s.AboutSectionSerializer
+    query_budget = 3
     filter_backends = [OrderingFilter]
     ordering_fields = ["position", "created_at"]
     ordering = ["position", "created_at"]
@@ -165,8 +382,9 @@ class AboutSectionViewSet(viewsets.ModelViewSet):
         return qs.order_by("position", "created_at")
 
 
-class SiteTextSnippetViewSet(viewsets.ModelViewSet):
+class SiteTextSnippetViewSet(MetricsMixin, ConditionalGetMixin, CachedResponseMixin, CompiledListMixin, viewsets.ModelViewSet):
     serializer_class = s.SiteTextSnippetSerializer
+    query_budget = 3
     search_fields = ("key", "title", "text")
 
     def get_queryset(self):
@@ -176,9 +394,18 @@ class SiteTextSnippetViewSet(viewsets.ModelViewSet):
             return qs.filter(is_active=True)
         return qs
 
-class LibraryPublicationEntryViewSet(viewsets.ModelViewSet):
-    queryset = models.LibraryPublicationEntry.objects.all()
+class LibraryPublicationEntryViewSet(MetricsMixin, ProjectionMixin, ConditionalGetMixin, CachedResponseMixin, viewsets.ModelViewSet):
+    queryset = models.LibraryPublicationEntry.objects.select_related("category").prefetch_related(
+        django_models.Prefetch(
+            "images",
+            queryset=models.LibraryPublicationImage.objects.order_by("created_at"),
+        )
+    )
     serializer_class = s.LibraryPublicationEntrySerializer
+    deferrable_fields = ("description", "description_si")
+    query_budget = 4
+    cache_dependencies = (models.LibraryPublicationEntry, models.LibraryPublicationCategory, models.LibraryPublicationImage)
+    conditional_relations = ("category", "images")
     filter_backends = [DjangoFilterBackend, OrderingFilter, SearchFilter]
     filterset_fields = ["category", "category__slug", "is_active", "is_featured", "year"]
     ordering_fields = ["published_at", "created_at", "year", "title"]
@@ -205,14 +432,134 @@ class LibraryPublicationEntryViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=["get"])
     def latest(self, request):
-        limit = int(request.query_params.get("limit", 6))
-        queryset = self.get_queryset().order_by("-published_at", "-created_at")[:limit]
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
-
-
-class LibraryPublicationCategoryViewSet(viewsets.ModelViewSet):
-    queryset = models.LibraryPublicationCategory.objects.all().order_by("position", "name")
+        def build():
+            limit = int(request.query_params.get("limit", 6))
+            queryset = self.get_queryset().order_by("-published_at", "-created_at")[:limit]
+            serializer = self.get_serializer(queryset, many=True)
+            return Response(serializer.data)
+        return self.cached_response(request, build)
+
+
+class LibraryPublicationCategoryViewSet(MetricsMixin, ConditionalGetMixin, CachedResponseMixin, viewsets.ModelViewSet):
+    queryset = models.LibraryPublicationCategory.objects.annotate(
+        active_publications_count=django_models.Count(
+            "publications", filter=django_models.Q(publications__is_active=True)
+        )
+    ).order_by("position", "name")
     serializer_class = s.LibraryPublicationCategorySerializer
+    query_budget = 3
+    cache_dependencies = (models.LibraryPublicationCategory, models.LibraryPublicationEntry)
+    conditional_relations = ("publications",)
     filter_backends = [SearchFilter]
     search_fields = ["name", "description"]
+
+
+class HomeBundleView(APIView):
+    """The sections the homepage renders in one response, built from the existing viewsets/serializers.
+
+    Footer and contact details come from ``/api/site-config/`` and aren't repeated here.
+
+    Each section is cached separately (and invalidated by its own models), and the
+    response ETag combines the per-section content hashes, so a fully cached bundle
+    answers a revalidation with 304 without touching the database.
+    """
+
+    page_size = settings.REST_FRAMEWORK["PAGE_SIZE"]
+
+    # section name -> (viewset providing queryset/serializer, queryset narrowing)
+    sections = {
+        "hero_intro": (HeroIntroViewSet, lambda qs: qs[:1]),
+        "text_snippets": (SiteTextSnippetViewSet, lambda qs: qs),
+        "slides": (HeroSlideViewSet, None),
+        "featured_news": (NewsViewSet, lambda qs: qs.filter(is_featured=True)[:5]),
+        "notices": (NoticeViewSet, None),
+        "videos": (VideoViewSet, None),
+        "stats": (StatViewSet, None),
+        "links": (ExternalLinkViewSet, None),
+        "albums": (AlbumViewSet, lambda qs: qs.filter(is_active=True)[:HomeBundleView.page_size]),
+    }
+
+    def build_section(self, request, name):
+        viewset_class, narrow = self.sections[name]
+        viewset = viewset_class(request=request, format_kwarg=None, action="list", args=(), kwargs={})
+
+        def build():
+            queryset = viewset.get_queryset()
+            queryset = narrow(queryset) if narrow else queryset[:self.page_size]
+            return viewset.get_serializer(queryset, many=True).data
+
+        return cached_section(
+            f"home:{name}", request, viewset.get_cache_dependencies(), build, timeout=viewset.get_cache_timeout,
+        )
+
+    def get(self, request, *args, **kwargs):
+        payload = {}
+        digests = []
+        for name in self.sections:
+            payload[name], digest = self.build_section(request, name)
+            digests.append(f"{name}:{digest}")
+
+        etag = quote_etag(hashlib.sha256("|".join(digests).encode("utf-8")).hexdigest()[:32])
+        conditional = get_conditional_response(request._request, etag=etag)
+        if conditional is not None:
+            conditional["ETag"] = etag
+            return conditional
+        return Response(payload, headers={"ETag": etag})
+
+
+class SiteConfigView(APIView):
+    """Hero intro, footer, contact info, text snippets, links, stats and about sections in one
+    versioned document (see apps/content/siteconfig.py).
+
+    Served from process memory; the ETag is the snapshot's content hash, so revalidation
+    answers 304 without touching the database either.
+    """
+
+    def get(self, request, *args, **kwargs):
+        snapshot = siteconfig.current()
+        conditional = get_conditional_response(request._request, etag=snapshot.etag)
+        if conditional is not None:
+            conditional["ETag"] = snapshot.etag
+            return conditional
+        return Response(snapshot.payload(), headers={"ETag": snapshot.etag})
+
+
+class ThrottleStatsView(APIView):
+    """Allowed and throttled request counts per budget (staff only; see apps/content/throttling.py)."""
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        store = "cache" if getattr(settings, "THROTTLE_CACHE_ALIAS", "") else "memory"
+        return Response({"store": store, "scopes": throttling.counters()})
+
+
+class MetricsView(APIView):
+    """Per-route latency, query, serialization, render and size histograms plus request and
+    throttle counters, in the Prometheus text format (see apps/content/metrics.py)."""
+
+    permission_classes = [metrics.HasMetricsAccess]
+    renderer_classes = [metrics.PrometheusRenderer]
+
+    def get(self, request, *args, **kwargs):
+        return Response(metrics.exposition(), content_type=metrics.CONTENT_TYPE)
+
+
+class SearchView(APIView):
+    """Ranked search across news, notices, publications, videos, events, albums and books.
+
+    ``?q=`` is matched against English and Sinhala text; ``?type=news,album`` narrows the
+    result kinds. Results are paginated like the list endpoints.
+    """
+
+    pagination_class = StandardPagination
+
+    def get(self, request, *args, **kwargs):
+        kinds = [kind.strip() for kind in request.query_params.get("type", "").split(",") if kind.strip()]
+        results = search.SearchResults(request.query_params.get("q", ""), kinds)
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(results, request, view=self)
+        serializer = s.SearchResultSerializer(page, many=True, context={"request": request})
+        with metrics.timer(request, "serialize"):
+            data = serializer.data
+        return paginator.get_paginated_response(data)
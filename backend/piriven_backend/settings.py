@@ -35,10 +35,14 @@ INSTALLED_APPS = [
 # ==== Middleware ====
 # NOTE: Place CorsMiddleware as high as possible and BEFORE CommonMiddleware.
 MIDDLEWARE = [
+    # Times every /api/ request end to end (Server-Timing, /api/_metrics), so it goes first.
+    "apps.content.middleware.MetricsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
+    # Serves PUBLIC_API_PREFIX itself; nothing below runs for those requests.
+    "apps.content.middleware.PublicAPIMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
@@ -47,6 +51,9 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = "piriven_backend.urls"
 
+# Read-only public API (apps/content/public_urls.py), served without sessions, CSRF or auth.
+PUBLIC_API_PREFIX = "/api/public/"
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -66,13 +73,93 @@ TEMPLATES = [
 WSGI_APPLICATION = "piriven_backend.wsgi.application"
 
 # ==== Database ====
+# DJANGO_DB_ENGINE: "sqlite" (default, a file next to manage.py) or "postgres" (install
+# requirements-postgres.txt for psycopg and its pool). SQLite serializes writes, so use
+# PostgreSQL in production.
+_DB_ENGINES = {
+    "sqlite": "django.db.backends.sqlite3",
+    "postgres": "django.db.backends.postgresql",
+}
+_db_engine = os.getenv("DJANGO_DB_ENGINE", "sqlite")
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+        "ENGINE": _DB_ENGINES[_db_engine],
+        "NAME": os.getenv("DJANGO_DB_NAME", str(BASE_DIR / "db.sqlite3") if _db_engine == "sqlite" else "piriven"),
+        # Keep connections open between requests (seconds; 0 closes after each request) and
+        # check that a reused one is still alive before handing it to a request.
+        "CONN_MAX_AGE": int(os.getenv("DJANGO_DB_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": os.getenv("DJANGO_DB_CONN_HEALTH_CHECKS", "True") == "True",
+    }
+}
+if _db_engine == "postgres":
+    DATABASES["default"].update({
+        "USER": os.getenv("DJANGO_DB_USER", "piriven"),
+        "PASSWORD": os.getenv("DJANGO_DB_PASSWORD", ""),
+        "HOST": os.getenv("DJANGO_DB_HOST", "127.0.0.1"),
+        "PORT": os.getenv("DJANGO_DB_PORT", "5432"),
+        "OPTIONS": {},
+    })
+    if os.getenv("DJANGO_DB_POOL", "False") == "True":
+        # psycopg's pool (one per worker process) replaces persistent connections: each
+        # request borrows a connection and returns it when the request finishes.
+        DATABASES["default"]["CONN_MAX_AGE"] = 0
+        DATABASES["default"]["OPTIONS"]["pool"] = {
+            "min_size": int(os.getenv("DJANGO_DB_POOL_MIN_SIZE", "2")),
+            "max_size": int(os.getenv("DJANGO_DB_POOL_MAX_SIZE", "10")),
+            "timeout": float(os.getenv("DJANGO_DB_POOL_TIMEOUT", "10")),
+        }
+
+# ==== Cache ====
+# DJANGO_CACHE_BACKEND: "locmem" (per-process), "file" or "redis". Defaults to "locmem"
+# with DEBUG on and "file" otherwise: with several workers, signal-driven invalidation
+# in one process must be seen by the others (manage.py check --deploy warns about locmem).
+_CACHE_BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+}
+_cache_backend = os.getenv("DJANGO_CACHE_BACKEND", "locmem" if DEBUG else "file")
+_cache_locations = {
+    "locmem": "piriven-content",
+    "file": str(BASE_DIR / "cache"),
+    "redis": "redis://127.0.0.1:6379/1",
+}
+CACHES = {
+    "default": {
+        "BACKEND": _CACHE_BACKENDS[_cache_backend],
+        "LOCATION": os.getenv("DJANGO_CACHE_LOCATION", _cache_locations[_cache_backend]),
     }
 }
 
+# Response cache for the public content API (see apps/content/cache.py).
+CONTENT_CACHE_ENABLED = os.getenv("CONTENT_CACHE_ENABLED", "True") == "True"
+CONTENT_CACHE_TIMEOUT = int(os.getenv("CONTENT_CACHE_TIMEOUT", "3600"))
+
+# Render flat list serializers from .values() rows through generated projection functions
+# instead of DRF's per-field serialization (apps/content/compiled.py). Same output either way.
+COMPILED_SERIALIZERS = os.getenv("COMPILED_SERIALIZERS", "True") == "True"
+
+# Site-config snapshot (apps/content/siteconfig.py): how often, in seconds, each worker checks
+# the stored version. Admin edits reach other workers within this delay.
+SITE_CONFIG_CHECK_INTERVAL = float(os.getenv("SITE_CONFIG_CHECK_INTERVAL", "5"))
+
+# Background jobs (apps/content/jobs.py). Eager mode runs them inside the request instead of
+# in ``manage.py run_workers``.
+JOBS_EAGER = os.getenv("JOBS_EAGER", "False") == "True"
+JOB_LOCK_TIMEOUT = int(os.getenv("JOB_LOCK_TIMEOUT", "900"))
+
+# Contact messages and newsletter sign-ups are written to a local spool and committed in
+# batches by run_workers (apps/content/spool.py). INGEST_SPOOL=False writes them in the request.
+INGEST_SPOOL = os.getenv("INGEST_SPOOL", "True") == "True"
+SPOOL_DIR = Path(os.getenv("SPOOL_DIR", str(BASE_DIR / "spool")))
+SPOOL_BATCH_SIZE = int(os.getenv("SPOOL_BATCH_SIZE", "500"))
+SPOOL_CLAIM_TIMEOUT = int(os.getenv("SPOOL_CLAIM_TIMEOUT", "300"))
+
+# Uploaded PDFs (apps/content/documents.py): first-page preview width in pixels, and whether to
+# rewrite them linearized ("fast web view"; needs pikepdf or the qpdf command).
+PDF_PREVIEW_WIDTH = int(os.getenv("PDF_PREVIEW_WIDTH", "1200"))
+PDF_LINEARIZE = os.getenv("PDF_LINEARIZE", "False") == "True"
+
 # ==== Password validation ====
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
@@ -95,6 +182,13 @@ STATICFILES_DIRS = [BASE_DIR / "assets"]
 
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
+# Uploaded media is served by apps/content/media.py (byte ranges, validators). Behind nginx set
+# MEDIA_ACCEL_REDIRECT to an ``internal`` location aliasing MEDIA_ROOT; behind Apache/lighttpd
+# set MEDIA_X_SENDFILE=True. MEDIA_SERVE=False leaves /media/ entirely to the web server.
+MEDIA_SERVE = os.getenv("MEDIA_SERVE", "True") == "True"
+MEDIA_ACCEL_REDIRECT = os.getenv("MEDIA_ACCEL_REDIRECT", "")
+MEDIA_X_SENDFILE = os.getenv("MEDIA_X_SENDFILE", "False") == "True"
+MEDIA_CACHE_MAX_AGE = int(os.getenv("MEDIA_CACHE_MAX_AGE", "3600"))
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -103,7 +197,42 @@ REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
     "PAGE_SIZE_QUERY_PARAM": "page_size",
+    # orjson when installed, byte-identical to DRF's JSONRenderer (apps/content/renderers.py).
+    "DEFAULT_RENDERER_CLASSES": [
+        "apps.content.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    # Token buckets per client IP (reads, writes) and per submitted e-mail (apps/content/throttling.py).
+    "DEFAULT_THROTTLE_CLASSES": [
+        "apps.content.throttling.ReadThrottle",
+        "apps.content.throttling.WriteThrottle",
+        "apps.content.throttling.EmailThrottle",
+    ],
+    # Reverse proxies in front of Django; 0 uses REMOTE_ADDR and ignores X-Forwarded-For.
+    # Behind nginx every client would otherwise share the proxy's budget (check --deploy warns).
+    "NUM_PROXIES": int(os.getenv("THROTTLE_NUM_PROXIES", "0")),
+}
+
+# "N/period" (s, min, hour, day) per budget; an empty value disables that budget. Reads are
+# unlimited by default: server-side rendered pages all arrive from the frontend server's IP.
+THROTTLE_ENABLED = os.getenv("THROTTLE_ENABLED", "True") == "True"
+THROTTLE_RATES = {
+    "read": os.getenv("THROTTLE_READ_RATE", ""),
+    "write": os.getenv("THROTTLE_WRITE_RATE", "10/min"),
+    "email": os.getenv("THROTTLE_EMAIL_RATE", "5/hour"),
 }
+# Client IPs never charged to the per-IP budgets, e.g. the Next.js server (comma-separated).
+THROTTLE_EXEMPT_IPS = [ip.strip() for ip in os.getenv("THROTTLE_EXEMPT_IPS", "").split(",") if ip.strip()]
+# Cache alias holding buckets and counters shared by all workers; empty keeps them per process.
+THROTTLE_CACHE_ALIAS = os.getenv("THROTTLE_CACHE_ALIAS", "")
+
+# Request metrics (apps/content/metrics.py): Server-Timing headers and per-route histograms
+# over the last METRICS_WINDOW seconds, served at /api/_metrics (Prometheus text format) to
+# staff or to "Authorization: Bearer <METRICS_TOKEN>".
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "True") == "True"
+METRICS_SERVER_TIMING = os.getenv("METRICS_SERVER_TIMING", "True") == "True"
+METRICS_WINDOW = int(os.getenv("METRICS_WINDOW", "300"))
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
 
 # ==== CORS (for Next.js dev on 8080) ====
 CORS_ALLOWED_ORIGINS = [
@@ -1,14 +1,20 @@
+import re
+
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
-from django.conf.urls.static import static
+
+from apps.content.media import serve_media
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    # Read-only, anonymous copy of the content API served with a stripped middleware stack
+    # (apps/content/middleware.py); /api/ keeps the full stack for writes and staff.
+    path(settings.PUBLIC_API_PREFIX.lstrip("/"), include("apps.content.public_urls")),
     path("api/", include("apps.content.urls")),
 ]
 
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
-
-
+if settings.MEDIA_SERVE and settings.MEDIA_URL.startswith("/"):
+    urlpatterns += [
+        re_path(rf"^{re.escape(settings.MEDIA_URL.lstrip('/'))}(?P<path>.+)$", serve_media),
+    ]
@@ -9,23 +9,33 @@ import { Header } from "@/components/Header";
 import { Footer } from "@/components/Footer";
 import { MainNavigation } from "@/components/MainNavigation";
 import { MobileMenu } from "@/components/MobileMenu";
-import { fetchDownloadCategories, mediaUrl } from "@/lib/api";
+import { fetchDownloadCategories, fetchDownloadCategoryPublications, mediaUrl } from "@/lib/api";
 import { useLanguage } from "@/context/LanguageContext";
 import { preferLanguage } from "@/lib/i18n";
 
+const PAGE_SIZE = 12;
+
+const formatFileSize = (bytes) => {
+  if (bytes >= 1024 * 1024) return `${(bytes / (1024 * 1024)).toFixed(1)} MB`;
+  return `${Math.max(1, Math.round(bytes / 1024))} KB`;
+};
+
 const DownloadsPage = () => {
   const { lang } = useLanguage();
   const [mobileMenuOpen, setMobileMenuOpen] = useState(false);
   const [categories, setCategories] = useState([]);
   const [selectedCategoryId, setSelectedCategoryId] = useState(null);
   const [sectionsVisible, setSectionsVisible] = useState({});
+  // category id -> { items, page } for publications loaded past the first PAGE_SIZE
+  const [morePublications, setMorePublications] = useState({});
+  const [loadingMore, setLoadingMore] = useState(false);
 
   useEffect(() => {
     let mounted = true;
 
     (async () => {
       try {
-        const data = await fetchDownloadCategories();
+        const data = await fetchDownloadCategories(PAGE_SIZE);
         const list = Array.isArray(data) ? data : data?.results || [];
         if (!mounted) return;
         setCategories(list);
@@ -77,6 +87,35 @@ const DownloadsPage = () => {
     );
   }, [categories, selectedCategoryId]);
 
+  const publications = useMemo(() => {
+    if (!selectedCategory) return [];
+    const extra = morePublications[selectedCategoryId]?.items || [];
+    return [...(selectedCategory.publications || []), ...extra];
+  }, [selectedCategory, selectedCategoryId, morePublications]);
+
+  const totalPublications = selectedCategory?.publications_count ?? publications.length;
+
+  const loadMorePublications = async () => {
+    if (!selectedCategory?.id || loadingMore) return;
+    const nextPage = (morePublications[selectedCategoryId]?.page || 1) + 1;
+    setLoadingMore(true);
+    try {
+      const data = await fetchDownloadCategoryPublications(selectedCategory.id, nextPage, PAGE_SIZE);
+      const items = Array.isArray(data?.results) ? data.results : [];
+      setMorePublications((prev) => ({
+        ...prev,
+        [selectedCategoryId]: {
+          items: [...(prev[selectedCategoryId]?.items || []), ...items],
+          page: nextPage,
+        },
+      }));
+    } catch (err) {
+      console.warn("Failed to load more publications", err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   return (
     <div className="min-h-screen bg-white flex flex-col animate-fade-in">
       <Header mobileMenuOpen={mobileMenuOpen} setMobileMenuOpen={setMobileMenuOpen} />
@@ -126,7 +165,7 @@ const DownloadsPage = () => {
             <div className="mt-6 flex flex-wrap items-center justify-center md:justify-start space-x-4 text-sm text-gray-500 animate-slide-up animation-delay-200">
               <div className="flex items-center">
                 <FileText className="w-4 h-4 mr-1 text-red-800" />
-                {(selectedCategory?.publications?.length || 0)} Documents
+                {totalPublications} Documents
               </div>
               <span>•</span>
               <div className="flex items-center">
@@ -135,15 +174,21 @@ const DownloadsPage = () => {
             </div>
           </div>
 
-          {(selectedCategory?.publications?.length || 0) > 0 ? (
+          {publications.length > 0 ? (
+            <>
             <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-8">
-              {selectedCategory.publications.map((pdf, index) => {
+              {publications.map((pdf, index) => {
                 const title = preferLanguage(pdf.title, pdf.title_si, lang) || pdf.title || "Untitled";
                 const department = preferLanguage(pdf.department, pdf.department_si, lang) || pdf.department || "";
                 const description = preferLanguage(pdf.description, pdf.description_si, lang) || pdf.description || "";
                 const publishedDate = pdf.published_at ? dayjs(pdf.published_at).format("MMMM YYYY") : "";
                 const downloadHref = pdf.external_url || (pdf.file ? mediaUrl(pdf.file) : "");
                 const canDownload = Boolean(downloadHref);
+                const fileInfo = pdf.file_info || {};
+                const fileDetails = [
+                  fileInfo.pages ? `${fileInfo.pages} pages` : "",
+                  fileInfo.size ? formatFileSize(fileInfo.size) : "",
+                ].filter(Boolean).join(" · ");
 
                 return (
                   <div
@@ -152,9 +197,18 @@ const DownloadsPage = () => {
                     style={{ animationDelay: `${index * 100}ms`, animationFillMode: "both" }}
                   >
                     <div className="relative h-48 bg-gray-100 flex items-center justify-center overflow-hidden">
-                      <FileText className="w-24 h-24 text-red-800 transition-transform duration-500 group-hover:scale-110" />
+                      {pdf.cover ? (
+                        <img
+                          src={mediaUrl(pdf.cover)}
+                          alt={title}
+                          loading="lazy"
+                          className="w-full h-full object-cover object-top transition-transform duration-500 group-hover:scale-105"
+                        />
+                      ) : (
+                        <FileText className="w-24 h-24 text-red-800 transition-transform duration-500 group-hover:scale-110" />
+                      )}
                       <div className="absolute top-4 right-4 bg-gray-800 text-white px-3 py-1 rounded-full text-xs font-bold shadow-lg">
-                        PDF
+                        {fileDetails ? `PDF · ${fileDetails}` : "PDF"}
                       </div>
                     </div>
 
@@ -197,6 +251,19 @@ const DownloadsPage = () => {
                 );
               })}
             </div>
+            {publications.length < totalPublications ? (
+              <div className="flex justify-center mt-10">
+                <button
+                  type="button"
+                  onClick={loadMorePublications}
+                  disabled={loadingMore}
+                  className="px-6 py-3 rounded-xl border border-red-800 text-red-800 font-semibold hover:bg-red-800 hover:text-white transition-colors duration-300 disabled:opacity-50"
+                >
+                  {loadingMore ? "Loading..." : `Show more (${totalPublications - publications.length})`}
+                </button>
+              </div>
+            ) : null}
+            </>
           ) : (
             <div className="text-center py-20">
               <div className="bg-gray-100 w-32 h-32 rounded-full flex items-center justify-center mx-auto mb-8 shadow-inner">
@@ -78,7 +78,8 @@ export default function NoticesPage() {
 
   const notices = useMemo(() => items.map((item) => {
     const title = preferLanguage(item?.title, item?.title_si, lang) || item?.title || '';
-    const content = preferLanguage(item?.content, item?.content_si, lang) || '';
+    // The list endpoint returns a short `excerpt`; the full body comes from the detail endpoint.
+    const content = preferLanguage(item?.excerpt ?? item?.content, item?.excerpt_si ?? item?.content_si, lang) || '';
     const id = item?.id ?? '';
     const href = id ? `/notices/${id}` : '#';
     return {
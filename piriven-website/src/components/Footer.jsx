@@ -6,7 +6,7 @@ import T from '@/components/T';
 import { MapPin, Mail, Phone } from 'lucide-react';
 import { useLanguage } from '@/context/LanguageContext';
 import { preferLanguage } from '@/lib/i18n';
-import { fetchContactInfo, fetchFooterAbout, fetchFooterLinks } from '@/lib/api';
+import { fetchSiteConfig } from '@/lib/api';
 
 const FALLBACK_ABOUT = {
   en: 'The State Ministry is dedicated to the development and administration of Dhamma Schools, Piriven, and Bhikku Education in Sri Lanka.',
@@ -46,29 +46,13 @@ export const Footer = () => {
     let cancelled = false;
 
     const load = async () => {
-      const results = await Promise.allSettled([
-        fetchFooterAbout(),
-        fetchFooterLinks(),
-        fetchContactInfo(),
-      ]);
+      const config = await fetchSiteConfig().catch(() => null);
 
       if (cancelled) return;
 
-      const [aboutResult, linksResult, contactResult] = results;
-
-      const aboutList = aboutResult.status === 'fulfilled'
-        ? (Array.isArray(aboutResult.value) ? aboutResult.value : (aboutResult.value?.results || []))
-        : [];
-      setAboutEntries(aboutList);
-
-      const linksList = linksResult.status === 'fulfilled'
-        ? (Array.isArray(linksResult.value) ? linksResult.value : (linksResult.value?.results || []))
-        : [];
-      setFooterLinks(linksList);
-
-      const contactList = contactResult.status === 'fulfilled'
-        ? (Array.isArray(contactResult.value) ? contactResult.value : (contactResult.value?.results || []))
-        : [];
+      setAboutEntries(Array.isArray(config?.footer_about) ? config.footer_about : []);
+      setFooterLinks(Array.isArray(config?.footer_links) ? config.footer_links : []);
+      const contactList = Array.isArray(config?.contact_info) ? config.contact_info : [];
       setContactInfo(contactList.length ? contactList[0] : null);
     };
 
@@ -11,9 +11,10 @@ export const GallerySlider = ({ galleryImages, gallerySlide, setGallerySlide })
           className={`absolute inset-0 transition-all duration-1000 ${
             index === gallerySlide ? 'opacity-100 scale-100' : 'opacity-0 scale-110'
           }`}
+          style={{ backgroundColor: image.color }}
         >
           <img 
-            src={image} 
+            src={image.src} 
             alt={`Gallery ${index + 1}`}
             className="w-full h-full object-cover"
           />
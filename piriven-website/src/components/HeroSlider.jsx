@@ -68,7 +68,7 @@ export const HeroSlider = ({ mainSlides, currentSlide, setCurrentSlide }) => {
             }}
           >
             {/* Background with Subtle Parallax */}
-            <div className="absolute inset-0 overflow-hidden">
+            <div className="absolute inset-0 overflow-hidden" style={{ backgroundColor: slide.color }}>
               <div
                 className="absolute inset-0 w-[110%] h-[110%] -left-[5%] -top-[5%]"
                 style={{
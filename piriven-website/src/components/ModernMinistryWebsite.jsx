@@ -20,7 +20,7 @@ import { VideosSection } from './Videos';
 import { NewsletterSection } from './NewsLetter';
 import { Footer } from './Footer';
 import T from '@/components/T';
-import { fetchSlides, fetchNews, fetchFeaturedNews, fetchNotices, fetchVideos, fetchStats, fetchLinks, fetchAlbums, fetchHeroIntro, fetchSiteTextSnippets, mediaUrl } from '@/lib/api';
+import { fetchHomeBundle, fetchSlides, fetchNews, fetchFeaturedNews, fetchNotices, fetchVideos, fetchStats, fetchLinks, fetchAlbums, fetchHeroIntro, fetchSiteTextSnippets, mediaUrl } from '@/lib/api';
 import { useLanguage } from '@/context/LanguageContext';
 import { preferLanguage } from '@/lib/i18n';
 
@@ -102,6 +102,7 @@ const ModernMinistryWebsite = () => {
       .sort((a, b) => (a.position ?? 0) - (b.position ?? 0))
       .map((slide) => ({
         image: mediaUrl(slide.image),
+        color: slide.image_placeholder?.color,
         title: preferLanguage(slide.title, slide.title_si, lang),
         subtitle: preferLanguage(slide.subtitle, slide.subtitle_si, lang),
       }));
@@ -218,7 +219,10 @@ const ModernMinistryWebsite = () => {
     if (!Array.isArray(rawAlbums) || !rawAlbums.length) return [];
     const albumWithImages = rawAlbums.find((album) => Array.isArray(album.images) && album.images.length);
     if (!albumWithImages) return [];
-    return albumWithImages.images.map((img) => mediaUrl(img.image));
+    return albumWithImages.images.map((img) => ({
+      src: mediaUrl(img.image),
+      color: img.image_placeholder?.color,
+    }));
   }, [rawAlbums]);
 
   useEffect(() => {
@@ -227,6 +231,28 @@ const ModernMinistryWebsite = () => {
     const loadData = async () => {
       setIsLoading(true);
       try {
+        // One round-trip for every homepage section; fall back to per-section requests.
+        const bundle = await fetchHomeBundle().catch(() => null);
+        if (cancelled) return;
+        if (bundle) {
+          const snippets = Array.isArray(bundle.text_snippets) ? bundle.text_snippets : [];
+          setData({
+            heroIntro: bundle.hero_intro?.[0] ?? null,
+            textSnippets: snippets.reduce((acc, item) => {
+              if (item?.key) acc[item.key] = item;
+              return acc;
+            }, {}),
+            slides: bundle.slides ?? [],
+            news: bundle.featured_news ?? [],
+            notices: bundle.notices ?? [],
+            videos: bundle.videos ?? [],
+            stats: bundle.stats ?? [],
+            links: bundle.links ?? [],
+            albums: bundle.albums ?? [],
+          });
+          return;
+        }
+
         const results = await Promise.allSettled([
           fetchHeroIntro(),
           fetchSiteTextSnippets(),
@@ -1,8 +1,11 @@
 ﻿export const API_BASE =
   (process.env.NEXT_PUBLIC_API || "http://127.0.0.1:8000/api").replace(/\/$/, "");
 
+/** Read-only public API (same paths as API_BASE, GET only, no sessions/CSRF). Writes use API_BASE. */
+export const PUBLIC_API_BASE = `${API_BASE}/public`;
+
 export async function apiFetch(path: string, init?: RequestInit) {
-  const url = `${API_BASE}${path}`;
+  const url = `${PUBLIC_API_BASE}${path}`;
   const res = await fetch(url, { cache: "no-store", ...init });
   if (!res.ok) {
     throw new Error(`API request failed: ${res.status} ${res.statusText}`);
@@ -36,7 +39,7 @@ function listify<T>(data: unknown): T[] {
 }
 
 async function getList<T = unknown>(path: string, params?: QueryParams) {
-  const url = new URL(`${API_BASE}${path}`);
+  const url = new URL(`${PUBLIC_API_BASE}${path}`);
   if (params) for (const [k, v] of Object.entries(params)) {
     if (v !== undefined && v !== null) url.searchParams.set(k, String(v));
   }
@@ -53,12 +56,28 @@ export function fetchBookCategories(params?: QueryParams) {
   return getList("/book-categories/", params);
 }
 
+/** Every homepage section (slides, featured news, notices, stats, albums, ...) in one request. */
+export async function fetchHomeBundle() {
+  return apiFetch("/bundle/home/");
+}
+
+/** Hero intro, footer, contact info, text snippets, links, stats and about sections (versioned). */
+export async function fetchSiteConfig() {
+  return apiFetch("/site-config/");
+}
+
 export async function fetchSlides() {
   return apiFetch("/slides/");
 }
 
-export async function fetchDownloadCategories() {
-  return apiFetch("/download-categories/");
+/** Categories with their newest `top` publications and a `publications_count` total each. */
+export async function fetchDownloadCategories(top = 12) {
+  return apiFetch(`/download-categories/?top=${top}`);
+}
+
+/** One page of a download category's publications (newest first). */
+export async function fetchDownloadCategoryPublications(id: number | string, page = 1, pageSize = 12) {
+  return apiFetch(`/download-categories/${id}/publications/?page=${page}&page_size=${pageSize}`);
 }
 
 export async function fetchNews(params?: string) {
@@ -125,7 +144,7 @@ export function fetchFooterLinks(params?: QueryParams) {
 }
 
 export async function fetchPublications(params?: Record<string, string>) {
-  const url = new URL(`${API_BASE}/publications/`);
+  const url = new URL(`${PUBLIC_API_BASE}/publications/`);
   if (params) Object.entries(params).forEach(([k, v]) => url.searchParams.set(k, String(v)));
   const res = await fetch(url.toString(), { cache: "no-store" });
   if (!res.ok) throw new Error("Failed to fetch publications");
@@ -133,7 +152,7 @@ export async function fetchPublications(params?: Record<string, string>) {
 }
 
 export async function fetchPublicationCategories() {
-  const res = await fetch(`${API_BASE}/publication-categories/`, { cache: "no-store" });
+  const res = await fetch(`${PUBLIC_API_BASE}/publication-categories/`, { cache: "no-store" });
   if (!res.ok) throw new Error("Failed to fetch publication categories");
   return res.json();
 }